@@ -0,0 +1,94 @@
+"""
+Bounded memoization for password analysis results
+Entries are keyed by an HMAC of the password under a per-process random key, so no plaintext is ever stored
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# Generated at import; never leaves the process, so keys cannot be precomputed or compared across runs
+PROCESS_KEY = secrets.token_bytes(32)
+
+
+def keyed_digest(password: str, key: bytes = PROCESS_KEY) -> bytes:
+    """HMAC-SHA256 of a password under the process key"""
+    return hmac.digest(key, password.encode('utf-8', 'surrogatepass'), hashlib.sha256)
+
+
+class AnalysisCache:
+    """Thread-safe LRU cache with an optional time-to-live"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes):
+        """Return the value cached under a keyed_digest, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value):
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, password: str, compute: Callable):
+        """Return the cached value for password, computing and storing it on a miss"""
+        key = keyed_digest(password)
+        value = self.get(key)
+        if value is None:
+            value = compute(password)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters for monitoring; hit_rate is over all lookups so far"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -1,11 +1,80 @@
+import time
+_SCRIPT_STARTED = time.perf_counter()
+
+import logging
+import os
 import streamlit as st
-import pandas as pd
-import io
 from datetime import datetime
-from password_analyzer import PasswordAnalyzer
+from audit_stats import AuditAggregator
+from incremental_analyzer import IncrementalAnalyzer
+from instrumentation import Instrumentation
+from password_analyzer import DEFAULT_ANALYSIS_LENGTH, PasswordAnalyzer, mask_password, strength_label
 from security_tips import SecurityTips
 
+logger = logging.getLogger(__name__)
+
+# Streamlit re-executes this script on every rerun; measured before main() runs
+SCRIPT_IMPORT_SECONDS = time.perf_counter() - _SCRIPT_STARTED
+
+ANALYSIS_CACHE_SIZE = 4096
+ANALYSIS_CACHE_TTL = 15 * 60  # seconds
+
+@st.cache_resource
+def get_startup_metrics():
+    """Process-wide timing record; the first entry is the cold start"""
+    return {
+        'cold_start_import': SCRIPT_IMPORT_SECONDS,
+        'analyzer_build': None,
+        'last_rerun': None,
+        'reruns': 0
+    }
+
+@st.cache_resource
+def get_analyzer():
+    """Build the analyzer once per server process and share it across sessions and reruns"""
+    started = time.perf_counter()
+    analyzer = PasswordAnalyzer(
+        breach_index_path=os.environ.get('PASSWORD_BREACH_INDEX'),
+        prefilter_path=os.environ.get('PASSWORD_PREFILTER'),
+        wordlist_path=os.environ.get('PASSWORD_WORDLIST'),
+        # Reruns and repeated batch entries re-analyze the same passwords
+        cache_size=ANALYSIS_CACHE_SIZE,
+        cache_ttl=ANALYSIS_CACHE_TTL,
+        # Per-stage timings for the sidebar readout
+        instrumentation=Instrumentation(),
+        # Pasted walls of text are scored on their prefix, so one input cannot stall the server
+        analysis_length=DEFAULT_ANALYSIS_LENGTH
+    )
+    elapsed = time.perf_counter() - started
+    get_startup_metrics()['analyzer_build'] = elapsed
+    logger.info("Password analyzer built in %.1f ms", elapsed * 1000)
+    return analyzer
+
+@st.cache_resource
+def get_security_tips():
+    return SecurityTips()
+
+def show_performance_metrics(metrics, rerun_seconds, analyzer):
+    """Sidebar readout of cold-start and per-rerun latency"""
+    with st.sidebar.expander("⏱️ Performance"):
+        st.caption(f"Cold start import: {metrics['cold_start_import'] * 1000:.1f} ms")
+        if metrics['analyzer_build'] is not None:
+            st.caption(f"Analyzer build: {metrics['analyzer_build'] * 1000:.1f} ms")
+        st.caption(f"This rerun: {rerun_seconds * 1000:.1f} ms (script import {SCRIPT_IMPORT_SECONDS * 1000:.1f} ms)")
+        st.caption(f"Reruns served by this process: {metrics['reruns']}")
+        if analyzer.cache is not None:
+            cache = analyzer.cache.stats()
+            st.caption(f"Analysis cache: {cache['size']}/{cache['maxsize']} entries, "
+                       f"{cache['hit_rate']:.0%} hit rate ({cache['hits']} hits, {cache['misses']} misses, "
+                       f"{cache['evictions']} evictions)")
+        if analyzer.instrumentation is not None:
+            stages = analyzer.instrumentation.snapshot()['stages']
+            timings = [f"{stage} {entry['mean_seconds'] * 1e6:.1f} µs" for stage, entry in stages.items()]
+            if timings:
+                st.caption("Mean stage time: " + ", ".join(timings))
+
 def main():
+    rerun_started = time.perf_counter()
     st.set_page_config(
         page_title="Password Security Analyzer",
         page_icon="🔐",
@@ -15,25 +84,36 @@ def main():
     st.title("🔐 Password Security Analyzer")
     st.markdown("**Cybersecurity tool for analyzing password strength and security practices**")
     
-    # Initialize analyzer
-    analyzer = PasswordAnalyzer()
-    security_tips = SecurityTips()
+    # Shared, process-wide resources (built on the first rerun only)
+    analyzer = get_analyzer()
+    security_tips = get_security_tips()
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
     page = st.sidebar.selectbox(
         "Choose a section:",
-        ["Password Analyzer", "Security Education", "Batch Analysis", "Security Report"]
+        ["Password Analyzer", "Password Generator", "Security Education", "Batch Analysis", "Security Report"]
     )
     
+    if page != "Password Analyzer":
+        # The incremental state holds the typed password; keep it only while its page is open
+        st.session_state.pop('incremental_analyzer', None)
+    
     if page == "Password Analyzer":
         password_analyzer_page(analyzer)
+    elif page == "Password Generator":
+        password_generator_page(analyzer)
     elif page == "Security Education":
         security_education_page(security_tips)
     elif page == "Batch Analysis":
         batch_analysis_page(analyzer)
     elif page == "Security Report":
         security_report_page(analyzer)
+    
+    metrics = get_startup_metrics()
+    metrics['reruns'] += 1
+    metrics['last_rerun'] = time.perf_counter() - rerun_started
+    show_performance_metrics(metrics, metrics['last_rerun'], analyzer)
 
 def password_analyzer_page(analyzer):
     st.header("Real-time Password Analysis")
@@ -58,9 +138,16 @@ def password_analyzer_page(analyzer):
         st.subheader("Security Notice")
         st.info("🔒 All analysis is performed locally. Your password never leaves your device.")
     
-    if password:
-        # Analyze password
-        analysis = analyzer.analyze_password(password)
+    if not password:
+        st.session_state.pop('incremental_analyzer', None)
+    else:
+        # Edits usually touch the end of the text, so re-score only what changed since the last rerun;
+        # frames stop at the analyzer's analysis_length, so a long paste cannot grow the session state
+        incremental = st.session_state.get('incremental_analyzer')
+        if incremental is None or incremental.analyzer is not analyzer:
+            incremental = st.session_state['incremental_analyzer'] = IncrementalAnalyzer(analyzer)
+        incremental.set(password)
+        analysis = incremental.result().to_dict()
         
         # Display strength score
         st.subheader("Password Strength Score")
@@ -94,6 +181,8 @@ def password_analyzer_page(analyzer):
             # Basic metrics
             st.write(f"**Length:** {analysis['length']} characters")
             st.write(f"**Entropy:** {analysis['entropy']:.2f} bits")
+            estimate = analyzer.estimate_guesses(password)
+            st.write(f"**Estimated Guesses:** 10^{estimate.guesses_log10:.1f} ({estimate.bits:.1f} bits)")
             st.write(f"**Character Variety:** {analysis['character_variety']}/4 types")
             
             # Character types
@@ -114,6 +203,9 @@ def password_analyzer_page(analyzer):
             # Common password check
             if analysis['is_common']:
                 st.error("🚨 This password appears in common password lists!")
+                base_match = analyzer.find_common_base(password)
+                if base_match is not None:
+                    st.caption(f"Matches common password {base_match.describe()}")
             else:
                 st.success("✅ Not found in common password databases")
         
@@ -132,6 +224,75 @@ def password_analyzer_page(analyzer):
                 for pattern in analysis['patterns']:
                     st.write(f"• {pattern}")
 
+# Generated outputs listed on screen; the rest are in the download
+GENERATOR_DISPLAY_ROWS = 20
+GENERATOR_MAX_COUNT = 100000
+# Shortest offered length: below 12 characters random passwords rarely reach the verification score
+GENERATOR_MIN_LENGTH = 12
+
+def password_generator_page(analyzer):
+    from password_generator import (ALL_CLASSES, SPECIAL_CHARS, PassphraseGenerator, PasswordGenerator,
+                                    analyze_fresh, generate, generate_verified)
+    
+    st.header("Password & Passphrase Generator")
+    st.write("Generate random passwords or passphrases with a cryptographically secure random source.")
+    
+    kind = st.radio("Generate:", ["Passphrase", "Random password"], horizontal=True)
+    col1, col2 = st.columns(2)
+    try:
+        if kind == "Passphrase":
+            with col1:
+                word_count = st.slider("Words", min_value=3, max_value=12, value=6)
+                separator = st.text_input("Separator", value="-", max_chars=3)
+            with col2:
+                capitalize = st.checkbox("Capitalize words")
+                digit = st.checkbox("Add a digit")
+            generator = PassphraseGenerator(word_count=word_count, separator=separator, capitalize=capitalize,
+                                            digit=digit)
+        else:
+            with col1:
+                length = st.slider("Length", min_value=GENERATOR_MIN_LENGTH, max_value=64, value=16)
+            with col2:
+                symbols = st.checkbox("Include symbols", value=True)
+                exclude_ambiguous = st.checkbox("Avoid look-alike characters (I, l, 1, O, 0, o)")
+            generator = PasswordGenerator(length=length, exclude_ambiguous=exclude_ambiguous,
+                                          classes=ALL_CLASSES if symbols else ALL_CLASSES & ~SPECIAL_CHARS)
+    except ValueError as error:
+        st.error(str(error))
+        return
+    st.caption(f"Each output carries {generator.entropy:.1f} bits of entropy")
+    
+    count = st.number_input("How many:", min_value=1, max_value=GENERATOR_MAX_COUNT, value=5)
+    verify = st.checkbox("Verify each output with the analyzer and redraw weak ones", value=True)
+    
+    if st.button("Generate"):
+        try:
+            if verify:
+                outputs = list(generate_verified(generator, int(count), analyzer))
+            else:
+                outputs = list(generate(generator, int(count)))
+        except ValueError as error:
+            st.error(str(error))
+            outputs = None
+        st.session_state['generated'] = outputs
+    
+    # Kept in session state so the download click does not regenerate
+    outputs = st.session_state.get('generated')
+    if outputs:
+        st.subheader("Generated")
+        shown = outputs[:GENERATOR_DISPLAY_ROWS]
+        for output, analysis in zip(shown, analyze_fresh(analyzer, shown)):
+            st.code(output, language=None)
+            st.caption(f"{strength_label(analysis.score)} ({analysis.score}/100)")
+        if len(outputs) > GENERATOR_DISPLAY_ROWS:
+            st.caption(f"Showing {GENERATOR_DISPLAY_ROWS} of {len(outputs):,}; download the full list below")
+        st.download_button(
+            label="Download as text",
+            data='\n'.join(outputs) + '\n',
+            file_name=f"generated_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            mime="text/plain"
+        )
+
 def security_education_page(security_tips):
     st.header("Password Security Education")
     
@@ -165,7 +326,140 @@ def security_education_page(security_tips):
                 st.write(f"• {item}")
             st.write("")
 
+# Below this many passwords a process pool costs more than it saves
+BATCH_PARALLEL_THRESHOLD = 5000
+# Progress is reported every this many lines of an upload, and the first this many decide whether to use a pool
+UPLOAD_CHUNK_SIZE = 10000
+# Rows of an upload kept for on-screen display; the full output goes to a temporary file
+UPLOAD_PREVIEW_ROWS = 1000
+# Minimum seconds between progress bar updates (each one is a websocket message)
+PROGRESS_INTERVAL = 0.25
+
+class ThrottledProgress:
+    """st.progress wrapper that sends at most one update per interval"""
+    
+    def __init__(self, interval=PROGRESS_INTERVAL):
+        self.bar = st.progress(0)
+        self.interval = interval
+        self._last_update = 0.0
+    
+    def update(self, fraction, force=False):
+        now = time.monotonic()
+        if force or now - self._last_update >= self.interval:
+            self.bar.progress(min(1.0, fraction))
+            self._last_update = now
+
+def batch_table_row(password, analysis):
+    """One row of the on-screen batch results table"""
+    return {
+        'Password': mask_password(password),
+        'Score': analysis.score,
+        'Strength': strength_label(analysis.score),
+        'Length': analysis.length,
+        'Entropy': round(analysis.entropy, 2),
+        'Character Types': analysis.character_variety,
+        'Common Password': 'Yes' if analysis.is_common else 'No',
+        'Issues Count': analysis.issues_count
+    }
+
+def show_batch_summary(audit):
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Passwords", audit.total)
+    with col2:
+        st.metric("Strong Passwords", audit.strength_counts['Strong'])
+    with col3:
+        st.metric("Weak Passwords", audit.strength_counts['Weak'])
+    with col4:
+        st.metric("Common Passwords", audit.common_count)
+
+def show_reuse_summary(summary):
+    st.subheader("Password Reuse")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Unique Passwords", summary['unique_passwords'])
+    with col2:
+        st.metric("Rows Sharing a Password", summary['duplicated_rows'])
+    with col3:
+        st.metric("Near-Duplicate Rows", summary['near_duplicate_rows'])
+    clusters = [size for size in summary['largest_clusters'] if size > 1]
+    if clusters:
+        st.caption(f"Largest reuse clusters: {', '.join(str(size) for size in clusters)} rows")
+
+def analyze_uploaded_file(analyzer, uploaded_file, export_format='csv'):
+    """Stream an uploaded file through one analyze_batch pass
+    
+    Only running counts and a bounded preview are kept in memory; every row is
+    written to a temporary CSV or Parquet file that is offered for download.
+    """
+    import io
+    import tempfile
+    from itertools import chain, islice, tee
+    from batch_export import COLUMNAR_FIELDS, FIELDS, WRITERS, result_row
+    from cli import iter_passwords
+    
+    previous = st.session_state.get('batch_upload')
+    if previous and os.path.exists(previous['output_path']):
+        os.remove(previous['output_path'])
+    
+    audit = AuditAggregator()
+    summary = {'audit': audit, 'preview': []}
+    total_bytes = max(1, uploaded_file.size)
+    progress = ThrottledProgress()
+    status = st.empty()
+    
+    uploaded_file.seek(0)
+    lines = io.TextIOWrapper(uploaded_file, encoding='utf-8', errors='surrogateescape', newline=None)
+    passwords = iter_passwords(lines)
+    # A pool is started once for the whole file, and only when the file is big enough to pay for it
+    first = list(islice(passwords, UPLOAD_CHUNK_SIZE))
+    workers = None if len(first) >= BATCH_PARALLEL_THRESHOLD else 1
+    # The tee buffer holds only the chunks analyze_batch has in flight
+    passwords, originals = tee(chain(first, passwords))
+    results = analyzer.analyze_batch(passwords, workers=workers, compact=True)
+    fields = list(COLUMNAR_FIELDS if export_format == 'parquet' else FIELDS)
+    output = tempfile.NamedTemporaryFile('w', encoding='utf-8', errors='surrogateescape', newline='',
+                                         prefix='password_analysis_', suffix=f'.{export_format}', delete=False)
+    try:
+        with output:
+            writer = WRITERS[export_format](output, fields)
+            for password, analysis in zip(originals, results):
+                audit.update(analysis)
+                if len(summary['preview']) < UPLOAD_PREVIEW_ROWS:
+                    summary['preview'].append(batch_table_row(password, analysis))
+                writer.write(result_row(password, analysis, mask=True, fields=fields))
+                if audit.total % UPLOAD_CHUNK_SIZE == 0:
+                    progress.update(uploaded_file.tell() / total_bytes)
+                    status.caption(f"Analyzed {audit.total:,} passwords...")
+            writer.close()
+    except BaseException:
+        # Closing the generator shuts its pool down before the partial output is removed
+        results.close()
+        os.remove(output.name)
+        raise
+    lines.detach()
+    progress.update(1.0, force=True)
+    status.empty()
+    
+    summary['output_path'] = output.name
+    summary['file_name'] = uploaded_file.name
+    summary['format'] = export_format
+    return summary
+
+def parquet_bytes(rows, fields):
+    """Small in-memory Parquet export for pasted batches"""
+    import io
+    from batch_export import ParquetWriter
+    buffer = io.BytesIO()
+    writer = ParquetWriter(buffer, list(fields))
+    for row in rows:
+        writer.write(row)
+    writer.close()
+    return buffer.getvalue()
+
 def batch_analysis_page(analyzer):
+    import pandas as pd  # Only this page needs pandas
+    
     st.header("Batch Password Analysis")
     st.write("Analyze multiple passwords at once for organizational security assessments.")
     
@@ -176,27 +470,51 @@ def batch_analysis_page(analyzer):
         help="Each password should be on a separate line"
     )
     
+    # Large lists are uploaded and streamed instead of pasted
+    uploaded_file = st.file_uploader(
+        "Or upload a password file (one per line):",
+        type=['txt', 'csv', 'lst'],
+        help="Large files are analyzed in chunks; only a preview is shown and the full results are downloadable"
+    )
+    export_format = st.radio(
+        "Full results format:",
+        ['csv', 'parquet'],
+        format_func=lambda name: 'CSV' if name == 'csv' else 'Parquet (typed, readable by the Security Report)',
+        horizontal=True
+    )
+    
     if st.button("Analyze All Passwords"):
-        if passwords_text:
+        if uploaded_file is not None:
+            st.session_state['batch_upload'] = analyze_uploaded_file(analyzer, uploaded_file, export_format)
+            st.session_state['batch_audit'] = st.session_state['batch_upload']['audit']
+        elif passwords_text:
+            st.session_state.pop('batch_upload', None)
             passwords = [p.strip() for p in passwords_text.split('\n') if p.strip()]
             
             if passwords:
+                from batch_export import COLUMNAR_FIELDS, result_row
+                from reuse_detector import ReuseDetector, analyze_deduplicated
+                
                 results = []
-                progress_bar = st.progress(0)
+                export_rows = []
+                audit = AuditAggregator()
+                progress = ThrottledProgress()
                 
-                for i, password in enumerate(passwords):
-                    analysis = analyzer.analyze_password(password)
-                    results.append({
-                        'Password': password[:3] + '*' * (len(password) - 3),  # Mask password
-                        'Score': analysis['score'],
-                        'Strength': 'Strong' if analysis['score'] >= 80 else 'Medium' if analysis['score'] >= 60 else 'Weak',
-                        'Length': analysis['length'],
-                        'Entropy': round(analysis['entropy'], 2),
-                        'Character Types': analysis['character_variety'],
-                        'Common Password': 'Yes' if analysis['is_common'] else 'No',
-                        'Issues Count': len(analysis['issues'])
-                    })
-                    progress_bar.progress((i + 1) / len(passwords))
+                # Repeated passwords are analyzed once; the detector also clusters near-duplicates
+                detector = ReuseDetector()
+                workers = None if len(passwords) >= BATCH_PARALLEL_THRESHOLD else 1
+                analyses = analyze_deduplicated(analyzer, passwords, detector, workers=workers)
+                reuse = detector.report()
+                for i, (password, analysis) in enumerate(zip(passwords, analyses)):
+                    row = batch_table_row(password, analysis)
+                    row['Duplicates'] = reuse.duplicate_count(i)
+                    row['Cluster Size'] = reuse.cluster_size(i)
+                    row['Reuse Score'] = round(reuse.reuse_score(i), 2)
+                    results.append(row)
+                    export_rows.append(result_row(password, analysis, mask=True, fields=COLUMNAR_FIELDS))
+                    audit.update(analysis)
+                    progress.update((i + 1) / len(passwords))
+                progress.update(1.0, force=True)
                 
                 # Display results
                 df = pd.DataFrame(results)
@@ -204,18 +522,9 @@ def batch_analysis_page(analyzer):
                 st.dataframe(df, use_container_width=True)
                 
                 # Summary statistics
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total Passwords", len(results))
-                with col2:
-                    strong_count = len([r for r in results if r['Strength'] == 'Strong'])
-                    st.metric("Strong Passwords", strong_count)
-                with col3:
-                    weak_count = len([r for r in results if r['Strength'] == 'Weak'])
-                    st.metric("Weak Passwords", weak_count)
-                with col4:
-                    common_count = len([r for r in results if r['Common Password'] == 'Yes'])
-                    st.metric("Common Passwords", common_count)
+                st.session_state['batch_audit'] = audit
+                show_batch_summary(audit)
+                show_reuse_summary(reuse.summary())
                 
                 # Download results
                 csv = df.to_csv(index=False)
@@ -225,6 +534,31 @@ def batch_analysis_page(analyzer):
                     file_name=f"password_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv"
                 )
+                st.download_button(
+                    label="Download Results as Parquet",
+                    data=parquet_bytes(export_rows, COLUMNAR_FIELDS),
+                    file_name=f"password_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+    
+    # Upload results survive reruns (e.g. the download click) through session state
+    upload = st.session_state.get('batch_upload')
+    if upload and os.path.exists(upload['output_path']):
+        st.subheader(f"Analysis Results: {upload['file_name']}")
+        total = upload['audit'].total
+        if total > len(upload['preview']):
+            st.caption(f"Showing the first {len(upload['preview']):,} of {total:,} rows")
+        st.dataframe(pd.DataFrame(upload['preview']), use_container_width=True)
+        show_batch_summary(upload['audit'])
+        
+        export_format = upload.get('format', 'csv')
+        with open(upload['output_path'], 'rb') as results_file:
+            st.download_button(
+                label=f"Download Full Results as {'Parquet' if export_format == 'parquet' else 'CSV'}",
+                data=results_file,
+                file_name=f"password_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}",
+                mime="application/vnd.apache.parquet" if export_format == 'parquet' else "text/csv"
+            )
 
 def security_report_page(analyzer):
     st.header("Security Assessment Report")
@@ -254,6 +588,58 @@ def security_report_page(analyzer):
             file_name=f"security_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
             mime="text/plain"
         )
+    
+    # A saved Parquet export stands in for a batch run in this session
+    results_file = st.file_uploader(
+        "Load batch results (Parquet export):",
+        type=['parquet'],
+        help="Audit statistics are rebuilt from the export's score, entropy and code columns"
+    )
+    if results_file is not None and st.session_state.get('batch_results_file') != results_file.file_id:
+        from batch_export import read_results
+        try:
+            st.session_state['batch_audit'] = AuditAggregator().update_all(read_results(results_file))
+            st.session_state['batch_results_file'] = results_file.file_id
+        except ValueError as error:
+            st.error(str(error))
+    
+    # Organization-wide statistics from the most recent batch analysis
+    audit = st.session_state.get('batch_audit')
+    if audit is not None and audit.total:
+        batch_audit_section(audit.summary())
+
+def batch_audit_section(summary):
+    """Distributions from the last Batch Analysis run"""
+    import pandas as pd
+    
+    st.subheader("Batch Audit Statistics")
+    st.caption("From the most recent Batch Analysis run")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Passwords Audited", f"{summary['total']:,}")
+    with col2:
+        st.metric("Common Password Rate", f"{summary['common_rate']:.1%}")
+    with col3:
+        st.metric("Median Score", summary['score_percentiles']['p50'])
+    with col4:
+        st.metric("Median Entropy", f"{summary['entropy_percentiles']['p50']:.1f} bits")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Score Distribution**")
+        st.bar_chart(pd.Series(summary['score_histogram'], name='Passwords'))
+    with col2:
+        st.write("**Length Distribution**")
+        st.bar_chart(pd.Series(summary['length_buckets'], name='Passwords'))
+    
+    st.write("**Entropy Percentiles (bits)**")
+    st.table(pd.DataFrame([{name: round(value, 1) for name, value in summary['entropy_percentiles'].items()}]))
+    
+    if summary['pattern_counts']:
+        st.write("**Most Frequent Patterns**")
+        patterns = sorted(summary['pattern_counts'].items(), key=lambda item: item[1], reverse=True)
+        st.table(pd.DataFrame(patterns, columns=['Pattern', 'Passwords']))
 
 def generate_security_report(analysis, password):
     """Generate a detailed security report"""
@@ -0,0 +1,248 @@
+"""
+Streaming aggregate statistics for password audits
+Every metric updates in one pass with constant memory, and partial aggregators merge,
+so chunked or parallel runs can be combined into one report
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+from password_analyzer import (ISSUE_MESSAGES, PATTERN_MESSAGES, AnalysisResult, PasswordAnalyzer,
+                               strength_label)
+
+# Length buckets as (label, lower bound inclusive); the last bucket is open-ended
+LENGTH_BUCKETS = (('0-7', 0), ('8-11', 8), ('12-15', 12), ('16-19', 16), ('20+', 20))
+# Entropy histogram bucket width in bits; the last bucket collects everything above
+ENTROPY_BUCKET_BITS = 10
+ENTROPY_BUCKETS = 13
+STRENGTHS = ('Strong', 'Medium', 'Weak')
+
+
+class TDigest:
+    """Merging t-digest for streaming quantile estimates (Dunning & Ertl)"""
+
+    def __init__(self, compression: float = 100):
+        self.compression = compression
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[float] = []
+        self._buffer_limit = int(compression * 5)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self._buffer.append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other: 'TDigest'):
+        """Fold another digest's centroids into this one"""
+        other._compress()
+        self._compress()
+        points = list(zip(self._means, self._weights)) + list(zip(other._means, other._weights))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._means, self._weights = self._cluster(points)
+
+    def _q_limit(self, q: float) -> float:
+        """Largest quantile a centroid starting at q may reach (k1 scale function)"""
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _cluster(self, points):
+        points.sort()
+        total = sum(weight for _, weight in points)
+        means, weights = [], []
+        if not points:
+            return means, weights
+
+        mean, weight = points[0]
+        cumulative = 0.0
+        limit = self._q_limit(0.0)
+        for next_mean, next_weight in points[1:]:
+            if (cumulative + weight + next_weight) / total <= limit:
+                # Merge into the current centroid
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                cumulative += weight
+                limit = self._q_limit(cumulative / total)
+                mean, weight = next_mean, next_weight
+        means.append(mean)
+        weights.append(weight)
+        return means, weights
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        points = list(zip(self._means, self._weights)) + [(value, 1.0) for value in self._buffer]
+        self._buffer = []
+        self._means, self._weights = self._cluster(points)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the value at quantile q (0-1); None when empty"""
+        self._compress()
+        if not self._means:
+            return None
+        if len(self._means) == 1:
+            return self._means[0]
+
+        total = sum(self._weights)
+        target = q * total
+        # Centroid i sits at cumulative weight center[i]
+        cumulative = 0.0
+        previous_center, previous_mean = 0.0, self.min
+        for mean, weight in zip(self._means, self._weights):
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - previous_center
+                fraction = (target - previous_center) / span if span else 0.0
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        span = total - previous_center
+        fraction = (target - previous_center) / span if span else 1.0
+        return previous_mean + fraction * (self.max - previous_mean)
+
+    def __getstate__(self):
+        self._compress()
+        return self.__dict__
+
+
+class AuditAggregator:
+    """One-pass, mergeable audit statistics over analysis results"""
+
+    def __init__(self):
+        self.total = 0
+        self.common_count = 0
+        self.strength_counts = {strength: 0 for strength in STRENGTHS}
+        # Scores are integers 0-100, so a 101-bin histogram gives exact percentiles
+        self.score_histogram = [0] * 101
+        self.entropy_histogram = [0] * ENTROPY_BUCKETS
+        self.entropy_digest = TDigest()
+        self.entropy_sum = 0.0
+        self.length_counts = [0] * len(LENGTH_BUCKETS)
+        self.pattern_counts = [0] * len(PATTERN_MESSAGES)
+        self.issue_counts = [0] * len(ISSUE_MESSAGES)
+
+    def update(self, result: AnalysisResult):
+        self.total += 1
+        if result.is_common:
+            self.common_count += 1
+        self.strength_counts[strength_label(result.score)] += 1
+        self.score_histogram[result.score] += 1
+
+        entropy = result.entropy
+        self.entropy_sum += entropy
+        self.entropy_digest.add(entropy)
+        self.entropy_histogram[min(int(entropy // ENTROPY_BUCKET_BITS), ENTROPY_BUCKETS - 1)] += 1
+
+        for index in range(len(LENGTH_BUCKETS) - 1, -1, -1):
+            if result.length >= LENGTH_BUCKETS[index][1]:
+                self.length_counts[index] += 1
+                break
+
+        # Walk only the set bits of each bitmask
+        codes = result.pattern_codes
+        while codes:
+            lowest = codes & -codes
+            self.pattern_counts[lowest.bit_length() - 1] += 1
+            codes ^= lowest
+        codes = result.issue_codes
+        while codes:
+            lowest = codes & -codes
+            self.issue_counts[lowest.bit_length() - 1] += 1
+            codes ^= lowest
+
+    def update_all(self, results: Iterable[AnalysisResult]) -> 'AuditAggregator':
+        for result in results:
+            self.update(result)
+        return self
+
+    def merge(self, other: 'AuditAggregator') -> 'AuditAggregator':
+        """Combine another partial aggregate into this one"""
+        self.total += other.total
+        self.common_count += other.common_count
+        for strength, count in other.strength_counts.items():
+            self.strength_counts[strength] += count
+        for counts, other_counts in ((self.score_histogram, other.score_histogram),
+                                     (self.entropy_histogram, other.entropy_histogram),
+                                     (self.length_counts, other.length_counts),
+                                     (self.pattern_counts, other.pattern_counts),
+                                     (self.issue_counts, other.issue_counts)):
+            for index, count in enumerate(other_counts):
+                counts[index] += count
+        self.entropy_sum += other.entropy_sum
+        self.entropy_digest.merge(other.entropy_digest)
+        return self
+
+    def score_percentile(self, q: float) -> Optional[int]:
+        """Exact score at quantile q (0-1), from the histogram"""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(q * self.total))
+        cumulative = 0
+        for score, count in enumerate(self.score_histogram):
+            cumulative += count
+            if cumulative >= rank:
+                return score
+        return 100
+
+    def entropy_percentile(self, q: float) -> Optional[float]:
+        """Approximate entropy at quantile q (0-1), from the t-digest"""
+        return self.entropy_digest.quantile(q)
+
+    @property
+    def common_rate(self) -> float:
+        return self.common_count / self.total if self.total else 0.0
+
+    def summary(self) -> Dict:
+        """Plain-data report suitable for JSON or display"""
+        quantiles = (0.05, 0.25, 0.5, 0.75, 0.95)
+        score_bins = [sum(self.score_histogram[low:low + 10]) for low in range(0, 100, 10)]
+        score_bins[-1] += self.score_histogram[100]
+        return {
+            'total': self.total,
+            'strength_counts': dict(self.strength_counts),
+            'common_count': self.common_count,
+            'common_rate': self.common_rate,
+            'score_histogram': {f"{low}-{low + 9 if low < 90 else 100}": count
+                                for low, count in zip(range(0, 100, 10), score_bins)},
+            'score_percentiles': {f"p{round(q * 100)}": self.score_percentile(q) for q in quantiles},
+            'entropy_mean': self.entropy_sum / self.total if self.total else None,
+            'entropy_percentiles': {f"p{round(q * 100)}": self.entropy_percentile(q) for q in quantiles},
+            'entropy_histogram': {
+                (f"{index * ENTROPY_BUCKET_BITS}-{(index + 1) * ENTROPY_BUCKET_BITS}"
+                 if index < ENTROPY_BUCKETS - 1 else f"{index * ENTROPY_BUCKET_BITS}+"): count
+                for index, count in enumerate(self.entropy_histogram)
+            },
+            'length_buckets': {label: count for (label, _), count in zip(LENGTH_BUCKETS, self.length_counts)},
+            'pattern_counts': {message: count for message, count in zip(PATTERN_MESSAGES, self.pattern_counts)
+                               if count},
+            'issue_counts': {message: count for (_, message), count in zip(ISSUE_MESSAGES, self.issue_counts)
+                             if count}
+        }
+
+
+def _aggregate_chunk(analyzer: PasswordAnalyzer, passwords: List[str]) -> AuditAggregator:
+    return AuditAggregator().update_all(analyzer.analyze(password) for password in passwords)
+
+
+def aggregate_passwords(analyzer: PasswordAnalyzer, passwords: Iterable[str], workers: Optional[int] = 1,
+                        chunksize: int = 1000) -> AuditAggregator:
+    """Aggregate without keeping per-row results; workers return partial aggregates that are merged"""
+    total = AuditAggregator()
+    for partial in analyzer.map_chunks(_aggregate_chunk, passwords, workers, chunksize):
+        total.merge(partial)
+    return total
@@ -0,0 +1,206 @@
+"""
+Row formatting and incremental writers for batch analysis output
+Shared by the command-line interface and the Batch Analysis page; Parquet output (via pyarrow, which
+Streamlit already depends on) is written one row group at a time and can be read back into AnalysisResults
+"""
+
+import csv
+import json
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+from password_analyzer import AnalysisResult, mask_password, strength_label
+
+# Output columns, in order
+FIELDS = (
+    'password',
+    'score',
+    'strength',
+    'length',
+    'entropy',
+    'character_variety',
+    'is_common',
+    'issues_count',
+    'patterns_count'
+)
+# Raw bit codes; with score, length, entropy and is_common they rebuild the AnalysisResult
+CODE_FIELDS = (
+    'character_flags',
+    'issue_codes',
+    'recommendation_codes',
+    'pattern_codes'
+)
+# Parquet keeps the codes by default so exports can be read back for reporting
+COLUMNAR_FIELDS = FIELDS + CODE_FIELDS
+RESULT_FIELDS = ('score', 'length', 'entropy', 'character_flags', 'is_common', 'issue_codes',
+                 'recommendation_codes', 'pattern_codes')
+
+STRENGTH_LEVELS = ('Weak', 'Medium', 'Strong')
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+
+def parse_fields(spec: Optional[str], default: Iterable[str] = FIELDS) -> List[str]:
+    """Parse a comma-separated field list, validating against FIELDS and CODE_FIELDS"""
+    if not spec:
+        return list(default)
+    fields = [field.strip() for field in spec.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in COLUMNAR_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)} (choose from {', '.join(COLUMNAR_FIELDS)})")
+    return fields
+
+
+def result_row(password: str, analysis: AnalysisResult, mask: bool = False,
+               fields: Iterable[str] = FIELDS) -> Dict:
+    """Flatten one analysis into an output row with only the requested fields"""
+    row = {}
+    for field in fields:
+        if field == 'password':
+            row[field] = mask_password(password) if mask else password
+        elif field == 'strength':
+            row[field] = strength_label(analysis.score)
+        elif field == 'entropy':
+            row[field] = round(analysis.entropy, 2)
+        elif field == 'patterns_count':
+            row[field] = analysis.pattern_count
+        else:
+            row[field] = getattr(analysis, field)
+    return row
+
+
+class JsonlWriter:
+    """Write one JSON object per line"""
+
+    def __init__(self, stream: TextIO, fields: List[str]):
+        self.stream = stream
+        self.fields = fields
+
+    def write(self, row: Dict):
+        self.stream.write(json.dumps(row, ensure_ascii=False))
+        self.stream.write('\n')
+
+    def close(self):
+        self.stream.flush()
+
+
+class CsvWriter:
+    """Write a header line followed by one CSV record per row"""
+
+    def __init__(self, stream: TextIO, fields: List[str]):
+        self.stream = stream
+        self.fields = fields
+        self._writer = csv.DictWriter(stream, fieldnames=fields, lineterminator='\n')
+        self._writer.writeheader()
+
+    def write(self, row: Dict):
+        self._writer.writerow(row)
+
+    def close(self):
+        self.stream.flush()
+
+
+def _arrow_types():
+    import pyarrow as pa
+    return {
+        'password': pa.string(),
+        'score': pa.uint8(),
+        'strength': pa.dictionary(pa.int8(), pa.string(), ordered=True),
+        'length': pa.uint32(),
+        'entropy': pa.float32(),
+        'character_variety': pa.uint8(),
+        'is_common': pa.bool_(),
+        'issues_count': pa.uint8(),
+        'patterns_count': pa.uint8(),
+        'character_flags': pa.uint8(),
+        'issue_codes': pa.uint16(),
+        'recommendation_codes': pa.uint16(),
+        'pattern_codes': pa.uint16()
+    }
+
+
+class ParquetWriter:
+    """Buffer rows column by column and write each full buffer as one Parquet row group
+
+    Strength is stored as a categorical; columns outside the known fields (such as policy verdicts)
+    are typed from their first value.
+    """
+
+    def __init__(self, stream: Union[TextIO, BinaryIO], fields: List[str],
+                 row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        import pyarrow as pa
+        self.stream = stream
+        self.fields = fields
+        self.row_group_size = row_group_size
+        self._types = _arrow_types()
+        self._columns: Dict[str, list] = {field: [] for field in fields}
+        self._writer = None
+        self.rows = 0
+        self._strength_dictionary = pa.array(STRENGTH_LEVELS, type=pa.string())
+        self._strength_index = {label: index for index, label in enumerate(STRENGTH_LEVELS)}
+
+    def write(self, row: Dict):
+        for field, values in self._columns.items():
+            values.append(row[field])
+        if len(self._columns[self.fields[0]]) >= self.row_group_size:
+            self._flush()
+
+    def _column_type(self, field: str, values: list):
+        import pyarrow as pa
+        known = self._types.get(field)
+        if known is not None:
+            return known
+        if isinstance(values[0], bool):
+            return pa.bool_()
+        if isinstance(values[0], int):
+            return pa.int64()
+        if isinstance(values[0], float):
+            return pa.float64()
+        return pa.string()
+
+    def _flush(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if not self.fields or not self._columns[self.fields[0]]:
+            return
+        arrays = []
+        for field in self.fields:
+            values = self._columns[field]
+            if field == 'strength':
+                indices = pa.array([self._strength_index[label] for label in values], type=pa.int8())
+                arrays.append(pa.DictionaryArray.from_arrays(indices, self._strength_dictionary, ordered=True))
+            else:
+                arrays.append(pa.array(values, type=self._column_type(field, values)))
+        table = pa.Table.from_arrays(arrays, names=self.fields)
+        if self._writer is None:
+            # Text streams (stdout, files opened by the CLI) are written through their binary buffer
+            sink = getattr(self.stream, 'buffer', self.stream)
+            self._writer = pq.ParquetWriter(sink, table.schema)
+        self._writer.write_table(table, row_group_size=len(table))
+        self.rows += len(table)
+        for values in self._columns.values():
+            values.clear()
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        getattr(self.stream, 'buffer', self.stream).flush()
+
+
+WRITERS = {
+    'jsonl': JsonlWriter,
+    'csv': CsvWriter,
+    'parquet': ParquetWriter
+}
+
+
+def read_results(source: Union[str, BinaryIO], batch_size: int = 65536) -> Iterator[AnalysisResult]:
+    """Stream AnalysisResults back out of a Parquet export written with the code fields"""
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(source)
+    missing = [field for field in RESULT_FIELDS if field not in parquet_file.schema_arrow.names]
+    if missing:
+        raise ValueError(f"Parquet file lacks column(s) {', '.join(missing)}; export with the code fields")
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=list(RESULT_FIELDS)):
+        columns = [batch.column(field).to_pylist() for field in RESULT_FIELDS]
+        for values in zip(*columns):
+            yield AnalysisResult(*values)
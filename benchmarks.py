@@ -0,0 +1,320 @@
+"""
+Benchmark suite for the password analyzer
+Measures analyze_password latency by length, class mix and corpus kind, batch throughput, memory per result,
+worst-case cost on hostile inputs, password generation throughput, construction and import times on a deterministic
+synthetic corpus, and gates regressions against a baseline
+Usage: python benchmarks.py [-o RESULTS.json] [--baseline BASELINE.json] [--tolerance 0.15] [--quick]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from password_analyzer import KEYBOARD_PATTERNS, PasswordAnalyzer
+
+RESULTS_VERSION = 1
+DEFAULT_SEED = 1234
+DEFAULT_TOLERANCE = 0.15
+
+# Character pools for the class-mix latency grid
+CLASS_MIXES = {
+    'lower': string.ascii_lowercase,
+    'alnum': string.ascii_letters + string.digits,
+    'full': string.ascii_letters + string.digits + string.punctuation
+}
+LATENCY_LENGTHS = (8, 12, 16, 32, 64)
+
+# Corpus kinds produced by synthetic_corpus, mixed in equal shares by default
+CORPUS_KINDS = ('random', 'dictionary_affix', 'keyboard_walk', 'long_paste')
+
+# Rows of QWERTY used to build keyboard walks
+KEYBOARD_ROWS = ('1234567890', 'qwertyuiop', 'asdfghjkl', 'zxcvbnm')
+AFFIX_SUFFIXES = ('1', '12', '123', '!', '1!', '2023', '2024', '@', '#1', '69', '007')
+
+# Metric name suffixes and the direction that counts as a regression
+HIGHER_IS_BETTER = ('_per_second',)
+
+
+def _random_string(rng: random.Random, length: int, pool: str = CLASS_MIXES['full']) -> str:
+    return ''.join(rng.choice(pool) for _ in range(length))
+
+
+def _dictionary_affix(rng: random.Random, words: List[str]) -> str:
+    word = rng.choice(words)
+    style = rng.randrange(4)
+    if style == 1:
+        word = word.capitalize()
+    elif style == 2:
+        word = word.upper()
+    elif style == 3:
+        word = word.replace('a', '@').replace('o', '0').replace('e', '3')
+    prefix = rng.choice(('', '', '', '!', '1'))
+    return prefix + word + rng.choice(AFFIX_SUFFIXES)
+
+
+def _keyboard_walk(rng: random.Random) -> str:
+    row = rng.choice(KEYBOARD_ROWS + KEYBOARD_PATTERNS)
+    start = rng.randrange(max(1, len(row) - 3))
+    walk = row[start:start + rng.randint(4, len(row))]
+    if rng.random() < 0.5:
+        walk += rng.choice(KEYBOARD_ROWS)[:rng.randint(2, 4)]
+    return walk.capitalize() if rng.random() < 0.3 else walk
+
+
+def _long_paste(rng: random.Random) -> str:
+    """Sentence-like text or a pasted key, hundreds to thousands of characters"""
+    if rng.random() < 0.5:
+        return _random_string(rng, rng.randint(256, 4096))
+    words = [_random_string(rng, rng.randint(2, 9), string.ascii_lowercase) for _ in range(rng.randint(40, 400))]
+    return ' '.join(words)
+
+
+def synthetic_corpus(count: int, seed: int = DEFAULT_SEED, kinds=CORPUS_KINDS) -> List[str]:
+    """Deterministic corpus cycling through the given kinds; the same seed always yields the same list"""
+    from common_passwords import RANKED_PASSWORDS
+    words = [word for word in RANKED_PASSWORDS if word.isalpha()]
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(count):
+        kind = kinds[index % len(kinds)]
+        if kind == 'random':
+            corpus.append(_random_string(rng, rng.randint(6, 24)))
+        elif kind == 'dictionary_affix':
+            corpus.append(_dictionary_affix(rng, words))
+        elif kind == 'keyboard_walk':
+            corpus.append(_keyboard_walk(rng))
+        elif kind == 'long_paste':
+            corpus.append(_long_paste(rng))
+        else:
+            raise ValueError(f"Unknown corpus kind: {kind}")
+    return corpus
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure_latency(function: Callable, inputs: List[str]) -> Dict[str, float]:
+    """Per-call latency in microseconds: p50, p99 and mean"""
+    timer = time.perf_counter_ns
+    samples = []
+    for value in inputs:
+        started = timer()
+        function(value)
+        samples.append(timer() - started)
+    samples.sort()
+    return {
+        'p50_us': _percentile(samples, 0.5) / 1000,
+        'p99_us': _percentile(samples, 0.99) / 1000,
+        'mean_us': sum(samples) / len(samples) / 1000
+    }
+
+
+def bench_latency(analyzer: PasswordAnalyzer, samples: int, seed: int) -> Dict[str, float]:
+    metrics = {}
+    rng = random.Random(seed)
+    for length in LATENCY_LENGTHS:
+        for mix, pool in CLASS_MIXES.items():
+            inputs = [_random_string(rng, length, pool) for _ in range(samples)]
+            for name, value in measure_latency(analyzer.analyze_password, inputs).items():
+                metrics[f"latency.len{length}.{mix}.{name}"] = value
+    for kind in CORPUS_KINDS:
+        count = samples if kind != 'long_paste' else max(10, samples // 20)
+        inputs = synthetic_corpus(count, seed, kinds=(kind,))
+        for name, value in measure_latency(analyzer.analyze_password, inputs).items():
+            metrics[f"latency.corpus.{kind}.{name}"] = value
+    return metrics
+
+
+def bench_throughput(analyzer: PasswordAnalyzer, corpus: List[str], workers: int) -> Dict[str, float]:
+    metrics = {}
+    started = time.perf_counter()
+    for _ in analyzer.analyze_batch(corpus, workers=1, compact=True):
+        pass
+    metrics['throughput.serial.passwords_per_second'] = len(corpus) / (time.perf_counter() - started)
+    # The NumPy path still scans each row in Python; tracked so its edge over the serial path stays visible
+    from vectorized import analyze_columnar
+    started = time.perf_counter()
+    analyze_columnar(corpus, analyzer)
+    metrics['throughput.columnar.passwords_per_second'] = len(corpus) / (time.perf_counter() - started)
+    if workers > 1:
+        started = time.perf_counter()
+        for _ in analyzer.analyze_batch(corpus, workers=workers, compact=True):
+            pass
+        metrics[f'throughput.workers{workers}.passwords_per_second'] = len(corpus) / (time.perf_counter() - started)
+    return metrics
+
+
+def bench_memory(analyzer: PasswordAnalyzer, corpus: List[str]) -> Dict[str, float]:
+    """Peak traced allocation while holding one compact result per password, scaled to 1M results"""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        results = [analyzer.analyze(password) for password in corpus]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del results
+    return {'memory.peak_mb_per_1m_results': (peak - baseline) / len(corpus) * 1_000_000 / 2 ** 20}
+
+
+def bench_hostile(size_kb: int) -> Dict[str, float]:
+    """Worst per-KB cost across the hostile input shapes, and the worst bounded-mode latency at 1 MB"""
+    from hostile_inputs import bounded_worst_ms, per_kb_latency
+    from password_analyzer import DEFAULT_ANALYSIS_LENGTH
+    table = per_kb_latency(PasswordAnalyzer(), [size_kb])
+    return {
+        'hostile.worst_us_per_kb': max(row[0] for row in table.values()),
+        'hostile.bounded_1mb_worst_ms': bounded_worst_ms(PasswordAnalyzer(analysis_length=DEFAULT_ANALYSIS_LENGTH),
+                                                         1024)
+    }
+
+
+def bench_generator(count: int) -> Dict[str, float]:
+    """Passwords and passphrases generated per second, plain and with analyzer verification"""
+    from password_generator import PassphraseGenerator, PasswordGenerator, generate, generate_verified
+    metrics = {}
+    for name, generator in (('passwords', PasswordGenerator()), ('passphrases', PassphraseGenerator())):
+        started = time.perf_counter()
+        for _ in generate(generator, count):
+            pass
+        metrics[f'generator.{name}_per_second'] = count / (time.perf_counter() - started)
+    verified = max(1, count // 20)
+    started = time.perf_counter()
+    for _ in generate_verified(PasswordGenerator(), verified):
+        pass
+    metrics['generator.verified_passwords_per_second'] = verified / (time.perf_counter() - started)
+    return metrics
+
+
+def _subprocess_seconds(code: str) -> float:
+    """Run code in a fresh interpreter (cold imports) and return the seconds it prints"""
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(repeat: int) -> Dict[str, float]:
+    construction = (
+        "import time; started = time.perf_counter()\n"
+        "from password_analyzer import PasswordAnalyzer\n"
+        "analyzer = PasswordAnalyzer(); analyzer.analyze('warmup')\n"
+        "print(time.perf_counter() - started)"
+    )
+    app_import = (
+        "import logging, time; logging.disable(logging.WARNING); started = time.perf_counter()\n"
+        "import app\n"
+        "print(time.perf_counter() - started)"
+    )
+    metrics = {
+        'startup.analyzer_construction_ms': min(_subprocess_seconds(construction) for _ in range(repeat)) * 1000
+    }
+    try:
+        metrics['startup.app_import_ms'] = min(_subprocess_seconds(app_import) for _ in range(repeat)) * 1000
+    except subprocess.CalledProcessError:
+        # Streamlit is not installed in this environment
+        pass
+    return metrics
+
+
+def run_benchmarks(quick: bool = False, seed: int = DEFAULT_SEED, workers: Optional[int] = None) -> Dict:
+    """Run every benchmark and return a results document"""
+    samples = 300 if quick else 2000
+    corpus_size = 4000 if quick else 40000
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    analyzer = PasswordAnalyzer()
+    corpus = synthetic_corpus(corpus_size, seed, kinds=CORPUS_KINDS[:3])
+    analyzer.analyze('warmup')
+
+    metrics = {}
+    metrics.update(bench_latency(analyzer, samples, seed))
+    metrics.update(bench_throughput(analyzer, corpus, workers))
+    metrics.update(bench_memory(analyzer, corpus))
+    metrics.update(bench_hostile(16 if quick else 64))
+    metrics.update(bench_generator(100_000 if quick else 1_000_000))
+    metrics.update(bench_startup(repeat=2 if quick else 5))
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'settings': {'quick': quick, 'seed': seed, 'samples': samples, 'corpus_size': corpus_size,
+                     'workers': workers},
+        'metrics': metrics
+    }
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """Compare shared metrics; a row regresses when it is worse than the baseline by more than tolerance"""
+    rows = []
+    for name, old in sorted(baseline['metrics'].items()):
+        new = current['metrics'].get(name)
+        if new is None or not old:
+            continue
+        change = (new - old) / old
+        higher_is_better = name.endswith(HIGHER_IS_BETTER)
+        worse = -change if higher_is_better else change
+        rows.append({'metric': name, 'baseline': old, 'current': new, 'change': change,
+                     'regression': worse > tolerance})
+    return rows
+
+
+def _print_comparison(rows: List[Dict], tolerance: float):
+    width = max((len(row['metric']) for row in rows), default=10)
+    for row in rows:
+        flag = 'REGRESSION' if row['regression'] else ''
+        print(f"{row['metric']:<{width}}  {row['baseline']:>12.2f}  {row['current']:>12.2f}  "
+              f"{row['change']:>+8.1%}  {flag}")
+    regressions = sum(row['regression'] for row in rows)
+    print(f"{regressions} regression(s) beyond {tolerance:.0%} across {len(rows)} metrics")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the password analyzer and gate regressions")
+    parser.add_argument('-o', '--output', help="write results JSON to this path (default: stdout)")
+    parser.add_argument('--baseline', help="results JSON to compare against; exits 1 on regressions")
+    parser.add_argument('--current', help="compare this stored results file instead of running the suite")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before a metric fails (default: %(default)s)")
+    parser.add_argument('--quick', action='store_true', help="smaller samples for a fast smoke run")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="corpus seed (default: %(default)s)")
+    parser.add_argument('--workers', type=int, help="workers for the parallel throughput run (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.current:
+        with open(args.current, 'r', encoding='utf-8') as handle:
+            results = json.load(handle)
+    else:
+        results = run_benchmarks(args.quick, args.seed, args.workers)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
+        elif not args.baseline:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        rows = compare(baseline, results, args.tolerance)
+        _print_comparison(rows, args.tolerance)
+        return 1 if any(row['regression'] for row in rows) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
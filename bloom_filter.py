@@ -0,0 +1,148 @@
+"""
+Serialized Bloom filter used as a prefilter in front of the breach corpus index
+Most analyzed passwords are not in any breach list, so most lookups end after a few bit probes
+"""
+
+import argparse
+import logging
+import math
+import mmap
+import struct
+import sys
+from typing import Iterable
+
+from breach_index import full_digest, iter_wordlist
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'PWBLOOM1'
+FORMAT_VERSION = 1
+# magic, version, hash count, reserved, bit count, entry count, configured false-positive rate
+HEADER = struct.Struct('<8sHHIQQd')
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+
+def optimal_parameters(entry_count: int, false_positive_rate: float):
+    """Return (bit_count, hash_count) for the target false-positive rate"""
+    if not 0 < false_positive_rate < 1:
+        raise ValueError("false_positive_rate must be between 0 and 1")
+    entry_count = max(1, entry_count)
+    bit_count = math.ceil(-entry_count * math.log(false_positive_rate) / (math.log(2) ** 2))
+    bit_count = max(64, (bit_count + 7) // 8 * 8)
+    hash_count = max(1, round(bit_count / entry_count * math.log(2)))
+    return bit_count, hash_count
+
+
+def _probe_positions(digest: bytes, bit_count: int, hash_count: int):
+    """Double hashing over one SHA-1 digest (Kirsch-Mitzenmacher)"""
+    first = int.from_bytes(digest[:8], 'little')
+    second = int.from_bytes(digest[8:16], 'little') | 1
+    for index in range(hash_count):
+        yield (first + index * second) % bit_count
+
+
+class BloomFilter:
+    """Read-only Bloom filter opened through mmap"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a Bloom filter (file too short)")
+        magic, version, hash_count, _, bit_count, entry_count, false_positive_rate = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a Bloom filter (bad magic)")
+        if version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} has unsupported filter version {version}")
+        if len(self._mmap) != HEADER.size + bit_count // 8:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self.hash_count = hash_count
+        self.bit_count = bit_count
+        self.entry_count = entry_count
+        self.false_positive_rate = false_positive_rate
+        self.size_bytes = len(self._mmap)
+
+        logger.info("Loaded Bloom filter %s: %d entries, %.1f MiB, %d hashes, "
+                    "target false-positive rate %.4g (estimated %.4g)",
+                    path, entry_count, self.size_bytes / 2 ** 20, hash_count,
+                    false_positive_rate, self.estimated_false_positive_rate)
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """False-positive rate implied by the actual fill"""
+        return (1 - math.exp(-self.hash_count * self.entry_count / self.bit_count)) ** self.hash_count
+
+    def describe(self) -> dict:
+        return {
+            'path': self.path,
+            'entries': self.entry_count,
+            'size_bytes': self.size_bytes,
+            'hash_count': self.hash_count,
+            'false_positive_rate': self.false_positive_rate,
+            'estimated_false_positive_rate': self.estimated_false_positive_rate
+        }
+
+    def might_contain_digest(self, digest: bytes) -> bool:
+        """False means definitely absent; True means check the exact index"""
+        bits = self._mmap
+        offset = HEADER.size
+        for position in _probe_positions(digest, self.bit_count, self.hash_count):
+            if not bits[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, password: str) -> bool:
+        return self.might_contain_digest(full_digest(password))
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def build_filter(words: Iterable[str], filter_path: str, entry_count: int,
+                 false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> int:
+    """Build a filter sized for entry_count passwords; returns the number inserted"""
+    bit_count, hash_count = optimal_parameters(entry_count, false_positive_rate)
+    bits = bytearray(bit_count // 8)
+
+    inserted = 0
+    for word in words:
+        for position in _probe_positions(full_digest(word), bit_count, hash_count):
+            bits[position >> 3] |= 1 << (position & 7)
+        inserted += 1
+
+    with open(filter_path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, FORMAT_VERSION, hash_count, 0, bit_count, inserted, false_positive_rate))
+        output.write(bits)
+    return inserted
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build a Bloom prefilter from a wordlist")
+    parser.add_argument('wordlist', help="newline-delimited password list (same list as the breach index)")
+    parser.add_argument('filter', help="output filter path")
+    parser.add_argument('--false-positive-rate', type=float, default=DEFAULT_FALSE_POSITIVE_RATE,
+                        help="target false-positive rate (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    # First pass sizes the filter, second pass fills it
+    entry_count = sum(1 for _ in iter_wordlist(args.wordlist))
+    inserted = build_filter(iter_wordlist(args.wordlist), args.filter, entry_count, args.false_positive_rate)
+    print(f"Wrote filter for {inserted} entries to {args.filter}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
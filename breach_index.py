@@ -0,0 +1,214 @@
+"""
+Memory-mapped breach corpus index for common password lookups
+Stores sorted fixed-width SHA-1 digest prefixes so corpora with 10^8+ entries can be searched without loading them
+"""
+
+import argparse
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Iterable, Iterator, List
+
+MAGIC = b'PWBIDX01'
+FORMAT_VERSION = 1
+# magic, version, digest size, reserved, entry count
+HEADER = struct.Struct('<8sHHIQ')
+DEFAULT_DIGEST_SIZE = 8
+DEFAULT_CHUNK_SIZE = 2_000_000
+
+
+def normalize_password(password: str) -> str:
+    """Normalize a password the same way the analyzer's common-password check does"""
+    return password.lower()
+
+
+def full_digest(password: str) -> bytes:
+    """SHA-1 of a normalized password; index entries and filter probes both derive from it"""
+    normalized = normalize_password(password)
+    try:
+        # Round-trips undecodable wordlist bytes read with surrogateescape
+        encoded = normalized.encode('utf-8', 'surrogateescape')
+    except UnicodeEncodeError:
+        encoded = normalized.encode('utf-8', 'surrogatepass')
+    return hashlib.sha1(encoded).digest()
+
+
+def password_digest(password: str, digest_size: int = DEFAULT_DIGEST_SIZE) -> bytes:
+    """Fixed-width digest of a normalized password"""
+    return full_digest(password)[:digest_size]
+
+
+class BreachIndex:
+    """Read-only view of an index file, opened with a single mmap call"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a breach index (file too short)")
+        magic, version, digest_size, _, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a breach index (bad magic)")
+        if version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} has unsupported index version {version}")
+        if len(self._mmap) != HEADER.size + count * digest_size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self.digest_size = digest_size
+        self.count = count
+        self._prefix_size = min(digest_size, 8)
+        self._prefix_scale = 1 << (8 * self._prefix_size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, password: str) -> bool:
+        return self.contains_digest(password_digest(password, self.digest_size))
+
+    def _digest_at(self, position: int) -> bytes:
+        offset = HEADER.size + position * self.digest_size
+        return self._mmap[offset:offset + self.digest_size]
+
+    def _prefix_value(self, digest: bytes) -> int:
+        return int.from_bytes(digest[:self._prefix_size], 'big')
+
+    def contains_digest(self, digest: bytes) -> bool:
+        """Interpolation search over the uniformly distributed digests"""
+        low, high = 0, self.count - 1
+        if high < 0:
+            return False
+        target = self._prefix_value(digest)
+        low_value, high_value = 0, self._prefix_scale - 1
+
+        while low <= high:
+            if high - low < 16 or high_value <= low_value:
+                # Small ranges: plain binary search
+                middle = (low + high) // 2
+            else:
+                # Estimate the position from the digest value
+                fraction = (target - low_value) / (high_value - low_value)
+                middle = low + int(fraction * (high - low))
+                middle = min(max(middle, low), high)
+
+            candidate = self._digest_at(middle)
+            if candidate == digest:
+                return True
+            if candidate < digest:
+                low = middle + 1
+                low_value = self._prefix_value(candidate)
+            else:
+                high = middle - 1
+                high_value = self._prefix_value(candidate)
+        return False
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_wordlist(path: str) -> Iterator[str]:
+    """Yield non-empty entries from a newline-delimited wordlist"""
+    with open(path, 'r', encoding='utf-8', errors='surrogateescape') as handle:
+        for line in handle:
+            word = line.rstrip('\r\n')
+            if word:
+                yield word
+
+
+def _write_run(digests: List[bytes], directory: str) -> str:
+    """Sort one chunk of digests and spill it to a temporary run file"""
+    digests.sort()
+    descriptor, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(descriptor, 'wb') as handle:
+        handle.write(b''.join(digests))
+    return path
+
+
+def _read_run(path: str, digest_size: int) -> Iterator[bytes]:
+    with open(path, 'rb') as handle:
+        while True:
+            block = handle.read(digest_size * 65536)
+            if not block:
+                return
+            for offset in range(0, len(block), digest_size):
+                yield block[offset:offset + digest_size]
+
+
+def build_index(words: Iterable[str], index_path: str, digest_size: int = DEFAULT_DIGEST_SIZE,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Build an index file from passwords using an external merge sort; returns the entry count"""
+    if not 4 <= digest_size <= 20:
+        raise ValueError("digest_size must be between 4 and 20 bytes")
+
+    directory = os.path.dirname(os.path.abspath(index_path))
+    runs = []
+    try:
+        # Hash and sort bounded chunks so memory does not grow with the corpus
+        chunk = []
+        for word in words:
+            chunk.append(password_digest(word, digest_size))
+            if len(chunk) >= chunk_size:
+                runs.append(_write_run(chunk, directory))
+                chunk = []
+        if chunk or not runs:
+            runs.append(_write_run(chunk, directory))
+
+        # Merge the sorted runs, dropping duplicates
+        count = 0
+        previous = None
+        partial_path = index_path + '.partial'
+        with open(partial_path, 'wb') as output:
+            output.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest_size, 0, 0))
+            merged = heapq.merge(*(_read_run(path, digest_size) for path in runs))
+            buffer = []
+            for digest in merged:
+                if digest == previous:
+                    continue
+                previous = digest
+                buffer.append(digest)
+                count += 1
+                if len(buffer) >= 65536:
+                    output.write(b''.join(buffer))
+                    buffer = []
+            output.write(b''.join(buffer))
+            output.seek(0)
+            output.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest_size, 0, count))
+        os.replace(partial_path, index_path)
+        return count
+    finally:
+        for path in runs:
+            os.remove(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build a memory-mapped breach index from a wordlist")
+    parser.add_argument('wordlist', help="newline-delimited password list")
+    parser.add_argument('index', help="output index path")
+    parser.add_argument('--digest-size', type=int, default=DEFAULT_DIGEST_SIZE,
+                        help="bytes of SHA-1 kept per entry (default: %(default)s)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="entries sorted in memory per run (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    count = build_index(iter_wordlist(args.wordlist), args.index, args.digest_size, args.chunk_size)
+    print(f"Wrote {count} entries to {args.index}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
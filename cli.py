@@ -0,0 +1,139 @@
+"""
+Streaming command-line interface for batch password analysis
+Usage: python -m password_analyzer [INPUT] [-o OUTPUT] [--format jsonl|csv|parquet] [--workers N] [--fields ...]
+                                  [--mask] [--policy POLICIES.toml ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+from itertools import tee
+from typing import Iterator, TextIO
+
+from audit_stats import AuditAggregator
+from batch_export import COLUMNAR_FIELDS, FIELDS, WRITERS, parse_fields, result_row
+from password_analyzer import DEFAULT_ANALYSIS_LENGTH, PasswordAnalyzer
+from policy_engine import PolicyEngine, load_policies
+
+
+def iter_passwords(handle: TextIO) -> Iterator[str]:
+    """Yield one password per non-blank line without reading the whole input"""
+    for line in handle:
+        password = line.rstrip('\r\n')
+        if password:
+            yield password
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m password_analyzer',
+        description="Analyze passwords line by line and stream results as JSONL or CSV"
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="file with one password per line, or - for stdin (default)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file, or - for stdout (default)")
+    parser.add_argument('--format', choices=sorted(WRITERS), default='jsonl',
+                        help="output format (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes; 0 uses every core (default: %(default)s)")
+    parser.add_argument('--chunksize', type=int, default=1000,
+                        help="passwords per worker task (default: %(default)s)")
+    parser.add_argument('--fields',
+                        help=f"comma-separated columns to emit (default: all of {','.join(FIELDS)}; "
+                             f"parquet adds {','.join(COLUMNAR_FIELDS[len(FIELDS):])})")
+    parser.add_argument('--mask', action='store_true',
+                        help="mask passwords in the output, keeping the first three characters")
+    parser.add_argument('--summary', metavar='PATH',
+                        help="also write aggregate audit statistics as JSON to PATH")
+    parser.add_argument('--breach-index', help="breach corpus index built with breach_index.py")
+    parser.add_argument('--prefilter', help="Bloom filter built with bloom_filter.py")
+    parser.add_argument('--wordlist', help="common-password artifact built with wordlist_artifact.py")
+    parser.add_argument('--policy', action='append', metavar='PATH',
+                        help="JSON or TOML policy file; adds pass/fail and violation columns per policy (repeatable)")
+    parser.add_argument('--analysis-length', type=int, default=DEFAULT_ANALYSIS_LENGTH,
+                        help="score longer passwords on this many leading characters and flag them; "
+                             "0 analyzes every character (default: %(default)s)")
+    return parser
+
+
+def _open_input(path: str) -> TextIO:
+    if path == '-':
+        sys.stdin.reconfigure(errors='surrogateescape')
+        return sys.stdin
+    return open(path, 'r', encoding='utf-8', errors='surrogateescape')
+
+
+def _open_output(path: str) -> TextIO:
+    if path == '-':
+        sys.stdout.reconfigure(errors='surrogateescape')
+        return sys.stdout
+    return open(path, 'w', encoding='utf-8', errors='surrogateescape', newline='')
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        fields = parse_fields(args.fields, COLUMNAR_FIELDS if args.format == 'parquet' else FIELDS)
+    except ValueError as error:
+        parser.error(str(error))
+
+    try:
+        analyzer = PasswordAnalyzer(breach_index_path=args.breach_index, prefilter_path=args.prefilter,
+                                    wordlist_path=args.wordlist, analysis_length=args.analysis_length or None)
+    except ValueError as error:
+        parser.error(str(error))
+    policies = None
+    columns = fields
+    if args.policy:
+        try:
+            policies = PolicyEngine([policy for path in args.policy for policy in load_policies(path)])
+        except (OSError, ValueError) as error:
+            parser.error(f"--policy: {error}")
+        columns = fields + policies.row_columns()
+    workers = None if args.workers == 0 else args.workers
+
+    source = _open_input(args.input)
+    sink = _open_output(args.output)
+    try:
+        writer = WRITERS[args.format](sink, columns)
+        audit = AuditAggregator() if args.summary else None
+        tally = policies.tally() if policies is not None and audit is not None else None
+        # The tee buffer holds only the chunks analyze_batch has in flight
+        passwords, originals = tee(iter_passwords(source))
+        results = analyzer.analyze_batch(passwords, workers=workers, chunksize=args.chunksize, compact=True)
+        for password, analysis in zip(originals, results):
+            row = result_row(password, analysis, args.mask, fields)
+            if policies is not None:
+                # Every policy is checked against the one analysis
+                outcomes = policies.evaluate(analysis, password)
+                row.update(policies.row_values(outcomes))
+                if tally is not None:
+                    tally.update(outcomes)
+            writer.write(row)
+            if audit is not None:
+                audit.update(analysis)
+        writer.close()
+        if audit is not None:
+            summary = audit.summary()
+            if tally is not None:
+                summary['policies'] = tally.summary()
+            with open(args.summary, 'w', encoding='utf-8') as summary_file:
+                json.dump(summary, summary_file, indent=2)
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into head); point stdout at devnull so the
+        # flush at interpreter exit does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
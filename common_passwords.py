@@ -204,20 +204,9 @@ COMMON_PASSWORDS = [
 # Convert to lowercase for case-insensitive comparison
 COMMON_PASSWORDS = [pwd.lower() for pwd in COMMON_PASSWORDS]
 
-# Add some uppercase and mixed case variations for common ones
-ADDITIONAL_VARIATIONS = []
-for pwd in COMMON_PASSWORDS[:20]:  # Only for top 20 to avoid huge list
-    ADDITIONAL_VARIATIONS.extend([
-        pwd.upper(),
-        pwd.capitalize(),
-        pwd + "1",
-        pwd + "!",
-        pwd + "123",
-        "1" + pwd,
-        "!" + pwd
-    ])
+# Distinct entries in source order (most common first); rank 1 is the first entry
+RANKED_PASSWORDS = list(dict.fromkeys(COMMON_PASSWORDS))
 
-COMMON_PASSWORDS.extend(ADDITIONAL_VARIATIONS)
-
-# Remove duplicates and sort
-COMMON_PASSWORDS = sorted(list(set(COMMON_PASSWORDS)))
+# Case, leetspeak and affix variants are matched by dictionary_index.DictionaryIndex,
+# so only the distinct base entries are kept here
+COMMON_PASSWORDS = sorted(RANKED_PASSWORDS)
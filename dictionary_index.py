@@ -0,0 +1,169 @@
+"""
+Normalized lookup of passwords against the common-password wordlist
+Each password is de-leeted with precomputed translation tables and stripped of short digit/symbol affixes,
+then the resulting base is looked up in a hashed index of every wordlist entry
+"""
+
+import string
+from typing import Iterable, List, NamedTuple, Optional
+
+# Common leetspeak substitutions, applied in one str.translate call
+LEET_TABLE = str.maketrans({
+    '4': 'a', '@': 'a',
+    '8': 'b',
+    '(': 'c',
+    '3': 'e',
+    '6': 'g', '9': 'g',
+    '1': 'i', '!': 'i',
+    '0': 'o',
+    '5': 's', '$': 's',
+    '7': 't', '+': 't',
+    '2': 'z'
+})
+# '1' and '|' also stand for 'l'; tried only when the primary table misses
+LEET_TABLE_L = str.maketrans({**LEET_TABLE, ord('1'): 'l', ord('|'): 'l'})
+
+
+def _byte_table(table) -> bytes:
+    """Equivalent bytes.translate table; the bytes path is several times faster for ASCII input"""
+    byte_table = bytearray(range(256))
+    for code, replacement in table.items():
+        byte_table[code] = ord(replacement)
+    return bytes(byte_table)
+
+
+# (str table, bytes table) pairs, primary spelling first
+LEET_TABLES = ((LEET_TABLE, _byte_table(LEET_TABLE)), (LEET_TABLE_L, _byte_table(LEET_TABLE_L)))
+
+# Characters that may be prepended or appended to a base word
+AFFIX_CHARS = string.digits + string.punctuation + ' '
+# Longest prefix or suffix still treated as a variant of the base word
+MAX_AFFIX_LENGTH = 6
+# Shortest base word worth matching after stripping
+MIN_BASE_LENGTH = 4
+
+
+class BaseWordMatch(NamedTuple):
+    """A wordlist entry found inside a password, and how it was disguised"""
+    base: str
+    rank: int
+    prefix: str = ''
+    suffix: str = ''
+    leet: bool = False
+    case: bool = False
+
+    @property
+    def transformations(self) -> List[str]:
+        names = []
+        if self.case:
+            names.append('case')
+        if self.leet:
+            names.append('leet')
+        if self.prefix:
+            names.append('prefix')
+        if self.suffix:
+            names.append('suffix')
+        return names
+
+    def describe(self) -> str:
+        """Human-readable summary such as: 'password' with leetspeak, suffix '1'"""
+        details = []
+        if self.case:
+            details.append('changed case')
+        if self.leet:
+            details.append('leetspeak')
+        if self.prefix:
+            details.append(f"prefix '{self.prefix}'")
+        if self.suffix:
+            details.append(f"suffix '{self.suffix}'")
+        if not details:
+            return f"'{self.base}'"
+        return f"'{self.base}' with {', '.join(details)}"
+
+
+class DictionaryIndex:
+    """Hashed index of base words with rank, matched in O(len) per password"""
+
+    def __init__(self, words: Iterable[str]):
+        ranks = {}
+        for word in words:
+            ranks.setdefault(word.lower(), len(ranks) + 1)
+        self._set_table(ranks, frozenset(len(word) for word in ranks))
+
+    @classmethod
+    def from_artifact(cls, path: str) -> 'DictionaryIndex':
+        """Index backed by a prebuilt wordlist artifact, probed in place instead of loaded"""
+        from wordlist_artifact import WordlistArtifact
+        artifact = WordlistArtifact(path)
+        index = cls.__new__(cls)
+        index._set_table(artifact, artifact.word_lengths)
+        return index
+
+    def _set_table(self, ranks, word_lengths: frozenset):
+        # ranks maps a normalized word to its rank: a dict, or anything with get() and __len__
+        self._ranks = ranks
+        self._word_lengths = word_lengths
+        self._longest_word = max(word_lengths, default=0)
+
+    @property
+    def words(self) -> frozenset:
+        return frozenset(self._ranks)
+
+    def __len__(self) -> int:
+        return len(self._ranks)
+
+    def __contains__(self, lowered: str) -> bool:
+        return self.lookup(lowered) is not None
+
+    def rank(self, word: str) -> Optional[int]:
+        return self._ranks.get(word)
+
+    def lookup(self, lowered: str) -> Optional[BaseWordMatch]:
+        """Find the wordlist entry behind an already lowercased password"""
+        ranks = self._ranks
+        rank = ranks.get(lowered)
+        if rank is not None:
+            return BaseWordMatch(lowered, rank)
+
+        # Translation commutes with slicing, so each spelling is translated once for every candidate core
+        spellings = [(lowered, False)]
+        is_ascii = lowered.isascii()
+        for table, byte_table in LEET_TABLES:
+            if is_ascii:
+                deleeted = lowered.encode('ascii').translate(byte_table).decode('ascii')
+            else:
+                deleeted = lowered.translate(table)
+            if deleeted != spellings[-1][0] and deleeted != lowered:
+                rank = ranks.get(deleeted)
+                if rank is not None:
+                    return BaseWordMatch(deleeted, rank, leet=True)
+                spellings.append((deleeted, True))
+
+        # Peel digit/symbol affixes off either end; entries that are themselves digits keep their own
+        length = len(lowered)
+        leading = min(length - len(lowered.lstrip(AFFIX_CHARS)), MAX_AFFIX_LENGTH)
+        trailing = min(length - len(lowered.rstrip(AFFIX_CHARS)), MAX_AFFIX_LENGTH)
+        if length - leading - trailing > self._longest_word:
+            return None
+        word_lengths = self._word_lengths
+        for prefix_length in range(leading + 1):
+            for suffix_length in range(trailing + 1):
+                end = length - suffix_length
+                if end - prefix_length < MIN_BASE_LENGTH:
+                    break
+                if not (prefix_length or suffix_length) or end - prefix_length not in word_lengths:
+                    continue
+                for spelling, leet in spellings:
+                    core = spelling[prefix_length:end]
+                    rank = ranks.get(core)
+                    if rank is not None:
+                        return BaseWordMatch(core, rank, lowered[:prefix_length], lowered[end:], leet=leet)
+        return None
+
+    def match(self, password: str) -> Optional[BaseWordMatch]:
+        """Find the wordlist entry behind a password, noting any case change"""
+        lowered = password.lower()
+        found = self.lookup(lowered)
+        if found is not None and lowered != password:
+            found = found._replace(case=True)
+        return found
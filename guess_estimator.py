@@ -0,0 +1,347 @@
+"""
+Guess-number estimation in the style of zxcvbn
+Scores every pattern and dictionary match by how many guesses an attacker needs to reach it,
+then finds the cheapest way to cover the password with a dynamic program over match end positions
+Usage: python guess_estimator.py [PASSWORD ...] [--benchmark N]
+"""
+
+import argparse
+import datetime
+import math
+import random
+import string
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from password_analyzer import (ALPHA_SEQUENCE, COMMON_WORDS, DATE, KEYBOARD, KEYBOARD_PATTERNS, NUMERIC_SEQUENCE,
+                               REPEAT, YEAR, AnalysisContext, PasswordAnalyzer, PatternScan, lowered_origin)
+from pattern_matcher import Match, PatternMatcher
+
+DICTIONARY = 'dictionary'
+BRUTEFORCE = 'bruteforce'
+
+# Guesses per character not covered by any match
+BRUTEFORCE_CARDINALITY = 10
+# Floor for a match that is only part of the password, so splitting into many tiny matches never wins
+MIN_SUBMATCH_GUESSES = 50
+# Only this many leading characters are decomposed; the rest are costed as bruteforce
+MAX_ESTIMATE_LENGTH = 100
+
+# Years close to the present are guessed first
+REFERENCE_YEAR = datetime.date.today().year
+MIN_YEAR_SPACE = 20
+# Month/day pairs (MMDD)
+DATE_GUESSES = 366
+
+# Keyboard walks: starting keys and average neighbours per key on a QWERTY layout
+KEYBOARD_STARTING_POSITIONS = 94
+KEYBOARD_AVERAGE_DEGREE = 4.6
+# Direction changes in each detected walk; straight rows have one
+KEYBOARD_TURNS = {'qazws': 2}
+
+# Sequences starting at an obvious character are tried first
+OBVIOUS_SEQUENCE_STARTS = frozenset('az019')
+
+
+class Step(NamedTuple):
+    """One piece of the cheapest decomposition: [start, end) span, its kind and guesses"""
+    start: int
+    end: int
+    pattern: str
+    token: str
+    guesses_log10: float
+
+
+class GuessEstimate:
+    """Estimated guesses needed to crack a password, with the decomposition that produced it"""
+
+    __slots__ = ('guesses_log10', 'sequence', 'truncated')
+
+    def __init__(self, guesses_log10: float, sequence: List[Step], truncated: bool = False):
+        self.guesses_log10 = guesses_log10
+        self.sequence = sequence
+        self.truncated = truncated
+
+    @property
+    def guesses(self) -> float:
+        try:
+            return 10 ** self.guesses_log10
+        except OverflowError:
+            return math.inf
+
+    @property
+    def bits(self) -> float:
+        """Equivalent entropy in bits (log2 of the guess count)"""
+        return self.guesses_log10 * math.log2(10)
+
+    def to_dict(self) -> Dict:
+        return {
+            'guesses_log10': round(self.guesses_log10, 3),
+            'bits': round(self.bits, 2),
+            'truncated': self.truncated,
+            'sequence': [step._asdict() for step in self.sequence]
+        }
+
+    def __repr__(self) -> str:
+        return f"GuessEstimate(guesses_log10={self.guesses_log10:.3f}, steps={len(self.sequence)})"
+
+
+def keyboard_guesses(length: int, turns: int) -> float:
+    """Walks of this length with at most this many turns, from any starting key (zxcvbn spatial count)"""
+    guesses = 0.0
+    for walk_length in range(2, length + 1):
+        for turn_count in range(1, min(turns, walk_length - 1) + 1):
+            guesses += (math.comb(walk_length - 1, turn_count - 1) * KEYBOARD_STARTING_POSITIONS
+                        * KEYBOARD_AVERAGE_DEGREE ** turn_count)
+    return guesses
+
+
+# Precomputed once; detected walks come from a fixed list
+KEYBOARD_GUESSES = {pattern: keyboard_guesses(len(pattern), KEYBOARD_TURNS.get(pattern, 1))
+                    for pattern in KEYBOARD_PATTERNS}
+
+
+def uppercase_variations(token: str) -> int:
+    """Capitalization variants an attacker tries before reaching this one"""
+    if token.islower() or not any(ch.isupper() for ch in token):
+        return 1
+    # Capitalized, trailing capital or all caps are tried first
+    if token.isupper() or (token[0].isupper() and token[1:].islower()) or (
+            token[-1].isupper() and token[:-1].islower()):
+        return 2
+    upper = sum(1 for ch in token if ch.isupper())
+    lower = sum(1 for ch in token if ch.islower())
+    return sum(math.comb(upper + lower, count) for count in range(1, min(upper, lower) + 1))
+
+
+def _character_cardinality(ch: str) -> int:
+    if ch.isdigit():
+        return 10
+    if ch.isalpha():
+        return 26
+    return 33
+
+
+@lru_cache(maxsize=None)
+def dictionary_ranks() -> Dict[str, int]:
+    """Rank table for the built-in wordlist; lower ranks are guessed first"""
+    from common_passwords import RANKED_PASSWORDS
+    ranks = {}
+    for word in list(RANKED_PASSWORDS) + list(COMMON_WORDS):
+        ranks.setdefault(word, len(ranks) + 1)
+    return ranks
+
+
+@lru_cache(maxsize=None)
+def dictionary_matcher() -> PatternMatcher:
+    """Automaton over every ranked word, built on first use"""
+    return PatternMatcher((word, DICTIONARY) for word in dictionary_ranks())
+
+
+class GuessEstimator:
+    """Minimum-guess decomposition over pattern and dictionary matches"""
+
+    def __init__(self, max_length: int = MAX_ESTIMATE_LENGTH):
+        self.max_length = max_length
+        self.ranks = dictionary_ranks()
+        self.matcher = dictionary_matcher()
+
+    def estimate(self, password: str, scan: Optional[PatternScan] = None) -> GuessEstimate:
+        """Estimate guesses for password, reusing an existing scan of it when given"""
+        if not password:
+            return GuessEstimate(0.0, [])
+        truncated = len(password) > self.max_length
+        if truncated:
+            tail_length = len(password) - self.max_length
+            password = password[:self.max_length]
+            scan = None
+        if scan is None:
+            scan = PatternScan(password)
+
+        length = len(password)
+        candidates = self._candidates(scan, password)
+
+        # best[i] is the fewest guesses (log10) covering the first i characters
+        bruteforce_cost = math.log10(BRUTEFORCE_CARDINALITY)
+        best = [0.0] * (length + 1)
+        back: List[Optional[Step]] = [None] * (length + 1)
+        for end in range(1, length + 1):
+            best[end] = best[end - 1] + bruteforce_cost
+            back[end] = None
+            for step in candidates[end]:
+                cost = best[step.start] + step.guesses_log10
+                if cost < best[end]:
+                    best[end] = cost
+                    back[end] = step
+
+        guesses_log10 = best[length]
+        sequence = self._unwind(password, back, bruteforce_cost)
+        if truncated:
+            guesses_log10 += tail_length * bruteforce_cost
+        return GuessEstimate(guesses_log10, sequence, truncated)
+
+    def _candidates(self, scan: PatternScan, password: str) -> List[List[Step]]:
+        """Score every match, grouped by end position"""
+        length = len(password)
+        by_end: List[List[Step]] = [[] for _ in range(length + 1)]
+        # Dictionary matches index the lowered text, which is longer than the password when lowering
+        # expands a character ('İ'); PatternScan has already moved its own matches onto the password
+        origin = lowered_origin(password) if len(scan.lowered) != length else None
+
+        def span(match):
+            if origin is None:
+                return match.start, match.end
+            return origin[match.start], origin[match.end - 1] + 1
+
+        def add(start, end, pattern, token, guesses):
+            if end - start < length:
+                guesses = max(guesses, MIN_SUBMATCH_GUESSES)
+            by_end[end].append(Step(start, end, pattern, token, math.log10(max(guesses, 1))))
+
+        for match in self.matcher.iter_matches(scan.lowered):
+            start, end = span(match)
+            guesses = self.ranks[match.token] * uppercase_variations(password[start:end])
+            add(start, end, DICTIONARY, match.token, guesses)
+
+        sequence_hits = []
+        for match in scan.matches:
+            category = match.category
+            if category == KEYBOARD:
+                add(match.start, match.end, KEYBOARD, match.token, KEYBOARD_GUESSES[match.token])
+            elif category == REPEAT:
+                add(match.start, match.end, REPEAT, match.token,
+                    _character_cardinality(match.token[0]) * len(match.token))
+            elif category == YEAR:
+                add(match.start, match.end, YEAR, match.token,
+                    max(abs(int(match.token) - REFERENCE_YEAR), MIN_YEAR_SPACE))
+            elif category == DATE:
+                add(match.start, match.end, DATE, match.token, DATE_GUESSES)
+            elif category in (ALPHA_SEQUENCE, NUMERIC_SEQUENCE):
+                sequence_hits.append(match)
+
+        for run in self._sequence_runs(sequence_hits):
+            first = run.token[0]
+            base = 4 if first in OBVIOUS_SEQUENCE_STARTS else (10 if first.isdigit() else 26)
+            add(run.start, run.end, run.category, run.token, base * len(run.token))
+        return by_end
+
+    @staticmethod
+    def _sequence_runs(hits: List[Match]) -> List[Match]:
+        """Each three-character sequence hit, plus the maximal runs formed by overlapping hits"""
+        runs = list(hits)
+        hits = sorted(hits)
+        index = 0
+        while index < len(hits):
+            first = hits[index]
+            end = first.end
+            token = first.token
+            while index + 1 < len(hits) and hits[index + 1].start == end - 2 and hits[index + 1].category == first.category:
+                index += 1
+                end = hits[index].end
+                # Each overlapping hit extends the run by its last character
+                token += hits[index].token[-1]
+            if end - first.start > 3:
+                runs.append(Match(first.start, end, first.category, token))
+            index += 1
+        return runs
+
+    @staticmethod
+    def _unwind(password: str, back: List[Optional[Step]], bruteforce_cost: float) -> List[Step]:
+        """Recover the chosen steps, merging adjacent bruteforce characters"""
+        steps = []
+        end = len(password)
+        while end > 0:
+            step = back[end]
+            if step is not None:
+                steps.append(step)
+                end = step.start
+                continue
+            start = end
+            while start > 0 and back[start] is None:
+                start -= 1
+            steps.append(Step(start, end, BRUTEFORCE, password[start:end], (end - start) * bruteforce_cost))
+            end = start
+        steps.reverse()
+        return steps
+
+
+@lru_cache(maxsize=None)
+def guess_estimator() -> GuessEstimator:
+    """Process-wide estimator, built on first use"""
+    return GuessEstimator()
+
+
+def _benchmark_corpus(count: int, seed: int = 0) -> List[str]:
+    """Deterministic mix of random strings and word-plus-affix passwords"""
+    rng = random.Random(seed)
+    words = list(dictionary_ranks())
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+    corpus = []
+    for index in range(count):
+        if index % 2:
+            corpus.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(6, 20))))
+        else:
+            corpus.append(rng.choice(words).capitalize() + str(rng.randint(1950, 2030)) + rng.choice('!@#$'))
+    return corpus
+
+
+def benchmark(count: int = 10000) -> Dict[str, float]:
+    """Per-password cost of the guess estimate against the span-penalty entropy, in microseconds"""
+    corpus = _benchmark_corpus(count)
+    analyzer = PasswordAnalyzer()
+    estimator = guess_estimator()
+    contexts = [AnalysisContext(password) for password in corpus]
+
+    started = time.perf_counter()
+    for context in contexts:
+        analyzer._calculate_entropy(context)
+    entropy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for password, context in zip(corpus, contexts):
+        estimator.estimate(password, context)
+    estimate_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for password in corpus:
+        estimator.estimate(password)
+    standalone_seconds = time.perf_counter() - started
+
+    long_input = ''.join(random.Random(1).choice(string.printable) for _ in range(100_000))
+    started = time.perf_counter()
+    estimator.estimate(long_input)
+    long_seconds = time.perf_counter() - started
+
+    return {
+        'passwords': count,
+        'entropy_us': entropy_seconds / count * 1e6,
+        'estimate_shared_scan_us': estimate_seconds / count * 1e6,
+        'estimate_us': standalone_seconds / count * 1e6,
+        'estimate_100k_chars_us': long_seconds * 1e6
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Estimate guesses needed to crack passwords")
+    parser.add_argument('passwords', nargs='*', help="passwords to estimate")
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help="time N synthetic passwords against the entropy calculation")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        for name, value in benchmark(args.benchmark).items():
+            print(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}")
+    analyzer = PasswordAnalyzer()
+    for password in args.passwords:
+        estimate = guess_estimator().estimate(password)
+        entropy = analyzer.analyze(password).entropy
+        steps = ' + '.join(f"{step.pattern}({step.token})" for step in estimate.sequence)
+        print(f"{password}: 10^{estimate.guesses_log10:.2f} guesses ({estimate.bits:.1f} bits, "
+              f"entropy {entropy:.1f} bits) = {steps}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,417 @@
+"""
+Hashed-credential audit against precomputed tables of weak passwords
+For defensive audits of your own directory exports: hashes the built-in common-password list and its usual
+variants once per unsalted algorithm (NTLM, SHA-1), persists the sorted digests for memory-mapped reuse,
+then joins a hash dump against them in sorted batches and reports accounts using a known weak password
+together with that password's analysis
+Usage: python hash_audit.py build TABLE --algorithm ntlm|sha1 [--wordlist FILE ...] [--no-variants]
+       python hash_audit.py audit DUMP --table TABLE [--table TABLE ...] [-o REPORT] [--format jsonl|csv]
+
+Dump lines may be pwdump (user:rid:lm:nt:::), user:hexdigest, or user:{SHA}base64 (LDAP); the algorithm
+is taken from the digest length or scheme.
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+import numpy as np
+
+from password_analyzer import AnalysisResult, PasswordAnalyzer, mask_password
+
+MAGIC = b'PWHASHT1'
+FORMAT_VERSION = 1
+# magic, version, digest size, algorithm, entry count, candidate count, candidate blob offset, blob size
+HEADER = struct.Struct('<8sHH8sQQQQ')
+CANDIDATE_INDEX = struct.Struct('<I')
+CANDIDATE_OFFSET = struct.Struct('<Q')
+
+DIGEST_SIZES = {'ntlm': 16, 'sha1': 20}
+DEFAULT_BATCH_SIZE = 200_000
+
+# Variants a user typically makes of a listed password; prefixes are left to the wordlists
+VARIANT_SUFFIXES = ('', '!', '1', '12', '123', '1234', '12345', '1!', '123!', '@', '#', '$', '?', '.', '01', '007',
+                    '69', '99', *(str(year) for year in range(1970, 2031)))
+LEET_VARIANTS = (str.maketrans({'a': '@', 'e': '3', 'i': '1', 'o': '0'}),
+                 str.maketrans({'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$'}),
+                 str.maketrans({'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5'}))
+
+
+def _md4_fallback(data: bytes) -> bytes:
+    """MD4 (RFC 1320) in pure Python, for OpenSSL builds that no longer provide it"""
+    def rotate(value, shift):
+        value &= 0xFFFFFFFF
+        return (value << shift | value >> (32 - shift)) & 0xFFFFFFFF
+
+    length_bits = len(data) * 8 & 0xFFFFFFFFFFFFFFFF
+    data += b'\x80' + b'\x00' * ((55 - len(data)) % 64) + struct.pack('<Q', length_bits)
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+    for offset in range(0, len(data), 64):
+        x = struct.unpack_from('<16I', data, offset)
+        aa, bb, cc, dd = a, b, c, d
+        # Round 1: F(x, y, z) = xy | ~xz
+        for index in range(16):
+            s = (3, 7, 11, 19)[index % 4]
+            f = (b & c) | (~b & d)
+            a, b, c, d = d, rotate(a + f + x[index], s), b, c
+        # Round 2: G(x, y, z) = xy | xz | yz, constant sqrt(2)
+        for index in range(16):
+            k = (index % 4) * 4 + index // 4
+            s = (3, 5, 9, 13)[index % 4]
+            g = (b & c) | (b & d) | (c & d)
+            a, b, c, d = d, rotate(a + g + x[k] + 0x5A827999, s), b, c
+        # Round 3: H(x, y, z) = x ^ y ^ z, constant sqrt(3)
+        for index in range(16):
+            k = (0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15)[index]
+            s = (3, 9, 11, 15)[index % 4]
+            a, b, c, d = d, rotate(a + (b ^ c ^ d) + x[k] + 0x6ED9EBA1, s), b, c
+        a = (a + aa) & 0xFFFFFFFF
+        b = (b + bb) & 0xFFFFFFFF
+        c = (c + cc) & 0xFFFFFFFF
+        d = (d + dd) & 0xFFFFFFFF
+    return struct.pack('<4I', a, b, c, d)
+
+
+def _md4_function():
+    try:
+        hashlib.new('md4', b'')
+    except ValueError:
+        return _md4_fallback
+    return lambda data: hashlib.new('md4', data).digest()
+
+
+md4_digest = _md4_function()
+
+
+def _encode(password: str, encoding: str) -> bytes:
+    # Lone surrogates from surrogateescape-decoded wordlists are kept rather than rejected
+    errors = 'surrogatepass' if encoding == 'utf-16-le' else 'surrogateescape'
+    try:
+        return password.encode(encoding, errors)
+    except UnicodeEncodeError:
+        return password.encode(encoding, 'surrogatepass')
+
+
+def ntlm_hash(password: str) -> bytes:
+    """NT hash: MD4 of the UTF-16LE password"""
+    return md4_digest(_encode(password, 'utf-16-le'))
+
+
+def sha1_hash(password: str) -> bytes:
+    """Unsalted SHA-1 of the UTF-8 password"""
+    return hashlib.sha1(_encode(password, 'utf-8')).digest()
+
+
+HASHERS = {'ntlm': ntlm_hash, 'sha1': sha1_hash}
+
+
+def expand_variants(word: str) -> Iterator[str]:
+    """The word in lower, capitalized and upper case, plain and leetspeak, with common suffixes"""
+    lowered = word.lower()
+    bases = [lowered, lowered.capitalize(), lowered.upper()]
+    for table in LEET_VARIANTS:
+        leet = lowered.translate(table)
+        if leet != lowered:
+            bases += [leet, leet[:1].upper() + leet[1:]]
+    for base in dict.fromkeys(bases):
+        for suffix in VARIANT_SUFFIXES:
+            yield base + suffix
+
+
+def candidate_passwords(words: Iterable[str], variants: bool = True) -> List[str]:
+    """Distinct candidates in first-seen order, so earlier (more common) words keep the lower index"""
+    candidates = {}
+    for word in words:
+        if variants:
+            for candidate in expand_variants(word):
+                candidates.setdefault(candidate, None)
+        else:
+            candidates.setdefault(word, None)
+    return list(candidates)
+
+
+def build_table(candidates: List[str], path: str, algorithm: str) -> int:
+    """Hash every candidate, sort by digest and write the table; returns the entry count"""
+    if algorithm not in HASHERS:
+        raise ValueError(f"Unknown algorithm: {algorithm} (choose from {', '.join(HASHERS)})")
+    if len(candidates) >= 1 << 32:
+        raise ValueError("Too many candidates for one table")
+    hasher = HASHERS[algorithm]
+    digest_size = DIGEST_SIZES[algorithm]
+    # Identical digests keep the first (most common) candidate
+    entries = {}
+    for index, candidate in enumerate(candidates):
+        entries.setdefault(hasher(candidate), index)
+    ordered = sorted(entries.items())
+
+    blob = [_encode(candidate, 'utf-8') for candidate in candidates]
+    offsets = [0]
+    for encoded in blob:
+        offsets.append(offsets[-1] + len(encoded))
+    entries_size = len(ordered) * (digest_size + CANDIDATE_INDEX.size)
+    blob_offset = HEADER.size + entries_size + len(offsets) * CANDIDATE_OFFSET.size
+
+    partial_path = path + '.partial'
+    with open(partial_path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest_size, algorithm.encode('ascii'), len(ordered),
+                                 len(candidates), blob_offset, offsets[-1]))
+        output.write(b''.join(digest + CANDIDATE_INDEX.pack(index) for digest, index in ordered))
+        output.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        output.write(b''.join(blob))
+    os.replace(partial_path, path)
+    return len(ordered)
+
+
+class HashTable:
+    """Read-only, memory-mapped digest table; lookups take whole sorted batches"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a hash table (file too short)")
+        (magic, version, digest_size, algorithm, count, candidate_count, blob_offset,
+         blob_size) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a hash table (bad magic)")
+        if version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} has unsupported table version {version}")
+        if len(self._mmap) != blob_offset + blob_size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self.algorithm = algorithm.rstrip(b'\x00').decode('ascii')
+        self.digest_size = digest_size
+        self.count = count
+        self.candidate_count = candidate_count
+        self._blob_offset = blob_offset
+        # Views straight onto the mapping; nothing is copied until a batch is looked up
+        entry_type = np.dtype([('digest', f'S{digest_size}'), ('candidate', '<u4')])
+        entries = np.frombuffer(self._mmap, dtype=entry_type, count=count, offset=HEADER.size)
+        self._digests = entries['digest']
+        self._candidates = entries['candidate']
+        self._offsets = np.frombuffer(self._mmap, dtype='<u8', count=candidate_count + 1,
+                                      offset=HEADER.size + count * entry_type.itemsize)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def candidate(self, index: int) -> str:
+        start = self._blob_offset + int(self._offsets[index])
+        end = self._blob_offset + int(self._offsets[index + 1])
+        return self._mmap[start:end].decode('utf-8', 'surrogateescape')
+
+    def lookup_batch(self, digests: List[bytes]) -> List[Optional[int]]:
+        """Candidate index for each digest, or None; the batch is sorted once and merged into the table"""
+        if not digests:
+            return []
+        probe = np.array(digests, dtype=f'S{self.digest_size}')
+        order = np.argsort(probe, kind='stable')
+        sorted_probe = probe[order]
+        positions = np.searchsorted(self._digests, sorted_probe)
+        found = positions < self.count
+        found[found] = self._digests[positions[found]] == sorted_probe[found]
+        matches: List[Optional[int]] = [None] * len(digests)
+        for row, position in zip(order[found].tolist(), positions[found].tolist()):
+            matches[row] = int(self._candidates[position])
+        return matches
+
+    def close(self):
+        # Drop the array views first; an mmap with exported buffers cannot close
+        self._digests = self._candidates = self._offsets = None
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DumpRecord(NamedTuple):
+    account: str
+    algorithm: str
+    digest: bytes
+
+
+class WeakAccount(NamedTuple):
+    account: str
+    algorithm: str
+    password: str
+    analysis: AnalysisResult
+
+
+def _algorithm_for(digest: bytes) -> Optional[str]:
+    for algorithm, size in DIGEST_SIZES.items():
+        if len(digest) == size:
+            return algorithm
+    return None
+
+
+def parse_dump_line(line: str) -> Optional[DumpRecord]:
+    """Parse pwdump, user:hex or user:{SHA}base64; None for lines without a supported hash"""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    fields = line.split(':')
+    if len(fields) < 2:
+        return None
+    account = fields[0]
+    if len(fields) >= 4 and len(fields[3]) == 32:
+        # pwdump: user:rid:lmhash:nthash:::
+        value = fields[3]
+    else:
+        value = fields[1]
+    try:
+        if value[:5].upper() == '{SHA}':
+            digest = base64.b64decode(value[5:], validate=True)
+            return DumpRecord(account, 'sha1', digest) if len(digest) == 20 else None
+        digest = binascii.unhexlify(value)
+    except (binascii.Error, ValueError):
+        return None
+    algorithm = _algorithm_for(digest)
+    return DumpRecord(account, algorithm, digest) if algorithm else None
+
+
+def audit_dump(lines: Iterable[str], tables: Dict[str, HashTable], analyzer: PasswordAnalyzer,
+               batch_size: int = DEFAULT_BATCH_SIZE, counts: Optional[Dict[str, int]] = None) -> Iterator[WeakAccount]:
+    """Join dump lines against the tables batch by batch, yielding accounts whose hash is a known password
+
+    counts, if given, is filled with records read, weak accounts, and lines skipped
+    (unparseable or for an algorithm without a table).
+    """
+    if counts is None:
+        counts = {}
+    for key in ('records', 'weak', 'skipped'):
+        counts.setdefault(key, 0)
+    analyses: Dict[Tuple[str, int], AnalysisResult] = {}
+    batches: Dict[str, List[DumpRecord]] = {algorithm: [] for algorithm in tables}
+
+    def flush(algorithm: str) -> Iterator[WeakAccount]:
+        batch = batches[algorithm]
+        table = tables[algorithm]
+        for record, index in zip(batch, table.lookup_batch([record.digest for record in batch])):
+            if index is None:
+                continue
+            # Accounts sharing a password share one analysis
+            key = (algorithm, index)
+            password = table.candidate(index)
+            analysis = analyses.get(key)
+            if analysis is None:
+                analysis = analyses[key] = analyzer.analyze(password)
+            counts['weak'] += 1
+            yield WeakAccount(record.account, algorithm, password, analysis)
+        batch.clear()
+
+    for line in lines:
+        record = parse_dump_line(line)
+        if record is None or record.algorithm not in batches:
+            counts['skipped'] += 1
+            continue
+        counts['records'] += 1
+        batches[record.algorithm].append(record)
+        if len(batches[record.algorithm]) >= batch_size:
+            yield from flush(record.algorithm)
+    for algorithm in batches:
+        yield from flush(algorithm)
+
+
+REPORT_FIELDS = ['account', 'algorithm', 'password', 'score', 'entropy', 'is_common', 'issues']
+
+
+def report_row(weak: WeakAccount, show_passwords: bool = False, nested: bool = False) -> Dict:
+    """Report row for one weak account; nested carries the full analyze_password dict instead of flat columns"""
+    row = {
+        'account': weak.account,
+        'algorithm': weak.algorithm,
+        'password': weak.password if show_passwords else mask_password(weak.password)
+    }
+    analysis = weak.analysis
+    if nested:
+        row['analysis'] = analysis.to_dict()
+        return row
+    row.update({
+        'score': analysis.score,
+        'entropy': round(analysis.entropy, 2),
+        'is_common': analysis.is_common,
+        'issues': '; '.join(analysis.issues)
+    })
+    return row
+
+
+def _builtin_words() -> List[str]:
+    from common_passwords import RANKED_PASSWORDS
+    return RANKED_PASSWORDS
+
+
+def main(argv=None) -> int:
+    from batch_export import WRITERS
+    from breach_index import iter_wordlist
+
+    parser = argparse.ArgumentParser(description="Audit unsalted password hashes against known weak passwords")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="precompute a digest table for one algorithm")
+    build.add_argument('table', help="output table path")
+    build.add_argument('--algorithm', choices=sorted(HASHERS), required=True)
+    build.add_argument('--wordlist', action='append', default=[],
+                       help="extra newline-delimited passwords, after the built-in list (repeatable)")
+    build.add_argument('--no-variants', action='store_true', help="hash the words only, without case/leet/suffixes")
+    audit = commands.add_parser('audit', help="join a hash dump against precomputed tables")
+    audit.add_argument('dump', help="hash dump file, or - for stdin")
+    audit.add_argument('--table', action='append', required=True, help="table built with 'build' (repeatable)")
+    audit.add_argument('-o', '--output', default='-', help="report file, or - for stdout (default)")
+    audit.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl',
+                       help="report format (default: %(default)s)")
+    audit.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                       help="dump records sorted and joined per batch (default: %(default)s)")
+    audit.add_argument('--show-passwords', action='store_true', help="report recovered passwords unmasked")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        words = _builtin_words() + [word for path in args.wordlist for word in iter_wordlist(path)]
+        candidates = candidate_passwords(words, variants=not args.no_variants)
+        count = build_table(candidates, args.table, args.algorithm)
+        print(f"Wrote {count} {args.algorithm} digests for {len(candidates)} candidates to {args.table}",
+              file=sys.stderr)
+        return 0
+
+    tables = {}
+    try:
+        for path in args.table:
+            table = HashTable(path)
+            tables[table.algorithm] = table
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    source: TextIO = sys.stdin if args.dump == '-' else open(args.dump, 'r', encoding='utf-8', errors='replace')
+    sink: TextIO = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    counts: Dict[str, int] = {}
+    try:
+        writer = WRITERS[args.format](sink, REPORT_FIELDS)
+        nested = args.format == 'jsonl'
+        for weak in audit_dump(source, tables, PasswordAnalyzer(), args.batch_size, counts):
+            writer.write(report_row(weak, args.show_passwords, nested))
+        writer.close()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        for table in tables.values():
+            table.close()
+    print(f"{counts['weak']} of {counts['records']} accounts use a known weak password "
+          f"({counts['skipped']} lines skipped)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Fuzz and benchmark harness for hostile password inputs
+Times every detector against adversarial shapes (long repeats, dense sequences, back-to-back years and dates,
+affix walls, case-expanding Unicode) at growing sizes and reports worst-case latency per KB, checks that
+cost per KB stays flat (linear time), that bounded-cost mode caps latency regardless of input size,
+and that bounded mode leaves results for normal-length inputs unchanged
+Usage: python hostile_inputs.py [--sizes 1,16,256,1024] [--fuzz 200] [--max-growth 3.0] [--bounded-budget-ms 50]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from typing import Callable, Dict, List, Sequence
+
+from password_analyzer import DEFAULT_ANALYSIS_LENGTH, PasswordAnalyzer
+
+DEFAULT_SIZES_KB = (1, 16, 256, 1024)
+DEFAULT_FUZZ_ITERATIONS = 200
+DEFAULT_SEED = 1234
+# Largest allowed ratio of per-KB cost at the biggest size to the smallest; linear code stays near 1
+DEFAULT_MAX_GROWTH = 3.0
+# Worst acceptable latency for any input once bounded-cost mode is on
+DEFAULT_BOUNDED_BUDGET_MS = 50.0
+
+
+def _cycle(unit: str) -> Callable[[int], str]:
+    return lambda size: (unit * (size // len(unit) + 1))[:size]
+
+
+# Adversarial shapes, each aimed at one detector
+SHAPES: Dict[str, Callable[[int], str]] = {
+    'repeat_run': _cycle('a'),
+    'repeat_pairs': _cycle('aab'),
+    'alpha_sequence': _cycle(string.ascii_lowercase),
+    'numeric_sequence': _cycle('1234567890'),
+    'keyboard_walk': _cycle('qwertasdfzxcv'),
+    'years': _cycle('1990'),
+    'dates': _cycle('1212'),
+    'common_words': _cycle('passwordadminloginsecret'),
+    'leet_words': _cycle('p@55w0rd'),
+    'affix_wall': lambda size: '!' * (size // 2) + 'password' + '1' * (size - size // 2 - 8),
+    'case_expanding': _cycle('İ'),
+    'newlines': _cycle('\n'),
+    'random': lambda size: ''.join(random.Random(size).choices(string.printable, k=size))
+}
+
+# Building blocks for fuzzed inputs
+FRAGMENTS = ('aaa', 'abc', 'xyz', '123', '890', 'qwert', 'asdf', 'zxcv', '12345', 'qazws', '1999', '2024',
+             '0101', '1231', 'password', 'admin', 'p@55', '!', '@', '3', '1', 'İ', 'ß', '\n', ' ')
+
+
+def fuzz_input(rng: random.Random, size: int) -> str:
+    """Random mix of detector-triggering fragments and noise, exactly size characters long"""
+    parts = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.7:
+            fragment = rng.choice(FRAGMENTS) * rng.randint(1, 8)
+        else:
+            fragment = ''.join(rng.choices(string.printable, k=rng.randint(1, 16)))
+        parts.append(fragment)
+        total += len(fragment)
+    return ''.join(parts)[:size]
+
+
+def _seconds(analyzer: PasswordAnalyzer, password: str, repeat: int = 1) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        analyzer.analyze(password)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def per_kb_latency(analyzer: PasswordAnalyzer, sizes_kb: Sequence[int]) -> Dict[str, List[float]]:
+    """Microseconds per KB for every shape at every size"""
+    table = {}
+    for name, shape in SHAPES.items():
+        row = []
+        for size_kb in sizes_kb:
+            password = shape(size_kb * 1024)
+            row.append(_seconds(analyzer, password, repeat=3 if size_kb <= 16 else 1) * 1e6 / size_kb)
+        table[name] = row
+    return table
+
+
+def fuzz_worst(analyzer: PasswordAnalyzer, iterations: int, size_kb: int, seed: int) -> Dict:
+    """Worst per-KB latency over random fuzz inputs of one size"""
+    rng = random.Random(seed)
+    worst = {'us_per_kb': 0.0, 'sample': ''}
+    for _ in range(iterations):
+        password = fuzz_input(rng, size_kb * 1024)
+        us_per_kb = _seconds(analyzer, password) * 1e6 / size_kb
+        if us_per_kb > worst['us_per_kb']:
+            worst = {'us_per_kb': us_per_kb, 'sample': password[:40]}
+    return worst
+
+
+def bounded_worst_ms(analyzer: PasswordAnalyzer, size_kb: int) -> float:
+    """Slowest bounded-mode analysis across every shape at one size"""
+    return max(_seconds(analyzer, shape(size_kb * 1024)) for shape in SHAPES.values()) * 1000
+
+
+def check_unchanged(bounded: PasswordAnalyzer, plain: PasswordAnalyzer, iterations: int, seed: int) -> int:
+    """Count inputs within the analysis length whose bounded result differs from the plain one"""
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(iterations):
+        password = fuzz_input(rng, rng.randint(1, bounded.analysis_length))
+        if bounded.analyze(password) != plain.analyze(password):
+            mismatches += 1
+    return mismatches
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Worst-case latency per KB for hostile password inputs")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES_KB)),
+                        help="comma-separated input sizes in KB (default: %(default)s)")
+    parser.add_argument('--fuzz', type=int, default=DEFAULT_FUZZ_ITERATIONS,
+                        help="random fuzz inputs per check (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="fuzz seed (default: %(default)s)")
+    parser.add_argument('--max-growth', type=float, default=DEFAULT_MAX_GROWTH,
+                        help="fail when per-KB cost grows more than this between the smallest and largest size "
+                             "(default: %(default)s)")
+    parser.add_argument('--analysis-length', type=int, default=DEFAULT_ANALYSIS_LENGTH,
+                        help="prefix length for the bounded-mode checks (default: %(default)s)")
+    parser.add_argument('--bounded-budget-ms', type=float, default=DEFAULT_BOUNDED_BUDGET_MS,
+                        help="fail when any bounded-mode analysis takes longer (default: %(default)s)")
+    args = parser.parse_args(argv)
+    sizes_kb = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    plain = PasswordAnalyzer()
+    bounded = PasswordAnalyzer(analysis_length=args.analysis_length)
+    failures = []
+
+    print("Unbounded analysis, microseconds per KB")
+    print(f"{'shape':<18}" + ''.join(f"{f'{size} KB':>12}" for size in sizes_kb) + f"{'growth':>9}")
+    for name, row in per_kb_latency(plain, sizes_kb).items():
+        growth = row[-1] / row[0] if row[0] else 0.0
+        flag = '  SUPERLINEAR' if growth > args.max_growth else ''
+        print(f"{name:<18}" + ''.join(f"{value:>12.1f}" for value in row) + f"{growth:>8.2f}x{flag}")
+        if flag:
+            failures.append(f"{name} per-KB cost grew {growth:.1f}x")
+
+    fuzz_size = min(sizes_kb[-1], 64)
+    worst = fuzz_worst(plain, args.fuzz, fuzz_size, args.seed)
+    print(f"Fuzz worst case at {fuzz_size} KB: {worst['us_per_kb']:.1f} us/KB (starts {worst['sample']!r})")
+
+    bounded_ms = bounded_worst_ms(bounded, sizes_kb[-1])
+    print(f"Bounded mode (analysis_length={args.analysis_length}) worst case at {sizes_kb[-1]} KB: "
+          f"{bounded_ms:.2f} ms")
+    if bounded_ms > args.bounded_budget_ms:
+        failures.append(f"bounded mode took {bounded_ms:.1f} ms, over {args.bounded_budget_ms} ms")
+
+    mismatches = check_unchanged(bounded, plain, args.fuzz * 10, args.seed)
+    print(f"Bounded vs plain results within {args.analysis_length} characters: {mismatches} mismatch(es)")
+    if mismatches:
+        failures.append(f"{mismatches} bounded-mode result(s) changed for normal-length inputs")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
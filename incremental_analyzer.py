@@ -0,0 +1,221 @@
+"""
+Incremental password analysis for keystroke-by-keystroke scoring
+Each character pushes one frame of running scan state (automaton state, run length, class and substitution
+flags, pattern codes and covered-span count), so append and delete are O(1) and set() only replays the
+characters after the common prefix; result() equals a full PasswordAnalyzer.analyze() of the current text
+In bounded-cost mode frames stop at the analyzer's length limit and later characters are only kept as text
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from password_analyzer import (ALPHA_SEQUENCES, ALPHANUMERIC_CHARS, CATEGORY_BITS, CHARSET_SIZE_BY_FLAGS,
+                               COMMON_WORDS, DATE, DATE_RE, DICTIONARY_WORD, DIGIT_CHARS, EMPTY_RESULT, KEYBOARD,
+                               KEYBOARD_BITS, KEYBOARD_PATTERNS, LOWERCASE, LOWERCASE_CHARS, NUMBERS,
+                               NUMERIC_SEQUENCES, PATTERN_MATCHER, REPEAT, SPECIAL_CHARS, SUBSTITUTION_A,
+                               SUBSTITUTION_E, SUBSTITUTION_I, UPPERCASE, UPPERCASE_CHARS, YEAR, YEAR_RE,
+                               AnalysisContext, AnalysisResult, PasswordAnalyzer)
+
+# Flags for the spanless substitution patterns: a substitute character seen, and its letter seen
+SAW_A_SUBSTITUTE = 1
+SAW_A = 2
+SAW_E_SUBSTITUTE = 4
+SAW_E = 8
+SAW_I_SUBSTITUTE = 16
+SAW_I = 32
+SUBSTITUTE_FLAGS = {'4': SAW_A_SUBSTITUTE, '@': SAW_A_SUBSTITUTE, '3': SAW_E_SUBSTITUTE,
+                    '1': SAW_I_SUBSTITUTE, '!': SAW_I_SUBSTITUTE}
+LETTER_FLAGS = {'a': SAW_A, 'e': SAW_E, 'i': SAW_I}
+SUBSTITUTIONS = ((SAW_A_SUBSTITUTE, SAW_A, SUBSTITUTION_A), (SAW_E_SUBSTITUTE, SAW_E, SUBSTITUTION_E),
+                 (SAW_I_SUBSTITUTE, SAW_I, SUBSTITUTION_I))
+
+# Year and date hits are four characters; a run of repeats is credited three, then one at a time
+DATE_LENGTH = 4
+REPEAT_LENGTH = 3
+# Every span ends at the character that completes it, so coverage only changes within this many positions
+COVERAGE_WINDOW = max(DATE_LENGTH, REPEAT_LENGTH, *map(len, ALPHA_SEQUENCES + NUMERIC_SEQUENCES +
+                                                        KEYBOARD_PATTERNS + COMMON_WORDS))
+COVERAGE_MASK = (1 << COVERAGE_WINDOW) - 1
+
+# Frame fields, one frame per character of the current text
+STATE, RUN, CODES, FLAGS, SUBSTITUTES, DICTIONARY, WINDOW, COVERED, UNSAFE = range(9)
+EMPTY_FRAME = (PATTERN_MATCHER.ROOT, 0, 0, 0, 0, False, 0, 0, 0)
+
+
+@lru_cache(maxsize=None)
+def _state_hits(state: int) -> Tuple[int, int, bool]:
+    """Pattern codes, longest span and dictionary-word flag of the literal hits ending at an automaton state"""
+    codes = 0
+    longest = 0
+    dictionary = False
+    for length, category, literal in PATTERN_MATCHER.outputs(state):
+        if category == DICTIONARY_WORD:
+            dictionary = True
+            continue
+        codes |= KEYBOARD_BITS[literal] if category == KEYBOARD else CATEGORY_BITS[category]
+        longest = max(longest, length)
+    return codes, longest, dictionary
+
+
+class IncrementalAnalyzer:
+    """Editable password whose analysis is kept up to date one character at a time"""
+
+    def __init__(self, analyzer: Optional[PasswordAnalyzer] = None, text: str = ''):
+        self.analyzer = analyzer if analyzer is not None else PasswordAnalyzer()
+        self._chars: List[str] = []
+        self._lowered: List[str] = []
+        self._frames = [EMPTY_FRAME]
+        # Characters past the analyzer's length limit; scored through analyze(), which reads only the prefix
+        self._tail = ''
+        self._result: Optional[AnalysisResult] = None
+        if text:
+            self.set(text)
+
+    def __len__(self) -> int:
+        return len(self._chars) + len(self._tail)
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._chars) + self._tail
+
+    def _at_limit(self) -> bool:
+        limit = self.analyzer._length_limit
+        return limit is not None and len(self._chars) >= limit
+
+    def append(self, ch: str):
+        """Type one character at the end"""
+        if len(ch) != 1:
+            raise ValueError("append() takes a single character")
+        if self._tail or self._at_limit():
+            self._tail += ch
+            self._result = None
+            return
+        state, run, codes, flags, substitutes, dictionary, window, covered, unsafe = self._frames[-1]
+        chars = self._chars
+        lowered = ch.lower()
+        if len(lowered) != 1:
+            # Lowercasing changes the length, so scan offsets no longer line up with the text
+            unsafe += 1
+
+        # Literal detectors run over the lowercased text, as in the full scan
+        span = 0
+        for lowered_ch in lowered:
+            state = PATTERN_MATCHER.step(state, lowered_ch)
+            hit_codes, longest, hit_dictionary = _state_hits(state)
+            codes |= hit_codes
+            span = max(span, longest)
+            dictionary = dictionary or hit_dictionary
+
+        # Three or more of the same character (other than a newline, which '.' does not match)
+        run = run + 1 if chars and chars[-1] == ch else 1
+        if ch != '\n' and run >= REPEAT_LENGTH:
+            codes |= CATEGORY_BITS[REPEAT]
+            span = max(span, REPEAT_LENGTH if run == REPEAT_LENGTH else 1)
+
+        # Years and MMDD dates end in a digit; both patterns are checked on the last four characters
+        if ch.isdecimal() and len(chars) >= DATE_LENGTH - 1:
+            tail = ''.join(chars[1 - DATE_LENGTH:]) + ch
+            if YEAR_RE.match(tail):
+                codes |= CATEGORY_BITS[YEAR]
+                span = max(span, DATE_LENGTH)
+            if DATE_RE.match(tail):
+                codes |= CATEGORY_BITS[DATE]
+                span = max(span, DATE_LENGTH)
+
+        # Character classes
+        if ch in LOWERCASE_CHARS:
+            flags |= LOWERCASE
+        elif ch in UPPERCASE_CHARS:
+            flags |= UPPERCASE
+        elif ch in DIGIT_CHARS:
+            flags |= NUMBERS
+        elif ch not in ALPHANUMERIC_CHARS:
+            flags |= SPECIAL_CHARS
+        substitutes |= SUBSTITUTE_FLAGS.get(ch, 0) | LETTER_FLAGS.get(lowered, 0)
+
+        # Every span found here ends at this character; count only positions not already covered
+        window = window << 1 & COVERAGE_MASK
+        if span:
+            new = (1 << span) - 1
+            covered += (new & ~window).bit_count()
+            window |= new
+
+        chars.append(ch)
+        self._lowered.append(lowered)
+        self._frames.append((state, run, codes, flags, substitutes, dictionary, window, covered, unsafe))
+        self._result = None
+
+    def delete(self):
+        """Remove the last character; nothing happens when the text is empty"""
+        if self._tail:
+            self._tail = self._tail[:-1]
+            self._result = None
+        elif self._chars:
+            self._chars.pop()
+            self._lowered.pop()
+            self._frames.pop()
+            self._result = None
+
+    def set(self, text: str):
+        """Replace the text, replaying only the characters after the prefix it shares with the current text"""
+        limit = self.analyzer._length_limit
+        if limit is not None and len(text) > limit:
+            # Only the prefix gets frames, so a long paste costs no more than limit keystrokes
+            self.set(text[:limit])
+            self._tail = text[limit:]
+            self._result = None
+            return
+        if self._tail:
+            self._tail = ''
+            self._result = None
+        chars = self._chars
+        shared = min(len(chars), len(text))
+        current = ''.join(chars[:shared])
+        if current == text[:shared]:
+            keep = shared
+        else:
+            keep = next(index for index in range(shared) if current[index] != text[index])
+        for _ in range(len(chars) - keep):
+            self.delete()
+        for ch in text[keep:]:
+            self.append(ch)
+
+    def result(self) -> AnalysisResult:
+        """Analysis of the current text, identical to PasswordAnalyzer.analyze()"""
+        if self._result is None:
+            self._result = self._compute()
+        return self._result
+
+    def _compute(self) -> AnalysisResult:
+        if not self._chars:
+            return EMPTY_RESULT.copy()
+        if self._tail:
+            # Bounded-cost mode rejects or truncates, exactly as analyze() does
+            return self.analyzer.analyze(self.text)
+        frame = self._frames[-1]
+        password = ''.join(self._chars)
+        if frame[UNSAFE]:
+            return self.analyzer._analyze_uncached(password)
+
+        codes = frame[CODES]
+        unspanned = 0
+        substitutes = frame[SUBSTITUTES]
+        for substitute, letter, code in SUBSTITUTIONS:
+            if substitutes & substitute and not substitutes & letter:
+                codes |= code
+                unspanned += 1
+
+        # Fill a context with the running state; the scoring stages never read the raw match list
+        context = AnalysisContext.__new__(AnalysisContext)
+        context.password = password
+        context.lowered = ''.join(self._lowered)
+        context.length = len(password)
+        context.matches = []
+        context.pattern_codes = codes
+        context.covered_chars = min(context.length, frame[COVERED])
+        context.unspanned_patterns = unspanned
+        context.has_dictionary_word = frame[DICTIONARY]
+        context.character_flags = frame[FLAGS]
+        context.charset_size = CHARSET_SIZE_BY_FLAGS[frame[FLAGS]]
+        # The word list and breach lookups still hash the whole text, once per result
+        return self.analyzer._analyze_context(context)
@@ -0,0 +1,87 @@
+"""
+Optional per-stage timing and lookup hit-rate instrumentation for the password analyzer
+An analyzer without an Instrumentation attached runs its plain code path, so disabled cost is one attribute check
+"""
+
+import threading
+from typing import Callable, Dict, Optional
+
+# Stages of PasswordAnalyzer analysis, in execution order; 'total' covers a whole analyze() call
+STAGES = ('patterns', 'character_types', 'entropy', 'common_lookup', 'score', 'issues', 'recommendations', 'total')
+# Lookup sources reporting hits and misses
+LOOKUPS = ('analysis_cache', 'builtin_wordlist', 'prefilter', 'breach_index')
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Instrumentation:
+    """Thread-safe stage timings and lookup counters with a snapshot API and Prometheus exposition"""
+
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None):
+        # Called as callback(stage, seconds) after every recorded stage
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._stages: Dict[str, list] = {}
+        self._lookups: Dict[str, list] = {}
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+        if self.callback is not None:
+            self.callback(stage, seconds)
+
+    def record_lookup(self, source: str, hit: bool):
+        with self._lock:
+            entry = self._lookups.get(source)
+            if entry is None:
+                entry = self._lookups[source] = [0, 0]
+            entry[0 if hit else 1] += 1
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._lookups.clear()
+
+    def snapshot(self) -> Dict:
+        """Plain-data copy of every counter, safe to serialize or diff"""
+        with self._lock:
+            stages = {stage: {'count': count, 'total_seconds': total, 'mean_seconds': total / count if count else 0.0,
+                              'max_seconds': longest}
+                      for stage, (count, total, longest) in self._stages.items()}
+            lookups = {source: {'hits': hits, 'misses': misses,
+                                'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+                       for source, (hits, misses) in self._lookups.items()}
+        return {'stages': stages, 'lookups': lookups}
+
+    def prometheus_text(self, prefix: str = 'password_analyzer') -> str:
+        """Counters in the Prometheus text exposition format (version 0.0.4)"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Time spent in each analysis stage.",
+            f"# TYPE {prefix}_stage_seconds_total counter"
+        ]
+        for stage, entry in snapshot['stages'].items():
+            lines.append(f'{prefix}_stage_seconds_total{{stage="{_escape_label(stage)}"}} {entry["total_seconds"]!r}')
+        lines += [
+            f"# HELP {prefix}_stage_calls_total Calls of each analysis stage.",
+            f"# TYPE {prefix}_stage_calls_total counter"
+        ]
+        for stage, entry in snapshot['stages'].items():
+            lines.append(f'{prefix}_stage_calls_total{{stage="{_escape_label(stage)}"}} {entry["count"]}')
+        lines += [
+            f"# HELP {prefix}_lookups_total Cache and corpus lookups by result.",
+            f"# TYPE {prefix}_lookups_total counter"
+        ]
+        for source, entry in snapshot['lookups'].items():
+            label = _escape_label(source)
+            lines.append(f'{prefix}_lookups_total{{source="{label}",result="hit"}} {entry["hits"]}')
+            lines.append(f'{prefix}_lookups_total{{source="{label}",result="miss"}} {entry["misses"]}')
+        return '\n'.join(lines) + '\n'
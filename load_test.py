@@ -0,0 +1,155 @@
+"""
+Local load test for the scoring service
+Drives POST /analyze over keep-alive connections at several concurrency levels and reports
+p50/p99 latency, requests per second and 503 rejections
+Usage: python load_test.py [--url http://127.0.0.1:8000] [--concurrency 1,8,32,128] [--requests 2000] [--spawn]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+from benchmarks import CORPUS_KINDS, DEFAULT_SEED, _percentile, synthetic_corpus
+
+DEFAULT_URL = 'http://127.0.0.1:8000'
+DEFAULT_CONCURRENCY = (1, 8, 32, 128)
+DEFAULT_REQUESTS = 2000
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response and return its status code"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, path: str, bodies: List[bytes], latencies: List[float],
+                  statuses: Dict[int, int]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            request = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_level(url: str, concurrency: int, passwords: List[str]) -> Dict:
+    """Send every password once, split across `concurrency` connections each with one request in flight"""
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = (parts.path.rstrip('/') or '') + '/analyze'
+    bodies = [json.dumps({'password': password}).encode('utf-8') for password in passwords]
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, path, bodies[index::concurrency], latencies, statuses)
+                           for index in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': _percentile(latencies, 0.5) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'ok': statuses.get(200, 0),
+        'rejected': statuses.get(503, 0),
+        'other_errors': sum(count for status, count in statuses.items() if status not in (200, 503))
+    }
+
+
+async def _wait_for_health(host: str, port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(f"GET /health HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            status = await _read_response(reader)
+            writer.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("service did not become healthy")
+        await asyncio.sleep(0.1)
+
+
+async def run(url: str, levels: List[int], requests: int, seed: int) -> List[Dict]:
+    # Realistic short inputs; long pastes would measure analysis, not the service
+    passwords = synthetic_corpus(requests, seed, kinds=CORPUS_KINDS[:3])
+    parts = urlsplit(url)
+    await _wait_for_health(parts.hostname, parts.port or 80)
+    # Warm the connection path and analyzer caches before measuring
+    await run_level(url, 1, passwords[:50])
+    return [await run_level(url, concurrency, passwords) for concurrency in levels]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the password scoring service")
+    parser.add_argument('--url', default=DEFAULT_URL, help="service base URL (default: %(default)s)")
+    parser.add_argument('--concurrency', default=','.join(map(str, DEFAULT_CONCURRENCY)),
+                        help="comma-separated connection counts (default: %(default)s)")
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS,
+                        help="requests per concurrency level (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="corpus seed (default: %(default)s)")
+    parser.add_argument('--spawn', action='store_true', help="start service.py on the URL's port for the run")
+    parser.add_argument('--workers', type=int, default=1, help="service workers when spawning (default: %(default)s)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+
+    server = None
+    if args.spawn:
+        parts = urlsplit(args.url)
+        server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                'service.py'),
+                                   '--host', parts.hostname, '--port', str(parts.port or 80),
+                                   '--workers', str(args.workers)],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        results = asyncio.run(run(args.url, levels, args.requests, args.seed))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"{'concurrency':>11}  {'rps':>9}  {'p50 ms':>8}  {'p99 ms':>8}  {'ok':>6}  {'503':>6}  {'errors':>6}")
+    for row in results:
+        print(f"{row['concurrency']:>11}  {row['requests_per_second']:>9.1f}  {row['p50_ms']:>8.2f}  "
+              f"{row['p99_ms']:>8.2f}  {row['ok']:>6}  {row['rejected']:>6}  {row['other_errors']:>6}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
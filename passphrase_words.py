@@ -0,0 +1,185 @@
+"""
+Bundled word list for passphrase generation
+2048 distinct, lowercase, easy-to-type English words of 3 to 8 letters, so every word drawn adds exactly
+11 bits of entropy
+"""
+
+WORDS = (
+    'abbey', 'able', 'accent', 'acid', 'acorn', 'acre', 'acrobat', 'act', 'actor', 'adapt', 'add', 'admiral',
+    'adobe', 'adult', 'adverb', 'aft', 'agenda', 'agent', 'agile', 'aging', 'agree', 'ahead', 'aid', 'aim', 'air',
+    'airport', 'aisle', 'alarm', 'album', 'alcove', 'alert', 'alga', 'alibi', 'alien', 'align', 'alike', 'alive',
+    'alley', 'allow', 'alloy', 'almanac', 'almond', 'aloe', 'alpaca', 'alpine', 'alps', 'amber', 'amble', 'amid',
+    'ample', 'amulet', 'amuse', 'anchor', 'angel', 'angle', 'angler', 'ankle', 'answer', 'ant', 'anthem', 'antler',
+    'anvil', 'apart', 'apex', 'apple', 'apricot', 'april', 'apron', 'aqua', 'aquarium', 'arbor', 'arc', 'arch',
+    'archer', 'ardent', 'arena', 'argue', 'arise', 'arm', 'armor', 'aroma', 'array', 'arrival', 'arrow', 'art',
+    'artist', 'ash', 'aside', 'ask', 'aspen', 'asphalt', 'asset', 'atlas', 'atoll', 'atom', 'atrium', 'attic',
+    'audio', 'audit', 'aunt', 'auto', 'autumn', 'avenue', 'avid', 'avocado', 'avoid', 'awake', 'award', 'aware',
+    'axis', 'axle', 'baby', 'back', 'backpack', 'bacon', 'badge', 'badger', 'bag', 'bagel', 'bake', 'baker',
+    'ballad', 'balloon', 'ballroom', 'balm', 'bamboo', 'banana', 'bandit', 'banjo', 'bank', 'banner', 'banquet',
+    'bar', 'barge', 'bark', 'barley', 'barn', 'barnacle', 'baron', 'barrel', 'basalt', 'basil', 'basin', 'basket',
+    'batch', 'bath', 'baton', 'bay', 'bazaar', 'beach', 'beacon', 'bead', 'beaker', 'beam', 'bean', 'bear', 'beard',
+    'beast', 'beat', 'bed', 'bee', 'beef', 'beehive', 'beet', 'beetle', 'begin', 'bell', 'bellow', 'belt', 'bench',
+    'beret', 'berry', 'bicycle', 'bike', 'bill', 'bingo', 'birch', 'bird', 'biscuit', 'bison', 'bite', 'black',
+    'blade', 'blank', 'blanket', 'blast', 'blaze', 'blazer', 'blend', 'blender', 'blink', 'bliss', 'block', 'blond',
+    'bloom', 'blossom', 'blue', 'blush', 'board', 'boat', 'bobcat', 'body', 'bolt', 'bond', 'bone', 'bonfire',
+    'bonnet', 'bonus', 'book', 'bookcase', 'boost', 'boot', 'booth', 'border', 'boss', 'botany', 'bottle',
+    'boulder', 'bounce', 'bouquet', 'bow', 'bowl', 'box', 'bracket', 'brain', 'brake', 'branch', 'brand', 'brass',
+    'brave', 'bread', 'breeze', 'brick', 'bride', 'bridge', 'brief', 'bring', 'brisk', 'broad', 'brook', 'broom',
+    'brown', 'brownie', 'brush', 'bubble', 'bucket', 'buckle', 'buddy', 'budget', 'buffalo', 'buggy', 'bugle',
+    'build', 'bulb', 'bulk', 'bulldog', 'bumper', 'bumpy', 'bunch', 'bundle', 'bungalow', 'bunny', 'burrow',
+    'burst', 'bus', 'bush', 'butter', 'button', 'buyer', 'buzz', 'cabaret', 'cabbage', 'cabin', 'cable', 'caboose',
+    'cactus', 'cadet', 'cafe', 'cage', 'cake', 'calendar', 'calf', 'caliber', 'calm', 'camel', 'camellia', 'camera',
+    'camp', 'camper', 'canal', 'candle', 'candor', 'candy', 'cane', 'canoe', 'canopy', 'canvas', 'canyon', 'cape',
+    'car', 'caramel', 'caravan', 'card', 'cardigan', 'cardinal', 'cargo', 'carnival', 'carpet', 'carrot', 'cart',
+    'case', 'cash', 'cashew', 'cashmere', 'cast', 'castle', 'cat', 'catalog', 'catch', 'cattle', 'cave', 'cavern',
+    'cedar', 'celery', 'cell', 'cement', 'census', 'ceramic', 'cereal', 'chain', 'chair', 'chalk', 'chamber',
+    'champ', 'channel', 'chant', 'chapel', 'chapter', 'chariot', 'charm', 'chart', 'charter', 'chase', 'cheek',
+    'cheer', 'cheese', 'cheetah', 'chef', 'cherry', 'chess', 'chest', 'chestnut', 'chew', 'chick', 'chief', 'chill',
+    'chime', 'chimney', 'chimp', 'chin', 'chip', 'chipmunk', 'choir', 'chord', 'chorus', 'chowder', 'cider',
+    'cinder', 'cinema', 'cinnamon', 'circle', 'circus', 'citadel', 'citrus', 'city', 'civic', 'claim', 'clam',
+    'clamp', 'clap', 'clarinet', 'clash', 'class', 'claw', 'clay', 'clean', 'clerk', 'click', 'cliff', 'climate',
+    'climb', 'clinic', 'clip', 'clipper', 'cloak', 'clock', 'close', 'cloth', 'cloud', 'clover', 'clown', 'club',
+    'clue', 'coach', 'coal', 'coast', 'coat', 'cobalt', 'cobbler', 'cobra', 'cockpit', 'cocoa', 'coconut', 'code',
+    'coffee', 'coil', 'coin', 'cold', 'collar', 'colony', 'color', 'colt', 'column', 'comb', 'comedy', 'comet',
+    'comic', 'compass', 'concert', 'condor', 'console', 'copper', 'coral', 'cord', 'cordial', 'core', 'corn',
+    'corner', 'cornet', 'corral', 'cosmic', 'cost', 'cottage', 'cotton', 'couch', 'cougar', 'cough', 'count',
+    'course', 'court', 'cousin', 'cover', 'cow', 'cowboy', 'coyote', 'crab', 'cradle', 'craft', 'crane', 'crash',
+    'crate', 'crater', 'crawl', 'crayon', 'cream', 'credit', 'creek', 'crescent', 'crew', 'cricket', 'crimson',
+    'crisp', 'crocus', 'crop', 'cross', 'crowd', 'crown', 'crumb', 'crush', 'crust', 'crystal', 'cube', 'cuckoo',
+    'cucumber', 'cuff', 'cup', 'cupcake', 'curb', 'cure', 'curl', 'curry', 'curtain', 'curve', 'cushion', 'custard',
+    'cycle', 'cymbal', 'daffodil', 'dahlia', 'daily', 'dairy', 'daisy', 'dance', 'dancer', 'darkroom', 'dash',
+    'data', 'date', 'dawn', 'daybreak', 'deal', 'debut', 'decade', 'decimal', 'deck', 'decor', 'decoy', 'deep',
+    'deer', 'delight', 'delta', 'demand', 'denim', 'dentist', 'depth', 'deputy', 'derby', 'desert', 'design',
+    'desk', 'dessert', 'detail', 'dewdrop', 'dial', 'diamond', 'diary', 'dice', 'diesel', 'digit', 'dime', 'diner',
+    'dinghy', 'dingo', 'dinner', 'dip', 'dipper', 'direct', 'dish', 'disk', 'ditch', 'dive', 'dock', 'doctor',
+    'dodge', 'dog', 'doll', 'dolphin', 'dome', 'domino', 'donkey', 'donut', 'door', 'doorbell', 'doorway',
+    'dormant', 'dormouse', 'double', 'dough', 'dove', 'draft', 'dragon', 'drama', 'drawer', 'dream', 'dress',
+    'drift', 'drill', 'drink', 'drip', 'drive', 'drizzle', 'drone', 'drum', 'duck', 'dumpling', 'dune', 'dusk',
+    'dust', 'duty', 'dwarf', 'dynamo', 'eager', 'eagle', 'early', 'earring', 'earth', 'easel', 'east', 'easter',
+    'easy', 'echo', 'eclair', 'eclipse', 'edge', 'edit', 'eel', 'effort', 'egg', 'eggplant', 'eight', 'elastic',
+    'elbow', 'elder', 'elect', 'elegant', 'element', 'elevator', 'elk', 'elm', 'email', 'embassy', 'ember',
+    'emblem', 'emerald', 'emerge', 'empire', 'empty', 'enamel', 'energy', 'engine', 'engraver', 'enjoy', 'enter',
+    'entry', 'envoy', 'epic', 'equal', 'era', 'erase', 'ermine', 'errand', 'escape', 'espresso', 'essay', 'estate',
+    'ether', 'evade', 'even', 'evening', 'event', 'ever', 'exact', 'exam', 'excel', 'exhibit', 'exit', 'exotic',
+    'expert', 'explorer', 'extra', 'eyebrow', 'fable', 'fabric', 'face', 'fact', 'factor', 'fade', 'fair',
+    'fairway', 'fairy', 'faith', 'falcon', 'falconer', 'fall', 'family', 'fancy', 'fanfare', 'farm', 'farmer',
+    'fast', 'fathom', 'favor', 'feast', 'feather', 'fence', 'fern', 'ferret', 'ferry', 'festival', 'fever', 'fiber',
+    'fiddle', 'fiddler', 'field', 'fiesta', 'fifth', 'fig', 'figure', 'film', 'filter', 'final', 'finch', 'finger',
+    'finish', 'fire', 'firefly', 'firm', 'first', 'fish', 'fishbowl', 'fist', 'flag', 'flagpole', 'flagship',
+    'flame', 'flamingo', 'flannel', 'flash', 'flask', 'flat', 'flavor', 'fleet', 'flint', 'flipper', 'float',
+    'flock', 'flood', 'floor', 'floral', 'flotilla', 'flour', 'flower', 'fluid', 'flute', 'foam', 'focus', 'fog',
+    'foghorn', 'foil', 'folder', 'folk', 'font', 'food', 'foot', 'football', 'footpath', 'forest', 'forge', 'fork',
+    'form', 'fort', 'fortune', 'forum', 'fossil', 'fountain', 'fox', 'fragment', 'frame', 'freckle', 'freight',
+    'fresh', 'friend', 'frigate', 'frog', 'frontier', 'frost', 'fruit', 'fudge', 'fuel', 'fun', 'funnel', 'fur',
+    'furnace', 'future', 'gadget', 'galaxy', 'gale', 'gallery', 'gallon', 'game', 'gap', 'garage', 'garden',
+    'gardener', 'garlic', 'garnet', 'gas', 'gate', 'gauge', 'gazebo', 'gazelle', 'gear', 'gecko', 'gelato', 'gem',
+    'general', 'genie', 'genre', 'geyser', 'ghost', 'giant', 'gift', 'ginger', 'gingham', 'giraffe', 'glacier',
+    'glad', 'glass', 'glide', 'glimmer', 'globe', 'glove', 'glow', 'glowworm', 'glue', 'goat', 'goblet', 'goblin',
+    'gold', 'golf', 'gondola', 'gong', 'goose', 'gorilla', 'gourmet', 'gown', 'grace', 'grade', 'grain', 'grand',
+    'granite', 'grape', 'graph', 'grass', 'gravel', 'gravy', 'great', 'green', 'grid', 'griffin', 'grill', 'grin',
+    'grip', 'grocer', 'grove', 'growl', 'guard', 'guava', 'guess', 'guest', 'guide', 'guitar', 'gulf', 'gum',
+    'gumball', 'gumdrop', 'gust', 'gym', 'gymnast', 'habit', 'hair', 'hairpin', 'halibut', 'hall', 'halo', 'hammer',
+    'hammock', 'hamster', 'hand', 'handbag', 'handle', 'harbor', 'hare', 'harmony', 'harp', 'harvest', 'hat',
+    'hatch', 'haven', 'hawk', 'haystack', 'hazel', 'hazelnut', 'head', 'headlamp', 'health', 'heart', 'heat',
+    'heather', 'hedge', 'hedgehog', 'heel', 'heirloom', 'helmet', 'helper', 'herald', 'herb', 'herd', 'hermit',
+    'hero', 'heron', 'highway', 'hike', 'hill', 'hilltop', 'hinge', 'hint', 'hippo', 'hobby', 'hockey', 'hold',
+    'hole', 'holly', 'hologram', 'home', 'honey', 'honeybee', 'hood', 'hook', 'hope', 'horizon', 'horn', 'hornet',
+    'horse', 'hose', 'host', 'hostel', 'hotel', 'hound', 'hour', 'house', 'hub', 'hug', 'human', 'hummus', 'humor',
+    'hunt', 'hurdle', 'hurry', 'husky', 'hut', 'hydrant', 'hymn', 'ice', 'iceberg', 'icehouse', 'icicle', 'icon',
+    'idea', 'idle', 'igloo', 'image', 'impulse', 'inch', 'index', 'infant', 'ink', 'inkwell', 'inlet', 'input',
+    'insect', 'inside', 'insignia', 'iris', 'iron', 'island', 'isthmus', 'item', 'ivory', 'ivy', 'jackal', 'jacket',
+    'jade', 'jaguar', 'jam', 'jamboree', 'jar', 'jasmine', 'javelin', 'jazz', 'jeans', 'jeep', 'jelly', 'jersey',
+    'jester', 'jet', 'jetty', 'jewel', 'jigsaw', 'job', 'jockey', 'join', 'joke', 'jolly', 'journal', 'joy',
+    'judge', 'juggler', 'juice', 'jumbo', 'jump', 'jungle', 'junior', 'juniper', 'jury', 'kale', 'kangaroo',
+    'kayak', 'keen', 'kennel', 'kernel', 'kettle', 'key', 'keyboard', 'kick', 'kilt', 'kimono', 'kind', 'king',
+    'kingdom', 'kinship', 'kiosk', 'kit', 'kitchen', 'kite', 'kitten', 'kiwi', 'knapsack', 'knee', 'knife',
+    'knight', 'knob', 'knot', 'knuckle', 'koala', 'label', 'lace', 'lacquer', 'ladder', 'lady', 'ladybug', 'lagoon',
+    'lake', 'lamb', 'lamp', 'lamppost', 'lance', 'land', 'landmark', 'lane', 'lantern', 'lanyard', 'lap', 'laser',
+    'lasso', 'latch', 'lattice', 'laugh', 'lava', 'lavender', 'lawn', 'layer', 'lazy', 'leaf', 'leaflet', 'learn',
+    'leash', 'leather', 'ledge', 'legal', 'legend', 'lemon', 'lemonade', 'lens', 'lentil', 'leopard', 'leotard',
+    'lesson', 'letter', 'lettuce', 'lever', 'liberty', 'library', 'lid', 'lifeboat', 'light', 'lilac', 'lily',
+    'limb', 'lime', 'limerick', 'limit', 'linen', 'lion', 'lip', 'liquid', 'list', 'litter', 'lizard', 'llama',
+    'loaf', 'lobby', 'lobster', 'local', 'lock', 'locket', 'locust', 'lodge', 'loft', 'logic', 'lollipop',
+    'longboat', 'lotus', 'loud', 'lounge', 'love', 'loyal', 'lucky', 'luggage', 'lullaby', 'lumber', 'lunar',
+    'lunch', 'lute', 'lyric', 'macaw', 'machine', 'madrigal', 'magic', 'magnet', 'magpie', 'maid', 'mail',
+    'mailbox', 'major', 'mallet', 'mammoth', 'mandarin', 'mandolin', 'mango', 'manor', 'mantis', 'maple',
+    'marathon', 'marble', 'march', 'mare', 'margin', 'marigold', 'marina', 'market', 'marmot', 'marshal', 'mascot',
+    'mask', 'mason', 'mast', 'match', 'mayor', 'meadow', 'meal', 'meatball', 'medal', 'melody', 'melon', 'member',
+    'memo', 'mentor', 'menu', 'meringue', 'merit', 'mermaid', 'mesa', 'metal', 'meteor', 'method', 'metro',
+    'middle', 'midnight', 'migrant', 'mild', 'mile', 'milk', 'mill', 'mimic', 'mind', 'mineral', 'mingle', 'minnow',
+    'minstrel', 'mint', 'minute', 'mirror', 'mist', 'mitten', 'mixer', 'model', 'modem', 'mohair', 'molasses',
+    'mole', 'moment', 'monarch', 'monkey', 'monsoon', 'month', 'moon', 'moonbeam', 'moose', 'morning', 'morsel',
+    'mosaic', 'mosquito', 'moss', 'motel', 'moth', 'motor', 'mouse', 'mouth', 'movie', 'mud', 'muffin', 'muffler',
+    'mulberry', 'mule', 'mural', 'muscle', 'museum', 'mushroom', 'music', 'mustang', 'mustard', 'myth', 'nail',
+    'name', 'napkin', 'narrow', 'nation', 'native', 'nature', 'nautilus', 'navy', 'neck', 'necklace', 'nectar',
+    'needle', 'neon', 'nephew', 'nerve', 'nest', 'net', 'news', 'nickel', 'night', 'nightowl', 'nimbus', 'ninja',
+    'noble', 'nomad', 'noodle', 'noon', 'north', 'nose', 'notch', 'note', 'notebook', 'novel', 'nugget', 'number',
+    'nurse', 'nut', 'nutmeg', 'nutshell', 'nylon', 'oak', 'oarsman', 'oasis', 'oat', 'oatmeal', 'obelisk', 'object',
+    'ocean', 'ocelot', 'octave', 'octopus', 'odor', 'odyssey', 'offer', 'office', 'olive', 'omega', 'omelet',
+    'onion', 'open', 'opera', 'orange', 'orbit', 'orbiter', 'orchard', 'orchid', 'order', 'organ', 'origin',
+    'oriole', 'ostrich', 'otter', 'ounce', 'outdoors', 'outer', 'outfit', 'outpost', 'oval', 'oven', 'overcoat',
+    'overture', 'owl', 'owner', 'oxygen', 'oyster', 'pace', 'pack', 'paddle', 'paddock', 'page', 'pagoda', 'pail',
+    'paint', 'pajamas', 'palace', 'palette', 'palm', 'pan', 'pancake', 'panda', 'panel', 'panorama', 'panther',
+    'papaya', 'paper', 'paprika', 'parade', 'parakeet', 'parasol', 'parcel', 'park', 'parrot', 'parsley', 'party',
+    'passport', 'pasta', 'paste', 'pastry', 'patch', 'path', 'pathway', 'patio', 'pause', 'pavilion', 'paw',
+    'peace', 'peach', 'peacock', 'peak', 'peanut', 'pear', 'pearl', 'pebble', 'pecan', 'pedal', 'pelican', 'pelt',
+    'pen', 'pencil', 'pendant', 'penguin', 'penny', 'peony', 'pepper', 'perch', 'permit', 'pet', 'petal', 'petunia',
+    'pheasant', 'phone', 'photo', 'piano', 'piccolo', 'pickle', 'picnic', 'pie', 'pier', 'pig', 'pigeon', 'pigment',
+    'pillow', 'pilot', 'pine', 'pinecone', 'pink', 'pint', 'pinwheel', 'pioneer', 'pipe', 'pirate', 'pitch',
+    'pivot', 'pixel', 'pizza', 'place', 'plain', 'planet', 'plank', 'plant', 'plate', 'plateau', 'platypus',
+    'plaza', 'plot', 'plow', 'plum', 'plumber', 'plume', 'plus', 'pocket', 'poem', 'poet', 'point', 'polar', 'pole',
+    'polka', 'polygon', 'poncho', 'pond', 'pony', 'pool', 'popcorn', 'poppy', 'porch', 'porridge', 'port', 'portal',
+    'possum', 'postcard', 'poster', 'potato', 'potter', 'pouch', 'powder', 'power', 'prairie', 'press', 'pretzel',
+    'price', 'pride', 'primrose', 'prince', 'print', 'printer', 'prism', 'prize', 'probe', 'profit', 'prompt',
+    'proof', 'prose', 'proud', 'prune', 'pudding', 'pulley', 'pulse', 'puma', 'pump', 'pumpkin', 'punch', 'pupil',
+    'puppet', 'puppy', 'purple', 'purse', 'puzzle', 'pyramid', 'quail', 'quake', 'quarry', 'quart', 'quartet',
+    'quasar', 'queen', 'quest', 'quick', 'quiet', 'quill', 'quilt', 'quiver', 'quiz', 'quota', 'rabbit', 'raccoon',
+    'race', 'radar', 'radio', 'radish', 'raft', 'ragtime', 'rail', 'rain', 'rainbow', 'raincoat', 'rainfall',
+    'raisin', 'rake', 'rally', 'ramp', 'rampart', 'ranch', 'range', 'rapid', 'raptor', 'ratchet', 'raven', 'ray',
+    'razor', 'ready', 'realm', 'recipe', 'recital', 'record', 'redwood', 'reef', 'refuge', 'regatta', 'region',
+    'reindeer', 'relay', 'relic', 'remedy', 'rent', 'reply', 'reptile', 'rescue', 'resort', 'rhythm', 'rib',
+    'ribbon', 'rice', 'riddle', 'rider', 'ridge', 'ring', 'rinse', 'ripple', 'river', 'rivulet', 'road', 'roadster',
+    'robe', 'robin', 'robot', 'rock', 'rocket', 'rodeo', 'roof', 'room', 'root', 'rope', 'rose', 'rosebud',
+    'rosemary', 'rotor', 'rotunda', 'round', 'route', 'rowboat', 'royal', 'ruby', 'rudder', 'rug', 'ruler',
+    'runway', 'rural', 'rust', 'saddle', 'safari', 'saffron', 'saga', 'sage', 'sail', 'sailboat', 'sailor', 'salad',
+    'salmon', 'salon', 'salsa', 'salt', 'salute', 'sample', 'sand', 'sandal', 'sandbox', 'sapphire', 'sardine',
+    'satchel', 'satin', 'sauce', 'sausage', 'savanna', 'scale', 'scallop', 'scarf', 'scene', 'scent', 'scepter',
+    'school', 'schooner', 'science', 'scone', 'scoop', 'scooter', 'score', 'scorpion', 'scout', 'screen', 'script',
+    'scroll', 'sea', 'seahorse', 'seal', 'seashell', 'season', 'seat', 'seaweed', 'second', 'secret', 'sector',
+    'seed', 'senior', 'sensor', 'sentinel', 'sequel', 'sequoia', 'serpent', 'serum', 'session', 'sextant', 'shade',
+    'shadow', 'shaft', 'shallow', 'shamrock', 'shape', 'shark', 'shave', 'shawl', 'sheep', 'shelf', 'shell',
+    'shelter', 'sherbet', 'shield', 'shift', 'shine', 'ship', 'shipyard', 'shirt', 'shoe', 'shoelace', 'shore',
+    'short', 'shovel', 'shower', 'shrimp', 'shrub', 'sibling', 'sidewalk', 'sierra', 'signal', 'silk', 'silver',
+    'simple', 'siren', 'sister', 'sketch', 'ski', 'skill', 'skirt', 'sky', 'skylark', 'skyline', 'slate', 'sled',
+    'sleeve', 'slice', 'slide', 'slipper', 'slope', 'slot', 'smile', 'smoke', 'snack', 'snail', 'snake', 'snapper',
+    'sneaker', 'snow', 'snowball', 'soap', 'soccer', 'sock', 'soda', 'sofa', 'solar', 'solid', 'solo', 'solstice',
+    'sombrero', 'songbird', 'sonic', 'sonnet', 'sound', 'soup', 'source', 'south', 'space', 'spade', 'spark',
+    'sparrow', 'spatula', 'sphere', 'spice', 'spider', 'spike', 'spinach', 'spine', 'spiral', 'splash', 'sponge',
+    'spoon', 'sport', 'spot', 'spray', 'spring', 'sprinkle', 'sprout', 'spruce', 'spy', 'square', 'squid',
+    'squirrel', 'stable', 'stadium', 'staff', 'stage', 'stair', 'stallion', 'stamp', 'star', 'starfish', 'state',
+    'station', 'statue', 'steak', 'steam', 'steel', 'steeple', 'stem', 'step', 'stepping', 'stereo', 'stick',
+    'stingray', 'stool', 'storm', 'story', 'stove', 'straw', 'stream', 'street', 'stripe', 'strudel', 'studio',
+    'stump', 'style', 'sugar', 'suit', 'summer', 'summit', 'sun', 'sunbeam', 'sundial', 'sunset', 'super', 'supply',
+    'surf', 'surfer', 'swallow', 'swamp', 'swan', 'sweater', 'sweet', 'swift', 'swim', 'swing', 'switch', 'symbol',
+    'syrup', 'table', 'tablet', 'taco', 'tadpole', 'tail', 'talent', 'tambour', 'tango', 'tank', 'tape', 'target',
+    'task', 'taxi', 'tea', 'teacher', 'teacup', 'team', 'teapot', 'tempest', 'temple', 'tennis', 'tent', 'term',
+    'terrace', 'test', 'text', 'thank', 'theory', 'thimble', 'thistle', 'thorn', 'thread', 'throne', 'thrush',
+    'thumb', 'thunder', 'tiara', 'ticket', 'tide', 'tiger', 'tile', 'timber', 'time', 'tinfoil', 'tiny', 'tip',
+    'tissue', 'title', 'toast', 'today', 'toe', 'toffee', 'token', 'tomato', 'tongue', 'tool', 'toolbox', 'tooth',
+    'topaz', 'torch', 'tornado', 'total', 'totem', 'toucan', 'towel', 'tower', 'town', 'toy', 'track', 'tractor',
+    'trade', 'trail', 'train', 'trapeze', 'tray', 'treat', 'tree', 'trellis', 'trend', 'trial', 'tribe', 'trick',
+    'trident', 'trinket', 'trio', 'trolley', 'trophy', 'trout', 'truck', 'trumpet', 'trunk', 'trust', 'truth',
+    'tube', 'tugboat', 'tulip', 'tuna', 'tundra', 'tunnel', 'turban', 'turkey', 'turnip', 'turtle', 'tutor',
+    'tuxedo', 'twig', 'twin', 'typhoon', 'ukulele', 'ultra', 'uncle', 'unicorn', 'union', 'unit', 'upland', 'upper',
+    'urban', 'usher', 'utility', 'vacuum', 'valiant', 'valley', 'valve', 'van', 'vanilla', 'vapor', 'vase', 'vault',
+    'velcro', 'velvet', 'vendor', 'venue', 'veranda', 'verb', 'verse', 'vertex', 'vessel', 'veteran', 'viaduct',
+    'vial', 'video', 'view', 'villa', 'village', 'vine', 'violet', 'violin', 'viper', 'visa', 'visit', 'visor',
+    'vital', 'vivid', 'vocal', 'voice', 'volcano', 'volume', 'vote', 'voucher', 'voyage', 'wafer', 'waffle',
+    'wagon', 'waist', 'walkway', 'wallaby', 'walnut', 'walrus', 'wand', 'wander', 'warbler', 'warden', 'warm',
+    'wasp', 'watch', 'water', 'wave', 'wax', 'wayside', 'wealth', 'weasel', 'weather', 'web', 'wedge', 'weed',
+    'week', 'weekend', 'whale', 'wheat', 'wheel', 'whip', 'whisker', 'whistle', 'wick', 'widget', 'width', 'wig',
+    'wildcat', 'willow', 'wind', 'window', 'wing', 'winner', 'winter', 'wire', 'wisdom', 'wizard', 'wolf', 'wombat',
+    'wonder', 'wood', 'wool', 'word', 'worker', 'world', 'worm', 'wrap', 'wreath', 'wren', 'wrist', 'writer',
+    'yacht', 'yard', 'yarn', 'year', 'yeast', 'yellow', 'yeti', 'yodel', 'yoga', 'yogurt', 'yolk', 'young', 'yucca',
+    'zebra', 'zero', 'zigzag', 'zinc', 'zipper', 'zodiac', 'zone', 'zoo',
+)
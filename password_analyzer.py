@@ -1,150 +1,683 @@
 import re
 import math
+import os
 import string
-from typing import Dict, List, Tuple
-from common_passwords import COMMON_PASSWORDS
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from analysis_cache import AnalysisCache, keyed_digest
+from bloom_filter import BloomFilter
+from breach_index import BreachIndex, full_digest
+from dictionary_index import BaseWordMatch, DictionaryIndex
+from instrumentation import Instrumentation
+from pattern_matcher import Match, PatternMatcher
+
+# Character classes used for charset size and variety checks
+LOWERCASE_CHARS = frozenset(string.ascii_lowercase)
+UPPERCASE_CHARS = frozenset(string.ascii_uppercase)
+DIGIT_CHARS = frozenset(string.digits)
+ALPHANUMERIC_CHARS = LOWERCASE_CHARS | UPPERCASE_CHARS | DIGIT_CHARS
+
+# Literal detectors, all matched by one automaton
+ALPHA_SEQUENCES = tuple(string.ascii_lowercase[i:i + 3] for i in range(24))
+NUMERIC_SEQUENCES = ('123', '234', '345', '456', '567', '678', '789', '890')
+KEYBOARD_PATTERNS = ('qwert', 'asdf', 'zxcv', '12345', 'qazws')
+COMMON_WORDS = ('password', 'admin', 'user', 'login', 'welcome', 'secret')
+DICTIONARY_WORDS = ('admin', 'user', 'password', 'login', 'welcome', 'secret', '123')
+
+# Match categories
+ALPHA_SEQUENCE = 'alpha_sequence'
+NUMERIC_SEQUENCE = 'numeric_sequence'
+REPEAT = 'repeat'
+KEYBOARD = 'keyboard'
+YEAR = 'year'
+DATE = 'date'
+COMMON_WORD = 'common_word'
+DICTIONARY_WORD = 'dictionary_word'  # Feeds issues only, not the pattern list
+
+# Non-literal detectors; lookaheads report overlapping hits so spans are complete
+REPEATED_CHARS_RE = re.compile(r'(.)\1{2,}')
+YEAR_RE = re.compile(r'(?=((?:19|20)\d{2}))')
+DATE_RE = re.compile(r'(?=((?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])))')
+
+# Bits credited to each character covered by a matched pattern span
+MATCHED_CHAR_BITS = 1.0
+# Flat penalty for patterns that have no span (character substitutions)
+UNSPANNED_PATTERN_PENALTY = 5
+
+# Bounded-cost mode: longer inputs are scored on this many leading characters and flagged
+DEFAULT_ANALYSIS_LENGTH = 1024
+# Length scoring tops out at 16 characters, so no shorter prefix may stand in for the whole password
+MIN_ANALYSIS_LENGTH = 16
+
+
+def build_pattern_matcher() -> PatternMatcher:
+    """Compile every literal detector into a single automaton"""
+    literals = [(token, ALPHA_SEQUENCE) for token in ALPHA_SEQUENCES]
+    literals += [(token, NUMERIC_SEQUENCE) for token in NUMERIC_SEQUENCES]
+    literals += [(token, KEYBOARD) for token in KEYBOARD_PATTERNS]
+    literals += [(token, COMMON_WORD) for token in COMMON_WORDS]
+    literals += [(token, DICTIONARY_WORD) for token in DICTIONARY_WORDS]
+    return PatternMatcher(literals)
+
+
+PATTERN_MATCHER = build_pattern_matcher()
+
+# Pattern catalog, in report order; a result's pattern bitmask indexes into it
+PATTERN_MESSAGES = (
+    "Contains sequential alphabetic characters",
+    "Contains sequential numeric characters",
+    "Contains 3+ repeated characters",
+    *(f"Contains keyboard pattern: {pattern}" for pattern in KEYBOARD_PATTERNS),
+    "Uses common character substitution (4/@/a)",
+    "Uses common character substitution (3/e)",
+    "Uses common character substitution (1/!/i)",
+    "Contains year pattern",
+    "Contains date pattern",
+    "Contains common word with numbers"
+)
+PATTERN_BITS = {message: 1 << index for index, message in enumerate(PATTERN_MESSAGES)}
+CATEGORY_BITS = {
+    ALPHA_SEQUENCE: PATTERN_BITS["Contains sequential alphabetic characters"],
+    NUMERIC_SEQUENCE: PATTERN_BITS["Contains sequential numeric characters"],
+    REPEAT: PATTERN_BITS["Contains 3+ repeated characters"],
+    YEAR: PATTERN_BITS["Contains year pattern"],
+    DATE: PATTERN_BITS["Contains date pattern"],
+    COMMON_WORD: PATTERN_BITS["Contains common word with numbers"],
+    DICTIONARY_WORD: 0
+}
+KEYBOARD_BITS = {pattern: PATTERN_BITS[f"Contains keyboard pattern: {pattern}"] for pattern in KEYBOARD_PATTERNS}
+SUBSTITUTION_A = PATTERN_BITS["Uses common character substitution (4/@/a)"]
+SUBSTITUTION_E = PATTERN_BITS["Uses common character substitution (3/e)"]
+SUBSTITUTION_I = PATTERN_BITS["Uses common character substitution (1/!/i)"]
+
+
+def render_patterns(pattern_codes: int) -> List[str]:
+    """Expand a pattern bitmask into its messages"""
+    return [message for index, message in enumerate(PATTERN_MESSAGES) if pattern_codes >> index & 1]
+
+
+# Character class bits
+LOWERCASE = 1
+UPPERCASE = 2
+NUMBERS = 4
+SPECIAL_CHARS = 8
+CHARACTER_TYPES = (('lowercase', LOWERCASE), ('uppercase', UPPERCASE),
+                   ('numbers', NUMBERS), ('special_chars', SPECIAL_CHARS))
+# Alphabet size credited for each class present (special characters approximate),
+# and the total for every combination of class bits
+CHARSET_SIZES = ((LOWERCASE, 26), (UPPERCASE, 26), (NUMBERS, 10), (SPECIAL_CHARS, 32))
+CHARSET_SIZE_BY_FLAGS = tuple(sum(size for flag, size in CHARSET_SIZES if flags & flag) for flags in range(16))
+
+
+class Issue:
+    """Security issue bit codes, in report order"""
+    TOO_SHORT = 1
+    LOW_VARIETY = 2
+    MISSING_UPPERCASE = 4
+    MISSING_NUMBERS = 8
+    MISSING_SPECIAL_CHARS = 16
+    LOW_ENTROPY = 32
+    MULTIPLE_PATTERNS = 64
+    COMMON_PASSWORD = 128
+    DICTIONARY_WORDS = 256
+    EMPTY = 512
+    TRUNCATED = 1024
+
+
+ISSUE_MESSAGES = (
+    (Issue.TOO_SHORT, "Password is too short (minimum 8 characters recommended)"),
+    (Issue.LOW_VARIETY, "Password lacks character variety (use uppercase, lowercase, numbers, and symbols)"),
+    (Issue.MISSING_UPPERCASE, "Missing uppercase letters"),
+    (Issue.MISSING_NUMBERS, "Missing numbers"),
+    (Issue.MISSING_SPECIAL_CHARS, "Missing special characters"),
+    (Issue.LOW_ENTROPY, "Low password entropy (predictable)"),
+    (Issue.MULTIPLE_PATTERNS, "Multiple predictable patterns detected"),
+    (Issue.COMMON_PASSWORD, "Password found in common password databases"),
+    (Issue.DICTIONARY_WORDS, "Contains common dictionary words"),
+    (Issue.EMPTY, "Password is empty"),
+    (Issue.TRUNCATED, "Password is unusually long; only its beginning was analyzed")
+)
+
+
+class Recommendation:
+    """Recommendation bit codes, in report order"""
+    INCREASE_LENGTH = 1
+    ADD_UPPERCASE = 2
+    ADD_LOWERCASE = 4
+    ADD_NUMBERS = 8
+    ADD_SPECIAL_CHARS = 16
+    AVOID_PATTERNS = 32
+    USE_UNIQUE_PASSWORD = 64
+    INCREASE_RANDOMNESS = 128
+    USE_PASSPHRASE = 256
+    USE_PASSWORD_MANAGER = 512
+    ENABLE_TWO_FACTOR = 1024
+    ENTER_PASSWORD = 2048
+    ADVANCED = USE_PASSPHRASE | USE_PASSWORD_MANAGER | ENABLE_TWO_FACTOR
+
+
+RECOMMENDATION_MESSAGES = (
+    (Recommendation.INCREASE_LENGTH, "Increase password length to at least 12 characters"),
+    (Recommendation.ADD_UPPERCASE, "Add uppercase letters (A-Z)"),
+    (Recommendation.ADD_LOWERCASE, "Add lowercase letters (a-z)"),
+    (Recommendation.ADD_NUMBERS, "Add numbers (0-9)"),
+    (Recommendation.ADD_SPECIAL_CHARS, "Add special characters (!@#$%^&*)"),
+    (Recommendation.AVOID_PATTERNS, "Avoid predictable patterns and sequences"),
+    (Recommendation.USE_UNIQUE_PASSWORD, "Use a unique password not found in common lists"),
+    (Recommendation.INCREASE_RANDOMNESS, "Increase randomness by avoiding predictable combinations"),
+    (Recommendation.USE_PASSPHRASE, "Consider using a passphrase with random words"),
+    (Recommendation.USE_PASSWORD_MANAGER, "Use a password manager to generate and store strong passwords"),
+    (Recommendation.ENABLE_TWO_FACTOR, "Enable two-factor authentication for additional security"),
+    (Recommendation.ENTER_PASSWORD, "Enter a password to begin analysis")
+)
+
+
+class AnalysisResult:
+    """Compact analysis record; message text is rendered only when asked for"""
+
+    __slots__ = ('score', 'length', 'entropy', 'character_flags', 'is_common',
+                 'issue_codes', 'recommendation_codes', 'pattern_codes')
+
+    def __init__(self, score: int, length: int, entropy: float, character_flags: int, is_common: bool,
+                 issue_codes: int, recommendation_codes: int, pattern_codes: int):
+        self.score = score
+        self.length = length
+        self.entropy = entropy
+        self.character_flags = character_flags
+        self.is_common = is_common
+        self.issue_codes = issue_codes
+        self.recommendation_codes = recommendation_codes
+        self.pattern_codes = pattern_codes
+
+    def _fields(self) -> Tuple:
+        return (self.score, self.length, self.entropy, self.character_flags, self.is_common,
+                self.issue_codes, self.recommendation_codes, self.pattern_codes)
+
+    def copy(self) -> 'AnalysisResult':
+        return AnalysisResult(*self._fields())
+
+    def __reduce__(self):
+        # Positional fields pickle far smaller than the default slot-name state
+        return (AnalysisResult, self._fields())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AnalysisResult):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        return (f"AnalysisResult(score={self.score}, length={self.length}, entropy={self.entropy:.2f}, "
+                f"issues={self.issue_codes:#x}, patterns={self.pattern_codes:#x})")
+
+    @property
+    def character_types(self) -> Dict[str, bool]:
+        return {name: bool(self.character_flags & flag) for name, flag in CHARACTER_TYPES}
+
+    @property
+    def character_variety(self) -> int:
+        return self.character_flags.bit_count()
+
+    @property
+    def issues_count(self) -> int:
+        return self.issue_codes.bit_count()
+
+    @property
+    def pattern_count(self) -> int:
+        return self.pattern_codes.bit_count()
+
+    @property
+    def issues(self) -> List[str]:
+        return [message for code, message in ISSUE_MESSAGES if self.issue_codes & code]
+
+    @property
+    def recommendations(self) -> List[str]:
+        return [message for code, message in RECOMMENDATION_MESSAGES if self.recommendation_codes & code]
+
+    @property
+    def patterns(self) -> List[str]:
+        return render_patterns(self.pattern_codes)
+
+    def to_dict(self) -> Dict:
+        """Render the full analysis dict returned by analyze_password"""
+        return {
+            'score': self.score,
+            'length': self.length,
+            'entropy': self.entropy,
+            'character_types': self.character_types,
+            'character_variety': self.character_variety,
+            'is_common': self.is_common,
+            'patterns': self.patterns,
+            'issues': self.issues,
+            'recommendations': self.recommendations
+        }
+
+
+EMPTY_RESULT = AnalysisResult(0, 0, 0, 0, False, Issue.EMPTY, Recommendation.ENTER_PASSWORD, 0)
+
+
+def lowered_origin(password: str) -> List[int]:
+    """Index in password of the character behind each character of password.lower()"""
+    return [index for index, ch in enumerate(password) for _ in ch.lower()]
+
+
+class PatternScan:
+    """Pattern hits for one password, with the span and penalty detail entropy needs"""
+
+    __slots__ = ('password', 'lowered', 'length', 'matches', 'pattern_codes', 'covered_chars',
+                 'unspanned_patterns', 'has_dictionary_word')
+
+    def __init__(self, password: str):
+        self.password = password
+        self.lowered = password.lower()
+        self.length = len(password)
+        self.matches = self._find_matches(password, self.lowered)
+        self._summarize_matches()
+
+    @staticmethod
+    def _find_matches(password: str, lowered: str) -> List[Match]:
+        """Collect every pattern hit with its span in password"""
+        matches = PATTERN_MATCHER.find_all(lowered)
+        if len(lowered) != len(password):
+            # Lowering lengthened a character ('İ'); move automaton spans onto the password, as the regex spans are
+            origin = lowered_origin(password)
+            matches = [Match(origin[match.start], origin[match.end - 1] + 1, match.category, match.token)
+                       for match in matches]
+        for found in REPEATED_CHARS_RE.finditer(password):
+            matches.append(Match(found.start(), found.end(), REPEAT, found.group()))
+        for found in YEAR_RE.finditer(password):
+            matches.append(Match(found.start(), found.start() + 4, YEAR, found.group(1)))
+        for found in DATE_RE.finditer(password):
+            matches.append(Match(found.start(), found.start() + 4, DATE, found.group(1)))
+        return matches
+
+    def _summarize_matches(self):
+        """Turn raw hits into pattern codes and covered-span counts"""
+        codes = 0
+        spans = []
+        has_dictionary_word = False
+        for match in self.matches:
+            category = match.category
+            if category == DICTIONARY_WORD:
+                has_dictionary_word = True
+                continue
+            if category == KEYBOARD:
+                codes |= KEYBOARD_BITS[match.token]
+            else:
+                codes |= CATEGORY_BITS[category]
+            spans.append((match.start, match.end))
+        self.has_dictionary_word = has_dictionary_word
+
+        # Count characters covered by the union of all spans
+        covered = 0
+        reach = 0
+        for start, end in sorted(spans):
+            if end > reach:
+                covered += end - max(start, reach)
+                reach = end
+        self.covered_chars = min(self.length, covered)
+
+        # Common substitutions have no span
+        password = self.password
+        lowered = self.lowered
+        unspanned = 0
+        if ('4' in password or '@' in password) and 'a' not in lowered:
+            codes |= SUBSTITUTION_A
+            unspanned += 1
+
+        if '3' in password and 'e' not in lowered:
+            codes |= SUBSTITUTION_E
+            unspanned += 1
+
+        if ('1' in password or '!' in password) and 'i' not in lowered:
+            codes |= SUBSTITUTION_I
+            unspanned += 1
+
+        self.unspanned_patterns = unspanned
+        self.pattern_codes = codes
+
+    @property
+    def pattern_count(self) -> int:
+        return self.pattern_codes.bit_count()
+
+    @property
+    def patterns(self) -> List[str]:
+        return render_patterns(self.pattern_codes)
+
+
+class AnalysisContext(PatternScan):
+    """Per-call scan results shared by every analysis stage"""
+
+    __slots__ = ('character_flags', 'charset_size')
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._classify_characters()
+
+    def _classify_characters(self):
+        # One pass over the distinct characters gives every class flag
+        chars = set(self.password)
+        flags = 0
+        if not chars.isdisjoint(LOWERCASE_CHARS):
+            flags |= LOWERCASE
+        if not chars.isdisjoint(UPPERCASE_CHARS):
+            flags |= UPPERCASE
+        if not chars.isdisjoint(DIGIT_CHARS):
+            flags |= NUMBERS
+        if not chars <= ALPHANUMERIC_CHARS:
+            flags |= SPECIAL_CHARS
+        self.character_flags = flags
+        self.charset_size = CHARSET_SIZE_BY_FLAGS[flags]
+
+    @property
+    def character_types(self) -> Dict[str, bool]:
+        return {name: bool(self.character_flags & flag) for name, flag in CHARACTER_TYPES}
+
+
+@lru_cache(maxsize=None)
+def common_password_index() -> DictionaryIndex:
+    """Built-in common passwords, indexed on first use and shared by every analyzer in the process"""
+    from common_passwords import RANKED_PASSWORDS
+    return DictionaryIndex(RANKED_PASSWORDS)
+
+
+def strength_label(score: int) -> str:
+    """Map a 0-100 score to the Strong/Medium/Weak label used across the app"""
+    if score >= 80:
+        return 'Strong'
+    if score >= 60:
+        return 'Medium'
+    return 'Weak'
+
+
+def mask_password(password: str) -> str:
+    """Keep the first three characters and star the rest, as in batch reports"""
+    return password[:3] + '*' * (len(password) - 3)
+
+
+# Analyzer built once per worker process by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_kwargs: Dict):
+    """Process pool initializer: build the worker's analyzer from its constructor arguments"""
+    global _worker_analyzer
+    _worker_analyzer = PasswordAnalyzer(**analyzer_kwargs)
+
+
+def _run_chunk(task: Callable, passwords: List[str]):
+    """Run a chunk task in a worker against that worker's analyzer"""
+    return task(_worker_analyzer, passwords)
+
+
+def _analyze_chunk(analyzer: 'PasswordAnalyzer', passwords: List[str]) -> List[AnalysisResult]:
+    return [analyzer.analyze(password) for password in passwords]
+
+
+def _analyze_chunk_uncached(analyzer: 'PasswordAnalyzer', passwords: List[str]) -> List[AnalysisResult]:
+    return [analyzer.analyze(password, use_cache=False) for password in passwords]
+
 
 class PasswordAnalyzer:
-    def __init__(self):
-        self.common_passwords = set(COMMON_PASSWORDS)
+    def __init__(self, breach_index_path: Optional[str] = None, prefilter_path: Optional[str] = None,
+                 cache_size: int = 0, cache_ttl: Optional[float] = None, wordlist_path: Optional[str] = None,
+                 instrumentation: Optional[Instrumentation] = None, analysis_length: Optional[int] = None,
+                 max_input_length: Optional[int] = None):
+        # Kept so worker processes can rebuild an equivalent analyzer (index files are reopened, not pickled)
+        self._init_kwargs = {'breach_index_path': breach_index_path, 'prefilter_path': prefilter_path,
+                             'cache_size': cache_size, 'cache_ttl': cache_ttl, 'wordlist_path': wordlist_path,
+                             'analysis_length': analysis_length, 'max_input_length': max_input_length}
+        # Bounded-cost mode: inputs over analysis_length are scored on their prefix and flagged Issue.TRUNCATED,
+        # inputs over max_input_length are rejected; either way work never grows past the limit
+        if analysis_length is not None and analysis_length < MIN_ANALYSIS_LENGTH:
+            raise ValueError(f"analysis_length must be at least {MIN_ANALYSIS_LENGTH}")
+        if max_input_length is not None and max_input_length < 1:
+            raise ValueError("max_input_length must be positive")
+        self.analysis_length = analysis_length
+        self.max_input_length = max_input_length
+        limits = [limit for limit in (analysis_length, max_input_length) if limit is not None]
+        self._length_limit = min(limits) if limits else None
+        # Prebuilt wordlist artifact mapped from disk, or the built-in list resolved lazily on the first lookup
+        self._common_passwords = DictionaryIndex.from_artifact(wordlist_path) if wordlist_path else None
+        # Optional on-disk breach corpus, searched in place through mmap
+        self.breach_index = BreachIndex(breach_index_path) if breach_index_path else None
+        # Optional Bloom filter; only its hits reach the breach index
+        self.prefilter = BloomFilter(prefilter_path) if prefilter_path else None
+        # Opt-in memoization of analyze(); keyed by HMAC, never by plaintext
+        self.cache = AnalysisCache(cache_size, cache_ttl) if cache_size else None
+        # Optional stage timings and lookup counters; None keeps analyze() on its plain path
+        # (not passed to pool workers, whose timings stay in their own processes)
+        self.instrumentation = instrumentation
         
     def analyze_password(self, password: str) -> Dict:
         """Comprehensive password analysis"""
-        if not password:
-            return self._empty_analysis()
-        
-        analysis = {
-            'score': 0,
-            'length': len(password),
-            'entropy': self._calculate_entropy(password),
-            'character_types': self._analyze_character_types(password),
-            'character_variety': 0,
-            'is_common': self._is_common_password(password),
-            'patterns': self._detect_patterns(password),
-            'issues': [],
-            'recommendations': []
-        }
-        
-        # Calculate character variety
-        analysis['character_variety'] = sum(analysis['character_types'].values())
-        
-        # Calculate overall score
-        analysis['score'] = self._calculate_score(password, analysis)
-        
-        # Generate issues and recommendations
-        analysis['issues'] = self._identify_issues(password, analysis)
-        analysis['recommendations'] = self._generate_recommendations(password, analysis)
+        return self.analyze(password).to_dict()
+    
+    def analyze(self, password: str, use_cache: bool = True) -> AnalysisResult:
+        """Comprehensive password analysis as a compact AnalysisResult
         
+        use_cache=False neither reads nor fills the analysis cache, for inputs that will not repeat.
+        """
+        # Shared results (EMPTY_RESULT, cache entries) are handed out as copies so callers may modify them
+        if not password:
+            return EMPTY_RESULT.copy()
+        if self.instrumentation is not None:
+            return self._analyze_instrumented(password, use_cache)
+        if self._length_limit is not None and len(password) > self._length_limit:
+            return self._analyze_long(password)
+        if self.cache is not None and use_cache:
+            return self.cache.get_or_compute(password, self._analyze_uncached).copy()
+        return self._analyze_uncached(password)
+    
+    def _analyze_long(self, password: str) -> AnalysisResult:
+        """Reject a password over max_input_length, or score only its first analysis_length characters"""
+        if self.max_input_length is not None and len(password) > self.max_input_length:
+            raise ValueError(f"Password is longer than {self.max_input_length} characters")
+        # A prefix is not the password, so it is neither cached nor looked up in the word lists
+        analysis = self._analyze_context(self._scan(password[:self.analysis_length]), check_common=False)
+        analysis.length = len(password)
+        analysis.issue_codes |= Issue.TRUNCATED
         return analysis
     
+    def _analyze_instrumented(self, password: str, use_cache: bool = True) -> AnalysisResult:
+        """analyze() with the cache lookup and the total recorded; _run_stages times each stage"""
+        instrumentation = self.instrumentation
+        started = perf_counter()
+        if self._length_limit is not None and len(password) > self._length_limit:
+            result = self._analyze_long(password)
+        elif self.cache is None or not use_cache:
+            result = self._analyze_uncached(password)
+        else:
+            key = keyed_digest(password)
+            result = self.cache.get(key)
+            instrumentation.record_lookup('analysis_cache', result is not None)
+            if result is None:
+                result = self._analyze_uncached(password)
+                self.cache.put(key, result)
+            result = result.copy()
+        instrumentation.record('total', perf_counter() - started)
+        return result
+    
+    def _run_stages(self, stages, context: AnalysisContext, analysis: Optional[AnalysisResult]):
+        """Run stages in order, timing each one when instrumentation is on"""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            for _, stage in stages:
+                stage(self, context, analysis)
+            return
+        record = instrumentation.record
+        started = perf_counter()
+        for name, stage in stages:
+            stage(self, context, analysis)
+            now = perf_counter()
+            record(name, now - started)
+            started = now
+    
+    def _scan(self, password: str) -> AnalysisContext:
+        """Build the shared context by running the scan stages"""
+        context = AnalysisContext.__new__(AnalysisContext)
+        context.password = password
+        self._run_stages(SCAN_STAGES, context, None)
+        return context
+    
+    def estimate_guesses(self, password: str):
+        """Estimate the guesses needed to crack password as a guess_estimator.GuessEstimate"""
+        from guess_estimator import guess_estimator
+        return guess_estimator().estimate(password)
+    
+    def _analyze_uncached(self, password: str) -> AnalysisResult:
+        """Run every analysis stage for a non-empty password"""
+        # Scan once; every stage below reads from the shared context
+        return self._analyze_context(self._scan(password))
+    
+    def _analyze_context(self, context: AnalysisContext, check_common: bool = True) -> AnalysisResult:
+        """Run the scoring stages over an already scanned password"""
+        analysis = AnalysisResult(
+            score=0,
+            length=context.length,
+            entropy=0,
+            character_flags=context.character_flags,
+            is_common=False,
+            issue_codes=0,
+            recommendation_codes=0,
+            pattern_codes=context.pattern_codes
+        )
+        self._run_stages(SCORING_STAGES if check_common else PREFIX_SCORING_STAGES, context, analysis)
+        return analysis
+    
+    def analyze_batch(self, passwords: Iterable[str], workers: Optional[int] = None,
+                      chunksize: int = 1000, compact: bool = False, use_cache: bool = True) -> Iterator:
+        """Analyze passwords across a process pool, lazily yielding results in input order
+        
+        Yields analysis dicts, or AnalysisResult objects when compact is True; use_cache is as for analyze().
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1:
+            for password in passwords:
+                result = self.analyze(password, use_cache)
+                yield result if compact else result.to_dict()
+            return
+        
+        task = _analyze_chunk if use_cache else _analyze_chunk_uncached
+        for results in self.map_chunks(task, passwords, workers, chunksize):
+            for result in results:
+                yield result if compact else result.to_dict()
+    
+    def map_chunks(self, task: Callable, passwords: Iterable[str], workers: Optional[int] = None,
+                   chunksize: int = 1000) -> Iterator:
+        """Apply task(analyzer, chunk) to consecutive chunks of passwords, yielding each return value in order
+        
+        With more than one worker the chunks run in a process pool whose workers each hold
+        an analyzer built from this one's constructor arguments; task must be picklable.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        passwords = iter(passwords)
+        if workers <= 1:
+            while True:
+                chunk = list(islice(passwords, chunksize))
+                if not chunk:
+                    return
+                yield task(self, chunk)
+        
+        # Bound the chunks in flight so input is consumed only as fast as results are
+        max_pending = workers * 2
+        pending = deque()
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(self._init_kwargs,))
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(passwords, chunksize))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_run_chunk, task, chunk))
+                if not pending:
+                    break
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def _empty_analysis(self) -> Dict:
         """Return empty analysis for empty password"""
-        return {
-            'score': 0,
-            'length': 0,
-            'entropy': 0,
-            'character_types': {
-                'lowercase': False,
-                'uppercase': False,
-                'numbers': False,
-                'special_chars': False
-            },
-            'character_variety': 0,
-            'is_common': False,
-            'patterns': [],
-            'issues': ['Password is empty'],
-            'recommendations': ['Enter a password to begin analysis']
-        }
+        return EMPTY_RESULT.to_dict()
     
-    def _calculate_entropy(self, password: str) -> float:
+    def _calculate_entropy(self, context: AnalysisContext) -> float:
         """Calculate password entropy in bits"""
-        if not password:
-            return 0
-        
-        # Determine character set size
-        charset_size = 0
-        if re.search(r'[a-z]', password):
-            charset_size += 26
-        if re.search(r'[A-Z]', password):
-            charset_size += 26
-        if re.search(r'[0-9]', password):
-            charset_size += 10
-        if re.search(r'[^a-zA-Z0-9]', password):
-            charset_size += 32  # Approximate special characters
-        
-        if charset_size == 0:
+        if not context.length or context.charset_size == 0:
             return 0
         
         # Entropy = log2(charset_size^length)
-        entropy = len(password) * math.log2(charset_size)
+        bits_per_char = math.log2(context.charset_size)
+        entropy = context.length * bits_per_char
         
-        # Reduce entropy for detected patterns
-        pattern_penalty = len(self._detect_patterns(password)) * 5
+        # Characters inside matched spans are predictable; spanless patterns cost a flat amount
+        span_penalty = context.covered_chars * max(0, bits_per_char - MATCHED_CHAR_BITS)
+        pattern_penalty = span_penalty + context.unspanned_patterns * UNSPANNED_PATTERN_PENALTY
         return max(0, entropy - pattern_penalty)
     
     def _analyze_character_types(self, password: str) -> Dict[str, bool]:
         """Analyze what types of characters are present"""
-        return {
-            'lowercase': bool(re.search(r'[a-z]', password)),
-            'uppercase': bool(re.search(r'[A-Z]', password)),
-            'numbers': bool(re.search(r'[0-9]', password)),
-            'special_chars': bool(re.search(r'[^a-zA-Z0-9]', password))
-        }
+        return AnalysisContext(password).character_types
+    
+    @property
+    def common_passwords(self) -> DictionaryIndex:
+        if self._common_passwords is None:
+            self._common_passwords = common_password_index()
+        return self._common_passwords
+    
+    def find_common_base(self, password: str) -> Optional[BaseWordMatch]:
+        """Return the built-in wordlist entry behind password and how it was transformed, if any"""
+        return self.common_passwords.match(password)
     
     def _is_common_password(self, password: str) -> bool:
         """Check if password is in common password lists"""
-        return password.lower() in self.common_passwords
+        return self._is_common_lowered(password.lower())
+    
+    def _is_common_lowered(self, lowered: str) -> bool:
+        """Check an already lowercased password against the built-in list and breach index"""
+        common_passwords = self._common_passwords
+        if common_passwords is None:
+            common_passwords = self._common_passwords = common_password_index()
+        # Covers leetspeak and affixed variants of every built-in entry
+        instrumentation = self.instrumentation
+        found = common_passwords.lookup(lowered) is not None
+        if instrumentation is not None:
+            instrumentation.record_lookup('builtin_wordlist', found)
+        if found:
+            return True
+        if self.breach_index is None and self.prefilter is None:
+            return False
+        
+        digest = full_digest(lowered)
+        if self.prefilter is not None:
+            passed = self.prefilter.might_contain_digest(digest)
+            if instrumentation is not None:
+                instrumentation.record_lookup('prefilter', passed)
+            if not passed:
+                return False
+        if self.breach_index is None:
+            # Filter-only mode: a hit is reported as common at the filter's false-positive rate
+            return True
+        found = self.breach_index.contains_digest(digest[:self.breach_index.digest_size])
+        if instrumentation is not None:
+            instrumentation.record_lookup('breach_index', found)
+        return found
     
     def _detect_patterns(self, password: str) -> List[str]:
         """Detect common patterns that weaken passwords"""
-        patterns = []
-        
-        # Sequential characters
-        if re.search(r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)', password.lower()):
-            patterns.append("Contains sequential alphabetic characters")
-        
-        if re.search(r'(123|234|345|456|567|678|789|890)', password):
-            patterns.append("Contains sequential numeric characters")
-        
-        # Repeated characters
-        if re.search(r'(.)\1{2,}', password):
-            patterns.append("Contains 3+ repeated characters")
-        
-        # Keyboard patterns
-        keyboard_patterns = ['qwert', 'asdf', 'zxcv', '12345', 'qazws']
-        for pattern in keyboard_patterns:
-            if pattern in password.lower():
-                patterns.append(f"Contains keyboard pattern: {pattern}")
-        
-        # Common substitutions
-        if re.search(r'[4@]', password) and 'a' not in password.lower():
-            patterns.append("Uses common character substitution (4/@/a)")
-        
-        if re.search(r'[3]', password) and 'e' not in password.lower():
-            patterns.append("Uses common character substitution (3/e)")
-        
-        if re.search(r'[1!]', password) and 'i' not in password.lower():
-            patterns.append("Uses common character substitution (1/!/i)")
-        
-        # Date patterns
-        if re.search(r'(19|20)\d{2}', password):
-            patterns.append("Contains year pattern")
-        
-        if re.search(r'(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])', password):
-            patterns.append("Contains date pattern")
-        
-        # Common words with numbers
-        if re.search(r'(password|admin|user|login|welcome|secret)\d*', password.lower()):
-            patterns.append("Contains common word with numbers")
-        
-        return patterns
+        return PatternScan(password).patterns
     
-    def _calculate_score(self, password: str, analysis: Dict) -> int:
+    def _calculate_score(self, context: AnalysisContext, analysis: AnalysisResult) -> int:
         """Calculate overall password strength score (0-100)"""
         score = 0
         
         # Length scoring (0-25 points)
-        length = len(password)
+        length = context.length
         if length >= 12:
             score += 25
         elif length >= 8:
@@ -155,10 +688,10 @@ class PasswordAnalyzer:
             score += 5
         
         # Character variety (0-20 points)
-        score += analysis['character_variety'] * 5
+        score += analysis.character_variety * 5
         
         # Entropy scoring (0-30 points)
-        entropy = analysis['entropy']
+        entropy = analysis.entropy
         if entropy >= 60:
             score += 30
         elif entropy >= 40:
@@ -169,15 +702,15 @@ class PasswordAnalyzer:
             score += 5
         
         # Pattern penalties (0-15 points deduction)
-        pattern_penalty = len(analysis['patterns']) * 3
+        pattern_penalty = analysis.pattern_count * 3
         score -= min(pattern_penalty, 15)
         
         # Common password penalty (-20 points)
-        if analysis['is_common']:
+        if analysis.is_common:
             score -= 20
         
         # Bonus for very long passwords with high variety
-        if length >= 16 and analysis['character_variety'] >= 3:
+        if length >= 16 and analysis.character_variety >= 3:
             score += 10
         
         # Bonus for high entropy passwords
@@ -186,74 +719,124 @@ class PasswordAnalyzer:
         
         return max(0, min(100, score))
     
-    def _identify_issues(self, password: str, analysis: Dict) -> List[str]:
-        """Identify specific security issues"""
-        issues = []
+    def _identify_issues(self, context: AnalysisContext, analysis: AnalysisResult) -> int:
+        """Identify specific security issues as Issue codes"""
+        issues = 0
+        flags = analysis.character_flags
         
-        if len(password) < 8:
-            issues.append("Password is too short (minimum 8 characters recommended)")
+        if context.length < 8:
+            issues |= Issue.TOO_SHORT
         
-        if analysis['character_variety'] < 3:
-            issues.append("Password lacks character variety (use uppercase, lowercase, numbers, and symbols)")
+        if analysis.character_variety < 3:
+            issues |= Issue.LOW_VARIETY
         
-        if not analysis['character_types']['uppercase']:
-            issues.append("Missing uppercase letters")
+        if not flags & UPPERCASE:
+            issues |= Issue.MISSING_UPPERCASE
         
-        if not analysis['character_types']['numbers']:
-            issues.append("Missing numbers")
+        if not flags & NUMBERS:
+            issues |= Issue.MISSING_NUMBERS
         
-        if not analysis['character_types']['special_chars']:
-            issues.append("Missing special characters")
+        if not flags & SPECIAL_CHARS:
+            issues |= Issue.MISSING_SPECIAL_CHARS
         
-        if analysis['entropy'] < 30:
-            issues.append("Low password entropy (predictable)")
+        if analysis.entropy < 30:
+            issues |= Issue.LOW_ENTROPY
         
-        if len(analysis['patterns']) > 2:
-            issues.append("Multiple predictable patterns detected")
+        if analysis.pattern_count > 2:
+            issues |= Issue.MULTIPLE_PATTERNS
         
-        if analysis['is_common']:
-            issues.append("Password found in common password databases")
+        if analysis.is_common:
+            issues |= Issue.COMMON_PASSWORD
         
         # Check for personal information patterns
-        if re.search(r'(admin|user|password|login|welcome|secret|123)', password.lower()):
-            issues.append("Contains common dictionary words")
+        if context.has_dictionary_word:
+            issues |= Issue.DICTIONARY_WORDS
         
         return issues
     
-    def _generate_recommendations(self, password: str, analysis: Dict) -> List[str]:
-        """Generate specific recommendations for improvement"""
-        recommendations = []
+    def _generate_recommendations(self, context: AnalysisContext, analysis: AnalysisResult) -> int:
+        """Generate specific recommendations for improvement as Recommendation codes"""
+        recommendations = 0
+        flags = analysis.character_flags
         
-        if len(password) < 12:
-            recommendations.append("Increase password length to at least 12 characters")
+        if context.length < 12:
+            recommendations |= Recommendation.INCREASE_LENGTH
         
-        if not analysis['character_types']['uppercase']:
-            recommendations.append("Add uppercase letters (A-Z)")
+        if not flags & UPPERCASE:
+            recommendations |= Recommendation.ADD_UPPERCASE
         
-        if not analysis['character_types']['lowercase']:
-            recommendations.append("Add lowercase letters (a-z)")
+        if not flags & LOWERCASE:
+            recommendations |= Recommendation.ADD_LOWERCASE
         
-        if not analysis['character_types']['numbers']:
-            recommendations.append("Add numbers (0-9)")
+        if not flags & NUMBERS:
+            recommendations |= Recommendation.ADD_NUMBERS
         
-        if not analysis['character_types']['special_chars']:
-            recommendations.append("Add special characters (!@#$%^&*)")
+        if not flags & SPECIAL_CHARS:
+            recommendations |= Recommendation.ADD_SPECIAL_CHARS
         
-        if analysis['patterns']:
-            recommendations.append("Avoid predictable patterns and sequences")
+        if analysis.pattern_codes:
+            recommendations |= Recommendation.AVOID_PATTERNS
         
-        if analysis['is_common']:
-            recommendations.append("Use a unique password not found in common lists")
+        if analysis.is_common:
+            recommendations |= Recommendation.USE_UNIQUE_PASSWORD
         
-        if analysis['entropy'] < 50:
-            recommendations.append("Increase randomness by avoiding predictable combinations")
+        if analysis.entropy < 50:
+            recommendations |= Recommendation.INCREASE_RANDOMNESS
         
         # Advanced recommendations
-        if analysis['score'] < 80:
-            recommendations.extend([
-                "Consider using a passphrase with random words",
-                "Use a password manager to generate and store strong passwords",
-                "Enable two-factor authentication for additional security"
-            ])
+        if analysis.score < 80:
+            recommendations |= Recommendation.ADVANCED
         
         return recommendations
+
+
+# Every analysis stage in run order, as (name, stage(analyzer, context, analysis)); the plain and the instrumented
+# paths both walk these lists, so a new stage is added in one place and is timed automatically
+def _stage_patterns(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: None):
+    PatternScan.__init__(context, context.password)
+
+
+def _stage_character_types(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: None):
+    context._classify_characters()
+
+
+def _stage_entropy(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: AnalysisResult):
+    analysis.entropy = analyzer._calculate_entropy(context)
+
+
+def _stage_common_lookup(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: AnalysisResult):
+    analysis.is_common = analyzer._is_common_lowered(context.lowered)
+
+
+def _stage_score(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: AnalysisResult):
+    analysis.score = analyzer._calculate_score(context, analysis)
+
+
+def _stage_issues(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: AnalysisResult):
+    analysis.issue_codes = analyzer._identify_issues(context, analysis)
+
+
+def _stage_recommendations(analyzer: PasswordAnalyzer, context: AnalysisContext, analysis: AnalysisResult):
+    analysis.recommendation_codes = analyzer._generate_recommendations(context, analysis)
+
+
+# Scan stages fill the shared context; scoring stages fill the result from it
+SCAN_STAGES = (
+    ('patterns', _stage_patterns),
+    ('character_types', _stage_character_types)
+)
+SCORING_STAGES = (
+    ('entropy', _stage_entropy),
+    ('common_lookup', _stage_common_lookup),
+    ('score', _stage_score),
+    ('issues', _stage_issues),
+    ('recommendations', _stage_recommendations)
+)
+ANALYSIS_STAGES = SCAN_STAGES + SCORING_STAGES
+# A truncated prefix is not the password, so bounded-cost mode skips the word list lookup
+PREFIX_SCORING_STAGES = tuple(stage for stage in SCORING_STAGES if stage[0] != 'common_lookup')
+
+if __name__ == "__main__":
+    import sys
+    from cli import main
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+Strong password and passphrase generation from the secrets module
+Randomness is read from os.urandom in large blocks and turned into unbiased indices with numpy, so bulk runs
+(e.g. a million credentials for provisioning) make one system call per block rather than per character.
+Outputs can be sized for a target entropy or a policy file, and optionally verified with PasswordAnalyzer.
+Usage: python password_generator.py [--count N] [--passphrase] [--length N | --entropy BITS] [--words N]
+                                    [--verify] [--min-score N] [--policy POLICIES.toml ...] [-o OUTPUT]
+"""
+
+import argparse
+import math
+import os
+import secrets
+import string
+import sys
+import time
+from itertools import chain, combinations, repeat, tee
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from password_analyzer import LOWERCASE, NUMBERS, SPECIAL_CHARS, UPPERCASE, AnalysisResult, PasswordAnalyzer
+from passphrase_words import WORDS
+
+# Symbols that survive shells, CSV and most password field rules
+SYMBOLS = '!#$%&*+-=?@^_~'
+AMBIGUOUS = 'Il1O0o'
+CLASS_CHARS = {
+    LOWERCASE: string.ascii_lowercase,
+    UPPERCASE: string.ascii_uppercase,
+    NUMBERS: string.digits,
+    SPECIAL_CHARS: SYMBOLS
+}
+ALL_CLASSES = LOWERCASE | UPPERCASE | NUMBERS | SPECIAL_CHARS
+# Policy flag features and the character class each one controls
+CLASS_FEATURES = {'lowercase': LOWERCASE, 'uppercase': UPPERCASE, 'numbers': NUMBERS, 'special_chars': SPECIAL_CHARS}
+
+DEFAULT_LENGTH = 16
+DEFAULT_WORD_COUNT = 6
+DEFAULT_SEPARATOR = '-'
+# Separator for policies that forbid symbols and capitals
+DIGIT_SEPARATOR = '0'
+# Bytes fetched from os.urandom per refill
+DEFAULT_BLOCK_SIZE = 1 << 16
+DEFAULT_BATCH_SIZE = 10_000
+# Verification: the analyzer's Medium threshold, and how many rejections in a row mean the criteria cannot be met
+DEFAULT_MIN_SCORE = 60
+MAX_FRUITLESS_CANDIDATES = 1000
+
+
+class SecureRandomBuffer:
+    """Uniform integers from os.urandom, fetched in large blocks instead of one call per character"""
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.refills = 0
+        self._buffer = b''
+        self._offset = 0
+
+    def _take(self, size: int) -> bytes:
+        available = len(self._buffer) - self._offset
+        if available < size:
+            self._buffer = self._buffer[self._offset:] + secrets.token_bytes(max(self.block_size, size - available))
+            self._offset = 0
+            self.refills += 1
+        chunk = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return chunk
+
+    def below(self, n: int, count: int) -> np.ndarray:
+        """count integers uniform in [0, n); out-of-range draws are rejected, so no value is favoured"""
+        if not 1 <= n <= 1 << 32:
+            raise ValueError("n must be between 1 and 2**32")
+        dtype = np.uint8 if n <= 1 << 8 else np.uint16 if n <= 1 << 16 else np.uint32
+        span = 1 << 8 * np.dtype(dtype).itemsize
+        limit = span - span % n
+        parts = [np.empty(0, dtype)]
+        needed = count
+        while needed > 0:
+            # Ask for enough extra draws that one round usually covers the rejections
+            draws = needed + needed * (span - limit) // limit + 16
+            values = np.frombuffer(self._take(draws * np.dtype(dtype).itemsize), dtype=dtype)
+            if limit < span:
+                values = values[values < limit]
+            values = values[:needed]
+            parts.append(values)
+            needed -= len(values)
+        values = np.concatenate(parts)
+        return values.astype(np.uint32) % n
+
+
+def _class_alphabets(classes: int, symbols: str, exclude_ambiguous: bool) -> Dict[int, str]:
+    alphabets = {}
+    for flag, chars in CLASS_CHARS.items():
+        if not classes & flag:
+            continue
+        if flag == SPECIAL_CHARS:
+            chars = symbols
+        if exclude_ambiguous:
+            chars = ''.join(ch for ch in chars if ch not in AMBIGUOUS)
+        if chars:
+            alphabets[flag] = chars
+    return alphabets
+
+
+def password_entropy(class_sizes: Sequence[int], length: int, require_each: bool = True) -> float:
+    """Bits of entropy of a uniform password over the union of classes; require_each counts only
+    passwords containing every class (inclusion-exclusion over the classes left out)"""
+    total = sum(class_sizes)
+    if not require_each:
+        return length * math.log2(total)
+    valid = 0
+    for missing in range(len(class_sizes) + 1):
+        for left_out in combinations(class_sizes, missing):
+            valid += (-1) ** missing * (total - sum(left_out)) ** length
+    return math.log2(valid) if valid > 0 else 0.0
+
+
+class PasswordGenerator:
+    """Random character passwords of a fixed length, containing at least one of each chosen class"""
+
+    def __init__(self, length: Optional[int] = None, entropy_bits: Optional[float] = None, classes: int = ALL_CLASSES,
+                 symbols: str = SYMBOLS, exclude_ambiguous: bool = False, require_each: bool = True,
+                 source: Optional[SecureRandomBuffer] = None):
+        if not set(symbols) <= set(string.punctuation):
+            raise ValueError("symbols must be printable ASCII punctuation")
+        # A repeated symbol would be drawn more often and counted twice in the entropy
+        symbols = ''.join(dict.fromkeys(symbols))
+        alphabets = _class_alphabets(classes, symbols, exclude_ambiguous)
+        if not alphabets:
+            raise ValueError("Choose at least one character class")
+        self.classes = list(alphabets)
+        self.require_each = require_each
+        self.alphabet = ''.join(alphabets.values())
+        sizes = [len(chars) for chars in alphabets.values()]
+        minimum = len(sizes) if require_each else 1
+        if length is None:
+            length = minimum
+            if entropy_bits is None:
+                length = max(length, DEFAULT_LENGTH)
+            else:
+                while password_entropy(sizes, length, require_each) < entropy_bits:
+                    length += 1
+        if length < minimum:
+            raise ValueError(f"length must be at least {minimum} to include every character class")
+        self.length = length
+        self.entropy = password_entropy(sizes, length, require_each)
+        self.source = source if source is not None else SecureRandomBuffer()
+        self._codes = np.frombuffer(self.alphabet.encode('ascii'), dtype=np.uint8)
+        # Per class, a lookup from alphabet index to membership
+        self._members = []
+        start = 0
+        for size in sizes:
+            member = np.zeros(len(self.alphabet), dtype=bool)
+            member[start:start + size] = True
+            self._members.append(member)
+            start += size
+
+    def generate(self, count: int) -> List[str]:
+        """count independent passwords"""
+        if count <= 0:
+            return []
+        length = self.length
+        rows = []
+        needed = count
+        while needed > 0:
+            indices = self.source.below(len(self.alphabet), needed * length).reshape(needed, length)
+            if self.require_each and len(self._members) > 1:
+                # Redraw the rows missing a class rather than patching them, which would bias positions
+                keep = np.ones(needed, dtype=bool)
+                for member in self._members:
+                    keep &= member[indices].any(axis=1)
+                indices = indices[keep]
+            rows.append(indices)
+            needed -= len(indices)
+        text = self._codes[np.concatenate(rows)].tobytes().decode('ascii')
+        return [text[start:start + length] for start in range(0, count * length, length)]
+
+
+class PassphraseGenerator:
+    """Passphrases of words drawn uniformly from the bundled list"""
+
+    def __init__(self, word_count: Optional[int] = None, entropy_bits: Optional[float] = None,
+                 separator: str = DEFAULT_SEPARATOR, capitalize: bool = False, digit: bool = False,
+                 words: Sequence[str] = WORDS, source: Optional[SecureRandomBuffer] = None):
+        words = list(dict.fromkeys(words))
+        if len(words) < 2:
+            raise ValueError("The word list needs at least two distinct words")
+        # The entropy counts each word list choice, which holds only while word boundaries stay visible
+        if any(ch.isalpha() for ch in separator) or not separator and not capitalize:
+            raise ValueError("Use a separator without letters, or capitalize the words, so word boundaries "
+                             "stay unambiguous")
+        self.words = [word.capitalize() for word in words] if capitalize else words
+        self.separator = separator
+        self.digit = digit
+        bits_per_word = math.log2(len(words))
+        if word_count is None:
+            if entropy_bits is None:
+                word_count = DEFAULT_WORD_COUNT
+            else:
+                word_count = 1
+                while self._entropy(word_count, bits_per_word) < entropy_bits:
+                    word_count += 1
+        if word_count < 1:
+            raise ValueError("word_count must be at least 1")
+        self.word_count = word_count
+        self.entropy = self._entropy(word_count, bits_per_word)
+        self.source = source if source is not None else SecureRandomBuffer()
+        self._words = np.array(self.words, dtype=object)
+
+    def _entropy(self, word_count: int, bits_per_word: float) -> float:
+        # One digit after one of the words adds log2(10 * word_count) bits
+        return word_count * bits_per_word + (math.log2(10 * word_count) if self.digit else 0.0)
+
+    def generate(self, count: int) -> List[str]:
+        """count independent passphrases"""
+        if count <= 0:
+            return []
+        indices = self.source.below(len(self.words), count * self.word_count).reshape(count, self.word_count)
+        rows = self._words[indices].tolist()
+        if self.digit:
+            positions = self.source.below(self.word_count, count).tolist()
+            digits = self.source.below(10, count).tolist()
+            for row, position, digit in zip(rows, positions, digits):
+                row[position] += str(digit)
+        separator = self.separator
+        return [separator.join(row) for row in rows]
+
+
+def _policy_bounds(policies, feature: str):
+    """Tightest (low, high) a policy set puts on one numeric feature"""
+    low, high = None, None
+    for check, threshold in policies.thresholds(feature):
+        if check in ('min', 'equals'):
+            low = threshold if low is None else max(low, threshold)
+        if check in ('max', 'equals'):
+            high = threshold if high is None else min(high, threshold)
+    return low, high
+
+
+def _policy_classes(policies):
+    """Character classes the policies require and forbid"""
+    required = forbidden = 0
+    for feature, flag in CLASS_FEATURES.items():
+        for check, threshold in policies.thresholds(feature):
+            if check == 'equals':
+                if threshold:
+                    required |= flag
+                else:
+                    forbidden |= flag
+    return required, forbidden
+
+
+def generator_for_policy(policies, passphrase: bool = False, entropy_bits: Optional[float] = None, **options):
+    """Generator shaped so its outputs usually satisfy every policy; verification still checks each one"""
+    required, forbidden = _policy_classes(policies)
+    if required & forbidden:
+        raise ValueError("The policies both require and forbid a character class")
+    min_length, max_length = _policy_bounds(policies, 'length')
+    if passphrase:
+        if forbidden & LOWERCASE:
+            raise ValueError("Passphrases need lowercase letters")
+        separator = options.pop('separator', DEFAULT_SEPARATOR)
+        if forbidden & UPPERCASE:
+            options['capitalize'] = False
+        if forbidden & NUMBERS:
+            options['digit'] = False
+        if forbidden & SPECIAL_CHARS:
+            # Words still need a visible boundary: a capital starting each word, or failing that a digit
+            if not forbidden & UPPERCASE:
+                separator = ''
+                options['capitalize'] = True
+            elif not forbidden & NUMBERS:
+                separator = DIGIT_SEPARATOR
+            else:
+                raise ValueError("The policies forbid every character that could separate passphrase words")
+        elif required & SPECIAL_CHARS and (not separator or separator.isalnum()):
+            separator = DEFAULT_SEPARATOR
+        options.setdefault('capitalize', bool(required & UPPERCASE))
+        options.setdefault('digit', bool(required & NUMBERS))
+        generator = PassphraseGenerator(entropy_bits=entropy_bits, separator=separator, **options)
+        if min_length is not None and options.get('word_count') is None:
+            # Add words until a typical passphrase reaches the minimum length
+            average = sum(map(len, generator.words)) / len(generator.words) + len(separator)
+            word_count = max(generator.word_count, math.ceil((min_length + len(separator)) / average))
+            if word_count != generator.word_count:
+                options['word_count'] = word_count
+                generator = PassphraseGenerator(separator=separator, **options)
+        return generator
+    classes = options.pop('classes', ALL_CLASSES) & ~forbidden | required
+    length = options.pop('length', None)
+    generator = PasswordGenerator(length=length, entropy_bits=entropy_bits, classes=classes, **options)
+    if length is None and min_length is not None and generator.length < min_length:
+        generator = PasswordGenerator(length=math.ceil(min_length), classes=classes, **options)
+    if max_length is not None and generator.length > max_length:
+        raise ValueError(f"The policies allow at most {max_length} characters, "
+                         f"but {generator.length} are needed")
+    return generator
+
+
+def analyze_fresh(analyzer: PasswordAnalyzer, passwords: List[str]) -> List[AnalysisResult]:
+    """Analyze newly generated secrets; they never repeat, so they bypass (and stay out of) the analysis cache"""
+    return [analyzer.analyze(password, use_cache=False) for password in passwords]
+
+
+def generate_verified(generator, count: int, analyzer: Optional[PasswordAnalyzer] = None, policies=None,
+                      min_score: int = DEFAULT_MIN_SCORE, workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                      stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+    """Yield count outputs that the analyzer accepts, redrawing any it rejects
+
+    An output is accepted when it passes every policy, or without policies when it is not a common
+    password and scores at least min_score. stats, if given, counts candidates generated and rejected.
+    """
+    analyzer = analyzer if analyzer is not None else PasswordAnalyzer()
+    if stats is None:
+        stats = {}
+    stats.setdefault('generated', 0)
+    stats.setdefault('rejected', 0)
+    # Endless candidates; the worker pool pulls only as many as it has chunks in flight
+    batch_size = max(1, min(batch_size, count))
+    candidates = chain.from_iterable(generator.generate(batch_size) for _ in repeat(None))
+    passwords, originals = tee(candidates)
+    results = analyzer.map_chunks(analyze_fresh, passwords, workers, min(batch_size, 1000))
+    accepted = 0
+    fruitless = 0
+    try:
+        for password, result in zip(originals, chain.from_iterable(results)):
+            stats['generated'] += 1
+            if policies is not None:
+                passed = all(outcome.passed for outcome in policies.evaluate(result, password))
+            else:
+                passed = not result.is_common and result.score >= min_score
+            if not passed:
+                stats['rejected'] += 1
+                fruitless += 1
+                if fruitless >= MAX_FRUITLESS_CANDIDATES:
+                    raise ValueError(f"{fruitless} candidates in a row were rejected; "
+                                     f"the generator settings cannot meet the verification criteria")
+                continue
+            fruitless = 0
+            yield password
+            accepted += 1
+            if accepted >= count:
+                return
+    finally:
+        # Shuts down the worker pool and drops any chunks still in flight
+        results.close()
+
+
+def generate(generator, count: int, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+    """Yield count outputs, generated batch_size at a time"""
+    while count > 0:
+        batch = min(batch_size, count)
+        yield from generator.generate(batch)
+        count -= batch
+
+
+def write_lines(lines: Iterable[str], sink: TextIO, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Write one output per line, a batch per write call; returns the count written"""
+    written = 0
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            sink.write('\n'.join(batch) + '\n')
+            written += len(batch)
+            batch.clear()
+    if batch:
+        sink.write('\n'.join(batch) + '\n')
+        written += len(batch)
+    return written
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate strong passwords or passphrases")
+    parser.add_argument('--count', type=int, default=1, help="outputs to generate (default: %(default)s)")
+    parser.add_argument('--passphrase', action='store_true', help="generate word passphrases")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--length', type=int, help=f"password length (default: {DEFAULT_LENGTH})")
+    size.add_argument('--words', type=int, help=f"passphrase words (default: {DEFAULT_WORD_COUNT})")
+    size.add_argument('--entropy', type=float, help="smallest length or word count reaching this many bits")
+    parser.add_argument('--separator', default=DEFAULT_SEPARATOR, help="passphrase separator (default: %(default)s)")
+    parser.add_argument('--capitalize', action='store_true', help="capitalize passphrase words")
+    parser.add_argument('--digit', action='store_true', help="add a random digit to one passphrase word")
+    parser.add_argument('--symbols', default=SYMBOLS, help="password symbol set (default: %(default)s)")
+    parser.add_argument('--no-symbols', action='store_true', help="letters and digits only")
+    parser.add_argument('--no-ambiguous', action='store_true', help=f"leave out look-alike characters ({AMBIGUOUS})")
+    parser.add_argument('--verify', action='store_true', help="analyze every output and redraw weak ones")
+    parser.add_argument('--min-score', type=int, default=DEFAULT_MIN_SCORE,
+                        help="lowest accepted score when verifying without a policy (default: %(default)s)")
+    parser.add_argument('--policy', action='append', metavar='PATH',
+                        help="JSON or TOML policy file every output must pass (repeatable; implies --verify)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="verification worker processes; 0 uses every core (default: %(default)s)")
+    parser.add_argument('-o', '--output', default='-', help="output file, or - for stdout (default)")
+    args = parser.parse_args(argv)
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.passphrase and args.length is not None:
+        parser.error("--length applies to passwords; use --words or --entropy with --passphrase")
+    if not args.passphrase and args.words is not None:
+        parser.error("--words applies to passphrases; use --length or --entropy")
+
+    policies = None
+    try:
+        if args.passphrase:
+            options = {'word_count': args.words, 'separator': args.separator, 'capitalize': args.capitalize,
+                       'digit': args.digit}
+        else:
+            options = {'length': args.length, 'symbols': args.symbols, 'exclude_ambiguous': args.no_ambiguous,
+                       'classes': ALL_CLASSES & ~SPECIAL_CHARS if args.no_symbols else ALL_CLASSES}
+        if args.policy:
+            from policy_engine import PolicyEngine, load_policies
+            policies = PolicyEngine([policy for path in args.policy for policy in load_policies(path)])
+            for name in ('capitalize', 'digit'):
+                # Leave these to the policy unless asked for
+                if not options.get(name, True):
+                    del options[name]
+            generator = generator_for_policy(policies, args.passphrase, args.entropy, **options)
+        elif args.passphrase:
+            generator = PassphraseGenerator(entropy_bits=args.entropy, **options)
+        else:
+            generator = PasswordGenerator(entropy_bits=args.entropy, **options)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    stats: Dict[str, int] = {}
+    if args.verify or policies is not None:
+        workers = None if args.workers == 0 else args.workers
+        outputs = generate_verified(generator, args.count, policies=policies, min_score=args.min_score,
+                                    workers=workers, stats=stats)
+    else:
+        outputs = generate(generator, args.count)
+
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='\n')
+    started = time.perf_counter()
+    try:
+        written = write_lines(outputs, sink)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into head); point stdout at devnull so the
+        # flush at interpreter exit does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - started
+    kind = 'passphrases' if args.passphrase else 'passwords'
+    message = f"{written} {kind} at {generator.entropy:.1f} bits each in {elapsed:.2f} s ({written / elapsed:,.0f}/s)"
+    if stats:
+        message += f"; {stats['rejected']} of {stats['generated']} candidates rejected by verification"
+    print(message, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Multi-pattern literal matcher for password pattern detection
+Builds an Aho-Corasick automaton once so every literal detector runs in a single linear pass
+"""
+
+from collections import deque
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+
+class Match(NamedTuple):
+    """A literal hit: [start, end) span in the scanned text"""
+    start: int
+    end: int
+    category: str
+    token: str
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton over (literal, category) pairs"""
+
+    ROOT = 0
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        goto = [{}]
+        outputs = [[]]
+
+        # Build the trie
+        for literal, category in patterns:
+            if not literal:
+                continue
+            state = self.ROOT
+            for ch in literal:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            hit = (len(literal), category, literal)
+            if hit not in outputs[state]:
+                outputs[state].append(hit)
+
+        # Failure links in breadth-first order; outputs inherit from the failure state
+        fail = [self.ROOT] * len(goto)
+        queue = deque(goto[self.ROOT].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, self.ROOT)
+                fail[next_state] = target if target != next_state else self.ROOT
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(hits) for hits in outputs]
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def step(self, state: int, ch: str) -> int:
+        """Advance the automaton by one character"""
+        goto = self._goto
+        fail = self._fail
+        while state and ch not in goto[state]:
+            state = fail[state]
+        return goto[state].get(ch, self.ROOT)
+
+    def outputs(self, state: int) -> Tuple[Tuple[int, str, str], ...]:
+        """Return (length, category, literal) hits ending at this state"""
+        return self._outputs[state]
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """Yield every (possibly overlapping) literal hit in text"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = self.ROOT
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, self.ROOT)
+            if outputs[state]:
+                end = index + 1
+                for length, category, literal in outputs[state]:
+                    yield Match(end - length, end, category, literal)
+
+    def find_all(self, text: str) -> List[Match]:
+        """Return every literal hit in text"""
+        return list(self.iter_matches(text))
@@ -0,0 +1,324 @@
+"""
+Declarative password policies compiled into one shared evaluation plan
+Policies are JSON or TOML lists of rules over analysis features; compiling merges identical checks across
+policies, so a batch is analyzed once and each result is checked against every policy in a single pass
+Usage: python policy_engine.py POLICY_FILE [--show-plan]
+
+Policy file layout (JSON shown; TOML uses [[policies]] and [[policies.rules]] tables):
+    {"policies": [{"name": "finance", "rules": [
+        {"code": "MIN_LENGTH", "feature": "length", "min": 12},
+        {"code": "NOT_COMMON", "feature": "is_common", "equals": false}
+    ]}]}
+Each rule names one feature and any of min (>=), max (<=) or equals; it is violated when a check fails.
+"""
+
+import argparse
+import json
+import operator
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from password_analyzer import (ALPHA_SEQUENCE, CATEGORY_BITS, COMMON_WORD, DATE, KEYBOARD_BITS, LOWERCASE, NUMBERS,
+                               NUMERIC_SEQUENCE, REPEAT, SPECIAL_CHARS, SUBSTITUTION_A, SUBSTITUTION_E,
+                               SUBSTITUTION_I, UPPERCASE, YEAR, AnalysisResult, Issue)
+
+# Feature kinds: numbers accept min/max/equals, flags accept equals only
+NUMBER = 'number'
+FLAG = 'flag'
+
+SEQUENCE_BITS = CATEGORY_BITS[ALPHA_SEQUENCE] | CATEGORY_BITS[NUMERIC_SEQUENCE]
+KEYBOARD_PATTERN_BITS = sum(KEYBOARD_BITS.values())
+SUBSTITUTION_BITS = SUBSTITUTION_A | SUBSTITUTION_E | SUBSTITUTION_I
+
+# Features read straight off an AnalysisResult
+FEATURES: Dict[str, Tuple[str, Callable[[AnalysisResult], object]]] = {
+    'length': (NUMBER, lambda result: result.length),
+    'score': (NUMBER, lambda result: result.score),
+    'entropy': (NUMBER, lambda result: result.entropy),
+    'character_variety': (NUMBER, lambda result: result.character_variety),
+    'pattern_count': (NUMBER, lambda result: result.pattern_count),
+    'lowercase': (FLAG, lambda result: bool(result.character_flags & LOWERCASE)),
+    'uppercase': (FLAG, lambda result: bool(result.character_flags & UPPERCASE)),
+    'numbers': (FLAG, lambda result: bool(result.character_flags & NUMBERS)),
+    'special_chars': (FLAG, lambda result: bool(result.character_flags & SPECIAL_CHARS)),
+    'is_common': (FLAG, lambda result: result.is_common),
+    'dictionary_word': (FLAG, lambda result: bool(result.issue_codes & Issue.DICTIONARY_WORDS)),
+    'truncated': (FLAG, lambda result: bool(result.issue_codes & Issue.TRUNCATED)),
+    'sequence_pattern': (FLAG, lambda result: bool(result.pattern_codes & SEQUENCE_BITS)),
+    'repeat_pattern': (FLAG, lambda result: bool(result.pattern_codes & CATEGORY_BITS[REPEAT])),
+    'keyboard_pattern': (FLAG, lambda result: bool(result.pattern_codes & KEYBOARD_PATTERN_BITS)),
+    'substitution_pattern': (FLAG, lambda result: bool(result.pattern_codes & SUBSTITUTION_BITS)),
+    'year_pattern': (FLAG, lambda result: bool(result.pattern_codes & CATEGORY_BITS[YEAR])),
+    'date_pattern': (FLAG, lambda result: bool(result.pattern_codes & CATEGORY_BITS[DATE])),
+    'common_word_pattern': (FLAG, lambda result: bool(result.pattern_codes & CATEGORY_BITS[COMMON_WORD]))
+}
+# Features that need the password itself; computed only when some policy uses them
+PASSWORD_FEATURES = {'guesses_log10': NUMBER}
+
+CHECKS = {'min': operator.ge, 'max': operator.le, 'equals': operator.eq}
+# Anything else in a rule is a typo whose check would silently go missing
+RULE_KEYS = ('code', 'feature', *CHECKS)
+
+# The checks behind PasswordAnalyzer._identify_issues, with Issue names as rule codes
+BUILTIN_POLICY = {
+    'name': 'builtin',
+    'rules': [
+        {'code': 'TOO_SHORT', 'feature': 'length', 'min': 8},
+        {'code': 'LOW_VARIETY', 'feature': 'character_variety', 'min': 3},
+        {'code': 'MISSING_UPPERCASE', 'feature': 'uppercase', 'equals': True},
+        {'code': 'MISSING_NUMBERS', 'feature': 'numbers', 'equals': True},
+        {'code': 'MISSING_SPECIAL_CHARS', 'feature': 'special_chars', 'equals': True},
+        {'code': 'LOW_ENTROPY', 'feature': 'entropy', 'min': 30},
+        {'code': 'MULTIPLE_PATTERNS', 'feature': 'pattern_count', 'max': 2},
+        {'code': 'COMMON_PASSWORD', 'feature': 'is_common', 'equals': False},
+        {'code': 'DICTIONARY_WORDS', 'feature': 'dictionary_word', 'equals': False}
+    ]
+}
+
+
+class PolicyOutcome(NamedTuple):
+    """One policy's verdict on one password"""
+    policy: str
+    passed: bool
+    violations: Tuple[str, ...]
+
+
+def load_policies(path: str) -> List[Dict]:
+    """Read policies from a .toml or .json file holding one policy or a 'policies' list"""
+    if path.endswith('.toml'):
+        import tomllib
+        with open(path, 'rb') as handle:
+            document = tomllib.load(handle)
+    else:
+        with open(path, 'r', encoding='utf-8') as handle:
+            document = json.load(handle)
+    if isinstance(document, dict) and 'policies' in document:
+        document = document['policies']
+    policies = document if isinstance(document, list) else [document]
+    if not all(isinstance(policy, dict) for policy in policies):
+        raise ValueError(f"{path}: each policy must be a table/object with 'name' and 'rules'")
+    return policies
+
+
+def _feature_kind(feature: str) -> str:
+    if feature in FEATURES:
+        return FEATURES[feature][0]
+    if feature in PASSWORD_FEATURES:
+        return PASSWORD_FEATURES[feature]
+    choices = ', '.join(list(FEATURES) + list(PASSWORD_FEATURES))
+    raise ValueError(f"Unknown feature: {feature} (choose from {choices})")
+
+
+def _check_threshold(policy: str, code: str, kind: str, check: str, threshold):
+    if kind == FLAG:
+        if check != 'equals' or not isinstance(threshold, bool):
+            raise ValueError(f"{policy}/{code}: flag features take 'equals' with true or false")
+    elif isinstance(threshold, bool) or not isinstance(threshold, (int, float)):
+        raise ValueError(f"{policy}/{code}: '{check}' needs a number")
+
+
+class PolicyEngine:
+    """Compiled set of policies: each distinct check runs once per password, whichever policies share it"""
+
+    def __init__(self, policies: Iterable[Dict]):
+        self.names: List[str] = []
+        # Plan: feature slots to fill, then (slot, compare, threshold) checks, each owning one bit
+        self._features: List[str] = []
+        self._checks: List[Tuple[int, Callable, object]] = []
+        # Per policy: bitmask of its checks, and (rule checks, rule code) pairs to report on failure
+        self._policies: List[Tuple[int, Tuple[Tuple[int, str], ...]]] = []
+        check_bits: Dict[Tuple[str, str, object], int] = {}
+
+        for position, policy in enumerate(policies):
+            if not isinstance(policy, dict):
+                raise ValueError(f"Policy {position}: expected a table/object with 'name' and 'rules'")
+            name = policy.get('name')
+            rules = policy.get('rules')
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"Policy {position}: every policy needs a non-empty 'name'")
+            if name in self.names:
+                raise ValueError(f"Duplicate policy name: {name}")
+            if not isinstance(rules, list) or not rules:
+                raise ValueError(f"{name}: 'rules' must be a non-empty list")
+            mask = 0
+            codes = []
+            seen_codes = set()
+            for index, rule in enumerate(rules):
+                if not isinstance(rule, dict):
+                    raise ValueError(f"{name}: rule {index} must be a table/object, not {type(rule).__name__}")
+                unknown = [key for key in rule if key not in RULE_KEYS]
+                if unknown:
+                    raise ValueError(f"{name}: rule {index} has unknown key(s) {', '.join(map(str, unknown))} "
+                                     f"(allowed: {', '.join(RULE_KEYS)})")
+                code = rule.get('code')
+                if not isinstance(code, str) or not code:
+                    raise ValueError(f"{name}: rule {index} needs a 'code'")
+                if code in seen_codes:
+                    raise ValueError(f"{name}: duplicate rule code {code}")
+                seen_codes.add(code)
+                feature = rule.get('feature')
+                if not isinstance(feature, str):
+                    raise ValueError(f"{name}/{code}: 'feature' must name a feature")
+                kind = _feature_kind(feature)
+                checks = [(check, rule[check]) for check in CHECKS if check in rule]
+                if not checks:
+                    raise ValueError(f"{name}/{code}: give at least one of {', '.join(CHECKS)}")
+                rule_mask = 0
+                for check, threshold in checks:
+                    _check_threshold(name, code, kind, check, threshold)
+                    key = (feature, check, threshold)
+                    bit = check_bits.get(key)
+                    if bit is None:
+                        if feature not in self._features:
+                            self._features.append(feature)
+                        bit = check_bits[key] = 1 << len(self._checks)
+                        self._checks.append((self._features.index(feature), CHECKS[check], threshold))
+                    rule_mask |= bit
+                codes.append((rule_mask, code))
+                mask |= rule_mask
+            self.names.append(name)
+            self._policies.append((mask, tuple(codes)))
+
+        self._extractors = [FEATURES[feature][1] if feature in FEATURES else None for feature in self._features]
+        self._needs_password = any(feature in PASSWORD_FEATURES for feature in self._features)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PolicyEngine':
+        return cls(load_policies(path))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def rule_count(self) -> int:
+        return sum(len(codes) for _, codes in self._policies)
+
+    @property
+    def check_count(self) -> int:
+        """Distinct checks in the compiled plan, after sharing across policies"""
+        return len(self._checks)
+
+    def describe_plan(self) -> List[str]:
+        lines = [f"features: {', '.join(self._features)}"]
+        for index, (slot, compare, threshold) in enumerate(self._checks):
+            lines.append(f"check {index}: {self._features[slot]} {compare.__name__} {threshold!r}")
+        for name, (mask, _) in zip(self.names, self._policies):
+            lines.append(f"policy {name}: checks {[index for index in range(mask.bit_length()) if mask >> index & 1]}")
+        return lines
+
+    def thresholds(self, feature: str) -> List[Tuple[str, object]]:
+        """(check, threshold) pairs the plan applies to one feature, across every policy"""
+        names = {compare: check for check, compare in CHECKS.items()}
+        return [(names[compare], threshold) for slot, compare, threshold in self._checks
+                if self._features[slot] == feature]
+
+    def _feature_values(self, result: AnalysisResult, password: Optional[str]) -> List:
+        values = []
+        for feature, extract in zip(self._features, self._extractors):
+            if extract is not None:
+                values.append(extract(result))
+            elif password is None:
+                raise ValueError(f"Feature {feature} needs the password")
+            else:
+                # guesses_log10 is the only password feature
+                from guess_estimator import guess_estimator
+                values.append(guess_estimator().estimate(password).guesses_log10)
+        return values
+
+    def failed_checks(self, result: AnalysisResult, password: Optional[str] = None) -> int:
+        """Bitmask of the plan's checks that this result fails"""
+        values = self._feature_values(result, password)
+        failed = 0
+        bit = 1
+        for slot, compare, threshold in self._checks:
+            if not compare(values[slot], threshold):
+                failed |= bit
+            bit <<= 1
+        return failed
+
+    def evaluate(self, result: AnalysisResult, password: Optional[str] = None) -> List[PolicyOutcome]:
+        """Every policy's verdict on one analysis; password is needed only for password features"""
+        failed = self.failed_checks(result, password)
+        outcomes = []
+        for name, (mask, codes) in zip(self.names, self._policies):
+            if failed & mask:
+                outcomes.append(PolicyOutcome(name, False, tuple(code for checks, code in codes if failed & checks)))
+            else:
+                outcomes.append(PolicyOutcome(name, True, ()))
+        return outcomes
+
+    def evaluate_batch(self, results: Iterable[AnalysisResult],
+                       passwords: Optional[Iterable[str]] = None) -> Iterator[List[PolicyOutcome]]:
+        """Lazily evaluate analyses already computed, e.g. by analyze_batch(compact=True)"""
+        if passwords is None:
+            if self._needs_password:
+                raise ValueError("These policies use password features; pass the passwords too")
+            for result in results:
+                yield self.evaluate(result)
+        else:
+            for result, password in zip(results, passwords):
+                yield self.evaluate(result, password)
+
+    def tally(self) -> 'PolicyTally':
+        return PolicyTally(self.names)
+
+    def row_columns(self) -> List[str]:
+        """Batch output columns: pass/fail and violated codes per policy"""
+        columns = []
+        for name in self.names:
+            columns += [f"policy.{name}", f"policy.{name}.violations"]
+        return columns
+
+    @staticmethod
+    def row_values(outcomes: List[PolicyOutcome]) -> Dict:
+        row = {}
+        for outcome in outcomes:
+            row[f"policy.{outcome.policy}"] = outcome.passed
+            row[f"policy.{outcome.policy}.violations"] = ';'.join(outcome.violations)
+        return row
+
+
+class PolicyTally:
+    """Streaming per-policy pass totals and violation counts by rule code"""
+
+    def __init__(self, names: Iterable[str]):
+        self._totals = {name: {'passed': 0, 'failed': 0, 'violations': {}} for name in names}
+
+    def update(self, outcomes: Iterable[PolicyOutcome]):
+        for outcome in outcomes:
+            entry = self._totals[outcome.policy]
+            if outcome.passed:
+                entry['passed'] += 1
+                continue
+            entry['failed'] += 1
+            violations = entry['violations']
+            for code in outcome.violations:
+                violations[code] = violations.get(code, 0) + 1
+
+    def summary(self) -> Dict[str, Dict]:
+        summary = {}
+        for name, entry in self._totals.items():
+            checked = entry['passed'] + entry['failed']
+            summary[name] = dict(entry, pass_rate=entry['passed'] / checked if checked else 0.0,
+                                 violations=dict(sorted(entry['violations'].items(), key=lambda item: -item[1])))
+        return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate a password policy file and show its compiled plan")
+    parser.add_argument('policies', help="policy file (.json or .toml)")
+    parser.add_argument('--show-plan', action='store_true', help="print every compiled check")
+    args = parser.parse_args(argv)
+    try:
+        engine = PolicyEngine.from_file(args.policies)
+    except (OSError, ValueError) as error:
+        print(f"Invalid policy file: {error}", file=sys.stderr)
+        return 1
+    print(f"{len(engine)} policies, {engine.rule_count} rules compiled to {engine.check_count} distinct checks")
+    if args.show_plan:
+        print('\n'.join(engine.describe_plan()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
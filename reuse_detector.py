@@ -0,0 +1,228 @@
+"""
+Password reuse detection for batch audits
+Exact duplicates are grouped by a keyed hash; near-duplicates ("Summer2023!" / "Summer2024!") are found with
+MinHash signatures over character n-grams and LSH banding, so cost grows with the number of rows, not pairs;
+bucket collisions are confirmed against the exact n-gram sets before clusters are merged
+"""
+
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from analysis_cache import PROCESS_KEY, keyed_digest
+from password_analyzer import AnalysisResult, PasswordAnalyzer
+
+NGRAM_SIZE = 3
+# Signature length is BANDS * ROWS_PER_BAND; two-row bands catch pairs down to roughly 0.4 similarity
+BANDS = 8
+ROWS_PER_BAND = 2
+# Minimum Jaccard similarity of n-gram sets for two passwords to share a cluster
+SIMILARITY_THRESHOLD = 0.5
+# A near-duplicate counts this much toward a row's reuse score relative to an exact duplicate
+NEAR_DUPLICATE_WEIGHT = 0.5
+# Per-n-gram hash values kept between rows
+NGRAM_CACHE_SIZE = 1 << 16
+
+# One 64-byte keyed BLAKE2b digest yields sixteen independent 32-bit hash values
+HASHES_PER_DIGEST = 16
+
+
+class ReuseDetector:
+    """Streaming grouper: add() each row, then read per-row cluster sizes and reuse scores"""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, ngram_size: int = NGRAM_SIZE,
+                 bands: int = BANDS, rows_per_band: int = ROWS_PER_BAND, key: bytes = PROCESS_KEY):
+        self.threshold = threshold
+        self.ngram_size = ngram_size
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+        self._key = key
+        self._signature_size = bands * rows_per_band
+        # Keyed hashers are set up once and copied per n-gram; each supplies sixteen signature positions
+        ngram_key = hmac.digest(key, b'ngram', hashlib.sha256)
+        self._ngram_hashers = [hashlib.blake2b(key=ngram_key, person=index.to_bytes(16, 'little'))
+                               for index in range(-(-self._signature_size // HASHES_PER_DIGEST))]
+        self._ngram_values = lru_cache(maxsize=NGRAM_CACHE_SIZE)(self._hash_ngram)
+
+        # Exact groups: one per distinct password, in first-seen order
+        self._group_by_digest: Dict[bytes, int] = {}
+        self._group_sizes: List[int] = []
+        # Union-find parent of each exact group; near-duplicate groups share a root
+        self._parents: List[int] = []
+        # LSH bucket -> (representative group, its n-gram set)
+        self._buckets: Dict[tuple, tuple] = {}
+        # Exact group of every row
+        self.row_groups: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.row_groups)
+
+    @property
+    def unique_count(self) -> int:
+        return len(self._group_sizes)
+
+    def add(self, password: str) -> int:
+        """Record one row; returns its exact group, which is new only for a first occurrence"""
+        digest = keyed_digest(password, self._key)
+        group = self._group_by_digest.get(digest)
+        if group is None:
+            group = len(self._group_sizes)
+            self._group_by_digest[digest] = group
+            self._group_sizes.append(0)
+            self._parents.append(group)
+            self._link_similar(group, self._ngrams(password))
+        self._group_sizes[group] += 1
+        self.row_groups.append(group)
+        return group
+
+    def add_all(self, passwords: Iterable[str]) -> 'ReuseDetector':
+        for password in passwords:
+            self.add(password)
+        return self
+
+    def _ngrams(self, password: str) -> frozenset:
+        text = password.lower()
+        size = self.ngram_size
+        return frozenset(text[index:index + size] for index in range(max(1, len(text) - size + 1)))
+
+    def _hash_ngram(self, gram: str) -> bytes:
+        """Packed 32-bit hash values, one per signature position; cached, since common n-grams recur across rows"""
+        encoded = gram.encode('utf-8', 'surrogatepass')
+        digests = []
+        for hasher in self._ngram_hashers:
+            hasher = hasher.copy()
+            hasher.update(encoded)
+            digests.append(hasher.digest())
+        return b''.join(digests)[:self._signature_size * 4]
+
+    def signature(self, password: str) -> List[int]:
+        """MinHash of the password's lowercased character n-grams"""
+        return np.frombuffer(self._signature(self._ngrams(password)), dtype='<u4').tolist()
+
+    def _signature(self, grams: frozenset) -> bytes:
+        hash_ngram = self._ngram_values
+        values = np.frombuffer(b''.join([hash_ngram(gram) for gram in grams]), dtype='<u4')
+        return values.reshape(-1, self._signature_size).min(axis=0).tobytes()
+
+    def _link_similar(self, group: int, grams: frozenset):
+        """Union the group with the representative of each LSH bucket it lands in, if similar enough"""
+        signature = self._signature(grams)
+        band_size = self.rows_per_band * 4
+        for band in range(self.bands):
+            bucket = (band, signature[band * band_size:(band + 1) * band_size])
+            entry = self._buckets.get(bucket)
+            if entry is None:
+                self._buckets[bucket] = (group, grams)
+                continue
+            # Candidates are confirmed on exact n-gram overlap, so signature noise cannot chain clusters
+            other, other_grams = entry
+            if self._find(other) != self._find(group) and \
+                    self.similarity(grams, other_grams) >= self.threshold:
+                self._union(other, group)
+
+    @staticmethod
+    def similarity(grams: frozenset, other: frozenset) -> float:
+        """Jaccard similarity of two n-gram sets"""
+        return len(grams & other) / len(grams | other)
+
+    def _find(self, group: int) -> int:
+        parents = self._parents
+        while parents[group] != group:
+            parents[group] = parents[parents[group]]
+            group = parents[group]
+        return group
+
+    def _union(self, left: int, right: int):
+        left, right = self._find(left), self._find(right)
+        if left != right:
+            # Keep the earliest group as the root so cluster ids follow input order
+            if right < left:
+                left, right = right, left
+            self._parents[right] = left
+
+    def report(self) -> 'ReuseReport':
+        roots = [self._find(group) for group in range(len(self._group_sizes))]
+        cluster_sizes: Dict[int, int] = {}
+        for group, size in enumerate(self._group_sizes):
+            cluster_sizes[roots[group]] = cluster_sizes.get(roots[group], 0) + size
+        return ReuseReport(self.row_groups, list(self._group_sizes), roots, cluster_sizes)
+
+
+class ReuseReport:
+    """Per-row and per-cluster reuse figures from a ReuseDetector"""
+
+    def __init__(self, row_groups: List[int], group_sizes: List[int], roots: List[int],
+                 cluster_sizes: Dict[int, int]):
+        self._row_groups = row_groups
+        self._group_sizes = group_sizes
+        self._roots = roots
+        self._cluster_sizes = cluster_sizes
+
+    def __len__(self) -> int:
+        return len(self._row_groups)
+
+    def duplicate_count(self, row: int) -> int:
+        """Rows with exactly this row's password, including itself"""
+        return self._group_sizes[self._row_groups[row]]
+
+    def cluster_id(self, row: int) -> int:
+        return self._roots[self._row_groups[row]]
+
+    def cluster_size(self, row: int) -> int:
+        """Rows with the same or a near-duplicate password, including itself"""
+        return self._cluster_sizes[self.cluster_id(row)]
+
+    def reuse_score(self, row: int) -> float:
+        """0 for a unique password, approaching 1 as exact and near copies accumulate"""
+        exact = self.duplicate_count(row)
+        near = self.cluster_size(row) - exact
+        return 1 - 1 / (exact + NEAR_DUPLICATE_WEIGHT * near)
+
+    def cluster_size_counts(self) -> Dict[int, int]:
+        """Number of clusters of each size, smallest first"""
+        counts: Dict[int, int] = {}
+        for size in self._cluster_sizes.values():
+            counts[size] = counts.get(size, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def summary(self, largest: int = 10) -> Dict:
+        rows = len(self._row_groups)
+        duplicated_rows = sum(size for size in self._group_sizes if size > 1)
+        clustered_rows = sum(size for size in self._cluster_sizes.values() if size > 1)
+        return {
+            'rows': rows,
+            'unique_passwords': len(self._group_sizes),
+            'duplicated_rows': duplicated_rows,
+            'near_duplicate_rows': clustered_rows - duplicated_rows,
+            'clusters': len(self._cluster_sizes),
+            'largest_clusters': sorted(self._cluster_sizes.values(), reverse=True)[:largest],
+            'cluster_size_counts': self.cluster_size_counts()
+        }
+
+
+def analyze_deduplicated(analyzer: PasswordAnalyzer, passwords: Iterable[str],
+                         detector: Optional[ReuseDetector] = None, workers: Optional[int] = 1,
+                         chunksize: int = 1000) -> List[AnalysisResult]:
+    """Analyze each distinct password once and fan the result out to every row that repeats it
+
+    Pass an empty detector to keep the reuse figures for the same rows.
+    """
+    if detector is None:
+        detector = ReuseDetector()
+    elif len(detector):
+        raise ValueError("detector must be empty")
+    unique = []
+    for password in passwords:
+        if detector.add(password) == len(unique):
+            unique.append(password)
+    results = list(analyzer.analyze_batch(unique, workers=workers, chunksize=chunksize, compact=True))
+    # The first row of a group takes the analysis itself, later rows a copy, so no two rows share a result
+    seen = [False] * len(results)
+    rows = []
+    for group in detector.row_groups:
+        rows.append(results[group].copy() if seen[group] else results[group])
+        seen[group] = True
+    return rows
@@ -0,0 +1,442 @@
+"""
+Asyncio JSON HTTP service around PasswordAnalyzer
+Requests arriving within a short window are coalesced into micro-batches and analyzed in a worker pool;
+the request queue is bounded and a full queue answers 503 instead of growing latency without limit
+Usage: python service.py [--host HOST] [--port PORT] [--workers N] [--max-batch N] [--max-delay-ms MS]
+
+Endpoints:
+    POST /analyze   {"password": "..."} or {"passwords": ["...", ...]}
+    GET  /health    queue depth and pool status; 503 once the batch loop or worker pool has failed
+    GET  /metrics   Prometheus text exposition of service and analyzer counters
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import Instrumentation
+from password_analyzer import (DEFAULT_ANALYSIS_LENGTH, AnalysisResult, PasswordAnalyzer, _analyze_chunk,
+                               _init_worker, _run_chunk)
+
+Batch = List[Tuple[str, asyncio.Future]]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+# Largest batch handed to one worker call, and the longest a request waits for others to join it
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.002
+# Passwords waiting for a batch; beyond this new requests get 503
+DEFAULT_QUEUE_SIZE = 1024
+MAX_BODY_BYTES = 64 * 1024
+MAX_PASSWORDS_PER_REQUEST = 256
+RETRY_AFTER_SECONDS = 1
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    503: 'Service Unavailable'
+}
+
+
+class Overloaded(Exception):
+    """The request queue has no room for this request"""
+
+
+class ServiceStopped(Exception):
+    """The batcher shut down before this request was analyzed"""
+
+
+def service_payload(result: AnalysisResult) -> Dict:
+    """Trimmed response schema: numbers, flags and bit codes, no message text"""
+    return {
+        'score': result.score,
+        'length': result.length,
+        'entropy': round(result.entropy, 2),
+        'common': result.is_common,
+        'character_flags': result.character_flags,
+        'issue_codes': result.issue_codes,
+        'recommendation_codes': result.recommendation_codes,
+        'pattern_codes': result.pattern_codes
+    }
+
+
+class MicroBatcher:
+    """Coalesce single analyses into batches and run them on an executor"""
+
+    def __init__(self, analyzer: PasswordAnalyzer, workers: int = 1, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_delay: float = DEFAULT_MAX_DELAY, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.analyzer = analyzer
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue: Optional[asyncio.Queue] = None
+        self.queue_size = queue_size
+        self._executor: Optional[Executor] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+        # Strong references: the loop only keeps weak ones, so an unreferenced dispatch can vanish mid-batch
+        self._dispatches: Dict[asyncio.Task, Batch] = {}
+        # The batch _collect is filling or waiting to dispatch, failed by stop() if it never gets a task
+        self._forming: Batch = []
+        self.batches = 0
+        self.batched_passwords = 0
+        self.rejected = 0
+
+    async def start(self):
+        self.queue = asyncio.Queue(self.queue_size)
+        if self.workers > 1:
+            # Workers rebuild the analyzer from its constructor arguments, as in analyze_batch
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.analyzer._init_kwargs,))
+        else:
+            # One thread keeps analysis off the event loop
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        # Two batches per worker keeps every worker busy while the next batch forms
+        self._in_flight = asyncio.Semaphore(max(1, self.workers) * 2)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel collection and in-flight batches; every request still waiting fails with ServiceStopped"""
+        dispatches = dict(self._dispatches)
+        tasks = list(dispatches) + ([self._task] if self._task is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # A dispatch cancelled before its first step never reaches its own error handling
+        pending = [item for batch in dispatches.values() for item in batch] + self._forming
+        self._forming = []
+        while self.queue is not None and not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        self._fail(pending, ServiceStopped())
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def healthy(self) -> bool:
+        """False once the batch loop has died or the worker pool is broken"""
+        if self._task is None or self._task.done():
+            return False
+        return not getattr(self._executor, '_broken', False)
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.qsize() if self.queue is not None else 0
+
+    def submit(self, passwords: List[str]) -> List[asyncio.Future]:
+        """Queue passwords for analysis, all or none; raises Overloaded when the queue cannot take them"""
+        if self.queue.maxsize - self.queue.qsize() < len(passwords):
+            self.rejected += 1
+            raise Overloaded()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for password in passwords:
+            future = loop.create_future()
+            self.queue.put_nowait((password, future))
+            futures.append(future)
+        return futures
+
+    async def _collect(self) -> Batch:
+        """Wait for one item, then take whatever else arrives within max_delay, up to max_batch"""
+        batch = self._forming = []
+        batch.append(await self.queue.get())
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self.queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Not wait_for: on 3.11 it can take an item off the queue as the timeout fires and drop it.
+            # A timeout that cancels get() itself leaves the item queued.
+            try:
+                async with asyncio.timeout(remaining):
+                    item = await self.queue.get()
+            except TimeoutError:
+                break
+            batch.append(item)
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches[task] = batch
+            task.add_done_callback(self._forget_dispatch)
+            self._forming = []
+
+    def _forget_dispatch(self, task: asyncio.Task):
+        self._dispatches.pop(task, None)
+
+    @staticmethod
+    def _fail(batch: Batch, error: BaseException):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _dispatch(self, batch: Batch):
+        loop = asyncio.get_running_loop()
+        passwords = [password for password, _ in batch]
+        try:
+            if self.workers > 1:
+                results = await loop.run_in_executor(self._executor, _run_chunk, _analyze_chunk, passwords)
+            else:
+                results = await loop.run_in_executor(self._executor, _analyze_chunk, self.analyzer, passwords)
+        except Exception as error:
+            logger.exception("Batch analysis failed")
+            self._fail(batch, error)
+            return
+        finally:
+            self._in_flight.release()
+        self.batches += 1
+        self.batched_passwords += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class AnalysisService:
+    """Minimal HTTP/1.1 server (keep-alive, Content-Length bodies) over a MicroBatcher"""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+        self.started = time.monotonic()
+        self.requests = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as error:
+                    await self._respond(writer, 400, {'error': str(error)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if body is None:
+                    await self._respond(writer, 413, {'error': 'request body too large'}, keep_alive=False)
+                    break
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        """Parse one request; None at end of stream, body None when it exceeds MAX_BODY_BYTES"""
+        try:
+            request_line = await reader.readline()
+        except (asyncio.LimitOverrunError, ValueError):
+            raise ValueError('request line too long')
+        if not request_line:
+            return None
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise ValueError('malformed request line')
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except (asyncio.LimitOverrunError, ValueError):
+                raise ValueError('header line too long')
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ValueError('invalid Content-Length')
+        if length > MAX_BODY_BYTES:
+            return method, target, headers, None
+        body = await reader.readexactly(length) if length > 0 else b''
+        return method, target.split('?', 1)[0], headers, body
+
+    async def _route(self, method: str, path: str, body: bytes):
+        self.requests += 1
+        if path == '/analyze':
+            if method != 'POST':
+                return 405, {'error': 'use POST'}
+            return await self._analyze(body)
+        if path == '/health':
+            health = self.health()
+            return 200 if health['status'] == 'ok' else 503, health
+        if path == '/metrics':
+            return 200, self.metrics_text()
+        return 404, {'error': 'not found'}
+
+    async def _analyze(self, body: bytes):
+        try:
+            request = json.loads(body or b'null')
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return 400, {'error': 'body must be JSON'}
+        single = isinstance(request, dict) and isinstance(request.get('password'), str)
+        if single:
+            passwords = [request['password']]
+        elif isinstance(request, dict) and isinstance(request.get('passwords'), list) and \
+                all(isinstance(password, str) for password in request['passwords']):
+            passwords = request['passwords']
+        else:
+            return 400, {'error': 'expected {"password": str} or {"passwords": [str, ...]}'}
+        if len(passwords) > MAX_PASSWORDS_PER_REQUEST:
+            return 413, {'error': f'at most {MAX_PASSWORDS_PER_REQUEST} passwords per request'}
+        # Rejected here rather than in a worker, where the error would fail the whole batch
+        max_length = self.batcher.analyzer.max_input_length
+        if max_length is not None and any(len(password) > max_length for password in passwords):
+            return 413, {'error': f'passwords are limited to {max_length} characters'}
+
+        try:
+            futures = self.batcher.submit(passwords)
+        except Overloaded:
+            return 503, {'error': 'overloaded, retry later'}
+        try:
+            results = await asyncio.gather(*futures)
+        except ServiceStopped:
+            return 503, {'error': 'service is shutting down'}
+        if single:
+            return 200, service_payload(results[0])
+        return 200, {'results': [service_payload(result) for result in results]}
+
+    def health(self) -> Dict:
+        batcher = self.batcher
+        return {
+            'status': 'ok' if batcher.healthy else 'degraded',
+            'uptime_seconds': round(time.monotonic() - self.started, 3),
+            'workers': batcher.workers,
+            'queue_depth': batcher.queue_depth,
+            'queue_size': batcher.queue_size,
+            'batches': batcher.batches,
+            'mean_batch_size': round(batcher.batched_passwords / batcher.batches, 2) if batcher.batches else 0.0,
+            'rejected_requests': batcher.rejected
+        }
+
+    def metrics_text(self) -> str:
+        batcher = self.batcher
+        lines = [
+            "# TYPE password_service_requests_total counter",
+            f"password_service_requests_total {self.requests}",
+            "# TYPE password_service_rejected_total counter",
+            f"password_service_rejected_total {batcher.rejected}",
+            "# TYPE password_service_batches_total counter",
+            f"password_service_batches_total {batcher.batches}",
+            "# TYPE password_service_batched_passwords_total counter",
+            f"password_service_batched_passwords_total {batcher.batched_passwords}",
+            "# TYPE password_service_queue_depth gauge",
+            f"password_service_queue_depth {batcher.queue_depth}"
+        ]
+        text = '\n'.join(lines) + '\n'
+        # Stage timings are only available when batches run in this process
+        if batcher.analyzer.instrumentation is not None:
+            text += batcher.analyzer.instrumentation.prometheus_text()
+        return text
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool = True):
+        if isinstance(payload, str):
+            body = payload.encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            content_type = 'application/json'
+        headers = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        if status == 503:
+            headers.append(f"Retry-After: {RETRY_AFTER_SECONDS}")
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(args, analyzer: PasswordAnalyzer):
+    batcher = MicroBatcher(analyzer, args.workers, args.max_batch, args.max_delay_ms / 1000, args.queue_size)
+    service = AnalysisService(batcher)
+    await service.start(args.host, args.port)
+    logger.info("Serving on http://%s:%d with %d worker(s)", args.host, service.port, args.workers)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="JSON HTTP password scoring service")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="bind address (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="analysis processes; 1 analyzes on a background thread (default: %(default)s)")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help="largest micro-batch (default: %(default)s)")
+    parser.add_argument('--max-delay-ms', type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="longest wait for a batch to fill (default: %(default)s)")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="queued passwords before answering 503 (default: %(default)s)")
+    parser.add_argument('--analysis-length', type=int, default=DEFAULT_ANALYSIS_LENGTH,
+                        help="score longer passwords on their prefix and flag them; 0 disables (default: %(default)s)")
+    parser.add_argument('--max-length', type=int, help="reject longer passwords with 413")
+    parser.add_argument('--breach-index', help="breach corpus index built with breach_index.py")
+    parser.add_argument('--prefilter', help="Bloom filter built with bloom_filter.py")
+    parser.add_argument('--wordlist', help="common-password artifact built with wordlist_artifact.py")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        analyzer = PasswordAnalyzer(breach_index_path=args.breach_index, prefilter_path=args.prefilter,
+                                    wordlist_path=args.wordlist,
+                                    instrumentation=Instrumentation() if args.workers <= 1 else None,
+                                    analysis_length=args.analysis_length or None, max_input_length=args.max_length)
+    except ValueError as error:
+        parser.error(str(error))
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        asyncio.run(serve(args, analyzer))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
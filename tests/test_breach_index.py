@@ -0,0 +1,32 @@
+import pytest
+
+from breach_index import BreachIndex, build_index
+
+
+@pytest.mark.parametrize('digest_size', [4, 8, 20])
+def test_lookup_finds_every_indexed_password(tmp_path, digest_size):
+    words = [f'breached{number}' for number in range(5000)] + ['password', 'password']
+    path = str(tmp_path / 'breach.idx')
+    # A small chunk size forces the external merge over several runs
+    count = build_index(words, path, digest_size=digest_size, chunk_size=700)
+    assert count == 5001
+    with BreachIndex(path) as index:
+        assert len(index) == count
+        assert all(word in index for word in words)
+        absent = [f'missing{number}' for number in range(2000)]
+        false_positives = sum(word in index for word in absent)
+        assert false_positives <= (len(absent) if digest_size == 4 else 0) * count / 2 ** 32 + 1
+
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / 'empty.idx')
+    assert build_index([], path) == 0
+    with BreachIndex(path) as index:
+        assert 'password' not in index
+
+
+def test_rejects_files_that_are_not_indexes(tmp_path):
+    path = tmp_path / 'junk.idx'
+    path.write_bytes(b'not an index at all, just text')
+    with pytest.raises(ValueError):
+        BreachIndex(str(path))
@@ -0,0 +1,21 @@
+from benchmarks import synthetic_corpus
+from password_analyzer import Issue, PasswordAnalyzer
+from policy_engine import BUILTIN_POLICY, PolicyEngine
+
+PASSWORDS = ['a', 'password', 'Password2024!', 'qwerty12345', 'Tr0ub4dor&3', 'correct horse battery staple',
+             'Xk#9mPq$2vLw!7nR', 'İstanbul1!'] + synthetic_corpus(2000)
+
+
+def test_builtin_policy_reports_the_analyzer_issues():
+    analyzer = PasswordAnalyzer()
+    engine = PolicyEngine([BUILTIN_POLICY])
+    codes = {rule['code']: getattr(Issue, rule['code']) for rule in BUILTIN_POLICY['rules']}
+    checked = 0
+    for code in codes.values():
+        checked |= code
+    for password in PASSWORDS:
+        result = analyzer.analyze(password)
+        [outcome] = engine.evaluate(result, password)
+        issues = result.issue_codes & checked
+        assert outcome.passed == (issues == 0), password
+        assert sorted(outcome.violations) == sorted(name for name, code in codes.items() if issues & code), password
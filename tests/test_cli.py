@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+import cli
+from password_analyzer import DEFAULT_ANALYSIS_LENGTH, Issue
+
+
+def run_cli(tmp_path, passwords, *options):
+    source = tmp_path / 'passwords.txt'
+    source.write_text('\n'.join(passwords) + '\n', encoding='utf-8')
+    output = tmp_path / 'results.jsonl'
+    assert cli.main([str(source), '-o', str(output), '--fields', 'length,issue_codes', *options]) == 0
+    return [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+
+
+def test_long_passwords_are_bounded_by_default(tmp_path):
+    long_password = 'aB3$' * DEFAULT_ANALYSIS_LENGTH
+    short, long = run_cli(tmp_path, ['Summer2024!', long_password])
+    assert not short['issue_codes'] & Issue.TRUNCATED
+    assert long['issue_codes'] & Issue.TRUNCATED
+    assert long['length'] == len(long_password)
+
+
+def test_zero_analysis_length_analyzes_every_character(tmp_path):
+    [row] = run_cli(tmp_path, ['aB3$' * DEFAULT_ANALYSIS_LENGTH], '--analysis-length', '0')
+    assert not row['issue_codes'] & Issue.TRUNCATED
+
+
+def test_closed_stdout_exits_quietly(tmp_path):
+    source = tmp_path / 'passwords.txt'
+    source.write_text('\n'.join(f'Pass{number}word!' for number in range(100000)) + '\n', encoding='utf-8')
+    process = subprocess.Popen([sys.executable, cli.__file__, str(source)], stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    process.stdout.readline()
+    process.stdout.close()
+    stderr = process.stderr.read()
+    assert process.wait() == 1
+    assert stderr == b''
@@ -0,0 +1,15 @@
+import pytest
+
+from guess_estimator import GuessEstimator
+
+
+@pytest.mark.parametrize('prefix', ['İ', 'İİ', 'aİ'])
+def test_spans_index_the_password_when_lowering_changes_length(prefix):
+    estimator = GuessEstimator()
+    plain = estimator.estimate('x' * len(prefix) + 'Password2024qwerty')
+    estimate = estimator.estimate(prefix + 'Password2024qwerty')
+    password = prefix + 'Password2024qwerty'
+    assert [(step.pattern, step.token) for step in estimate.sequence][1:] == \
+        [(step.pattern, step.token) for step in plain.sequence][1:]
+    assert ''.join(password[step.start:step.end] for step in estimate.sequence) == password
+    assert estimate.guesses_log10 == pytest.approx(plain.guesses_log10)
@@ -0,0 +1,31 @@
+import pytest
+
+from hash_audit import _md4_fallback, md4_digest, ntlm_hash
+
+# RFC 1320 appendix A.5
+MD4_VECTORS = [
+    (b'', '31d6cfe0d16ae931b73c59d7e0c089c0'),
+    (b'a', 'bde52cb31de33e46245e05fbdbd6fb24'),
+    (b'abc', 'a448017aaf21d8525fc10ae87aa6729d'),
+    (b'message digest', 'd9130a8164549fe818874806e1c7014b'),
+    (b'abcdefghijklmnopqrstuvwxyz', 'd79e1c308aa5bbcdeea8ed63df412da9'),
+    (b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789', '043f8582f241db351ce627e153e7f0e4'),
+    (b'1234567890' * 8, 'e33b4ddc9c38f2199c3e7b164fcc0536')
+]
+
+NTLM_VECTORS = [
+    ('', '31d6cfe0d16ae931b73c59d7e0c089c0'),
+    ('password', '8846f7eaee8fb117ad06bdd830b7586c'),
+    ('Password', 'a4f49c406510bdcab6824ee7c30fd852')
+]
+
+
+@pytest.mark.parametrize('function', [_md4_fallback, md4_digest])
+@pytest.mark.parametrize('data, expected', MD4_VECTORS)
+def test_md4_vectors(function, data, expected):
+    assert function(data).hex() == expected
+
+
+@pytest.mark.parametrize('password, expected', NTLM_VECTORS)
+def test_ntlm_vectors(password, expected):
+    assert ntlm_hash(password).hex() == expected
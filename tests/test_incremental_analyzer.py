@@ -0,0 +1,60 @@
+import random
+import string
+import time
+
+import pytest
+
+from benchmarks import synthetic_corpus
+from incremental_analyzer import IncrementalAnalyzer
+from password_analyzer import DEFAULT_ANALYSIS_LENGTH, Issue, PasswordAnalyzer
+
+# A 1 MB paste must cost about as much as typing DEFAULT_ANALYSIS_LENGTH characters
+LONG_PASTE_BUDGET_SECONDS = 0.25
+# Keystrokes plus characters that defeat the incremental shortcuts: lowering that changes length, non-ASCII digits
+EDIT_ALPHABET = string.ascii_letters + string.digits + string.punctuation + ' \n' + 'İßé٣١' + 'aaa111' + '19202'
+
+
+def test_long_paste_stays_under_budget():
+    analyzer = PasswordAnalyzer(analysis_length=DEFAULT_ANALYSIS_LENGTH)
+    text = 'aB3$' * (1 << 18)
+    started = time.perf_counter()
+    incremental = IncrementalAnalyzer(analyzer)
+    incremental.set(text)
+    result = incremental.result()
+    assert time.perf_counter() - started < LONG_PASTE_BUDGET_SECONDS
+    assert len(incremental._frames) == DEFAULT_ANALYSIS_LENGTH + 1
+    assert result == analyzer.analyze(text)
+    assert result.length == len(text)
+    assert result.issue_codes & Issue.TRUNCATED
+
+
+def test_edits_across_the_length_limit():
+    analyzer = PasswordAnalyzer(analysis_length=32)
+    incremental = IncrementalAnalyzer(analyzer, 'Summer2024!' * 5)
+    incremental.append('x')
+    assert incremental.result() == analyzer.analyze('Summer2024!' * 5 + 'x')
+    for _ in range(30):
+        incremental.delete()
+    assert incremental.text == ('Summer2024!' * 5)[:26]
+    assert incremental.result() == analyzer.analyze(incremental.text)
+    assert len(incremental._frames) == 27
+
+
+@pytest.mark.parametrize('analysis_length', [None, 24])
+def test_random_edits_match_full_analysis(analysis_length):
+    analyzer = PasswordAnalyzer(analysis_length=analysis_length)
+    incremental = IncrementalAnalyzer(analyzer)
+    rng = random.Random(5)
+    for trial in range(3000):
+        roll = rng.random()
+        if roll < 0.6:
+            incremental.append(rng.choice(EDIT_ALPHABET))
+        elif roll < 0.85:
+            incremental.delete()
+        elif roll < 0.95:
+            incremental.set(rng.choice(synthetic_corpus(20, trial)))
+        else:
+            text = incremental.text
+            keep = rng.randrange(len(text) + 1)
+            incremental.set(text[:keep] + ''.join(rng.choice(EDIT_ALPHABET) for _ in range(rng.randrange(4))))
+        assert incremental.result() == analyzer.analyze(incremental.text), repr(incremental.text)
@@ -0,0 +1,27 @@
+from instrumentation import Instrumentation
+from password_analyzer import ANALYSIS_STAGES, PREFIX_SCORING_STAGES, SCAN_STAGES, PasswordAnalyzer
+
+PASSWORDS = ['Hello123!', 'correct horse battery staple', 'qwerty2024', 'Tr0ub4dor&3', 'İstanbul1999']
+
+
+def test_instrumented_results_match_plain_results():
+    plain = PasswordAnalyzer()
+    instrumented = PasswordAnalyzer(instrumentation=Instrumentation())
+    for password in PASSWORDS:
+        assert instrumented.analyze(password) == plain.analyze(password)
+
+
+def test_every_stage_is_timed():
+    instrumentation = Instrumentation()
+    PasswordAnalyzer(instrumentation=instrumentation).analyze('Hello123!')
+    stages = instrumentation.snapshot()['stages']
+    assert set(stages) == {name for name, _ in ANALYSIS_STAGES} | {'total'}
+
+
+def test_bounded_inputs_are_timed():
+    instrumentation = Instrumentation()
+    analyzer = PasswordAnalyzer(instrumentation=instrumentation, analysis_length=32)
+    long_password = 'Summer2024!' * 100
+    assert analyzer.analyze(long_password) == PasswordAnalyzer(analysis_length=32).analyze(long_password)
+    stages = instrumentation.snapshot()['stages']
+    assert set(stages) == {name for name, _ in SCAN_STAGES + PREFIX_SCORING_STAGES} | {'total'}
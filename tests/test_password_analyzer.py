@@ -0,0 +1,45 @@
+import pytest
+
+from instrumentation import Instrumentation
+from password_analyzer import EMPTY_RESULT, Issue, PasswordAnalyzer, PatternScan
+
+
+@pytest.mark.parametrize('instrumentation', [None, Instrumentation()])
+def test_cached_results_are_not_shared(instrumentation):
+    analyzer = PasswordAnalyzer(cache_size=16, instrumentation=instrumentation)
+    first = analyzer.analyze('Summer2024!')
+    expected = first.copy()
+    first.score = -1
+    first.issue_codes |= Issue.TRUNCATED
+    second = analyzer.analyze('Summer2024!')
+    assert second == expected
+    assert second is not analyzer.analyze('Summer2024!')
+
+
+def test_empty_result_is_not_shared():
+    analyzer = PasswordAnalyzer()
+    result = analyzer.analyze('')
+    result.issue_codes = 0
+    assert analyzer.analyze('') == EMPTY_RESULT
+    assert EMPTY_RESULT.issue_codes == Issue.EMPTY
+
+
+@pytest.mark.parametrize('password, plain', [('İİİİqwerty1111', 'IIIIqwerty1111'), ('aİbc2024qwerty', 'aIbc2024qwerty')])
+def test_spans_index_the_password_when_lowering_changes_length(password, plain):
+    scan = PatternScan(password)
+    assert len(scan.lowered) != len(password)
+    assert sorted((match.start, match.end, match.category) for match in scan.matches) == \
+        sorted((match.start, match.end, match.category) for match in PatternScan(plain).matches)
+    assert scan.covered_chars == PatternScan(plain).covered_chars
+
+
+@pytest.mark.parametrize('instrumentation', [None, Instrumentation()])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_use_cache_false_leaves_the_cache_untouched(instrumentation, workers):
+    analyzer = PasswordAnalyzer(cache_size=16, instrumentation=instrumentation)
+    passwords = ['Summer2024!', 'correct horse']
+    results = list(analyzer.analyze_batch(passwords, workers=workers, compact=True, use_cache=False))
+    assert results == [PasswordAnalyzer().analyze(password) for password in passwords]
+    assert len(analyzer.cache) == 0
+    analyzer.analyze('Summer2024!')
+    assert len(analyzer.cache) == 1
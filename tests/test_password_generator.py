@@ -0,0 +1,61 @@
+import pytest
+
+from password_analyzer import PasswordAnalyzer
+from password_generator import ALL_CLASSES, SPECIAL_CHARS, PasswordGenerator, analyze_fresh, generate, password_entropy
+
+
+def test_repeated_symbols_are_counted_once():
+    generator = PasswordGenerator(length=16, symbols='!!!!#')
+    assert generator.alphabet.count('!') == 1
+    assert generator.entropy == PasswordGenerator(length=16, symbols='!#').entropy
+
+
+@pytest.mark.parametrize('symbols', ['\x01', '\x7f', 'a!', ' ', '!§'])
+def test_symbols_must_be_ascii_punctuation(symbols):
+    with pytest.raises(ValueError, match="punctuation"):
+        PasswordGenerator(symbols=symbols)
+
+
+def test_entropy_counts_only_passwords_with_every_class():
+    # Classes of 2 and 1 characters, length 3: 3**3 - 2**3 - 1**3 + 0**3 = 18 valid passwords
+    assert 2 ** password_entropy([2, 1], 3) == pytest.approx(18)
+
+
+def test_every_class_is_present():
+    generator = PasswordGenerator(length=4, classes=ALL_CLASSES & ~SPECIAL_CHARS)
+    for password in generator.generate(2000):
+        assert any(ch.islower() for ch in password)
+        assert any(ch.isupper() for ch in password)
+        assert any(ch.isdigit() for ch in password)
+
+
+def _flag_policy(**flags):
+    from policy_engine import PolicyEngine
+    rules = [{'code': feature.upper(), 'feature': feature, 'equals': value} for feature, value in flags.items()]
+    return PolicyEngine([{'name': 'policy', 'rules': rules}])
+
+
+def test_passphrase_boundaries_survive_a_symbol_ban():
+    from password_generator import generator_for_policy
+    generator = generator_for_policy(_flag_policy(special_chars=False), passphrase=True)
+    for passphrase in generator.generate(200):
+        assert passphrase.isalpha()
+        assert sum(ch.isupper() for ch in passphrase) == generator.word_count
+    generator = generator_for_policy(_flag_policy(special_chars=False, uppercase=False), passphrase=True)
+    assert generator.separator.isdigit()
+    with pytest.raises(ValueError, match="separate"):
+        generator_for_policy(_flag_policy(special_chars=False, uppercase=False, numbers=False), passphrase=True)
+
+
+@pytest.mark.parametrize('separator', ['', 'x'])
+def test_ambiguous_passphrase_separators_are_rejected(separator):
+    from password_generator import PassphraseGenerator
+    with pytest.raises(ValueError, match="unambiguous"):
+        PassphraseGenerator(separator=separator)
+
+
+def test_fresh_analysis_stays_out_of_the_cache():
+    analyzer = PasswordAnalyzer(cache_size=16)
+    outputs = list(generate(PasswordGenerator(length=16), 5))
+    assert analyze_fresh(analyzer, outputs) == [PasswordAnalyzer().analyze(output) for output in outputs]
+    assert len(analyzer.cache) == 0
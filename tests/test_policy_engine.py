@@ -0,0 +1,20 @@
+import pytest
+
+from policy_engine import PolicyEngine
+
+
+def _policy(*rules):
+    return [{'name': 'finance', 'rules': list(rules)}]
+
+
+@pytest.mark.parametrize('policies, message', [
+    (_policy({'code': 'MIN_LENGTH', 'feature': 'length', 'mn': 12}), "unknown key"),
+    (_policy({'code': 'MIN_LENGTH', 'feature': 'length'}), "give at least one of"),
+    (_policy('length'), "rule 0 must be a table"),
+    (_policy({'code': 'MIN_LENGTH', 'feature': ['length'], 'min': 12}), "'feature' must name a feature"),
+    (['finance'], "Policy 0"),
+    ([{'name': 'finance', 'rules': []}], "non-empty list"),
+])
+def test_malformed_policies_raise_value_error(policies, message):
+    with pytest.raises(ValueError, match=message):
+        PolicyEngine(policies)
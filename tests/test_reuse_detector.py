@@ -0,0 +1,13 @@
+from password_analyzer import PasswordAnalyzer
+from reuse_detector import ReuseDetector, analyze_deduplicated
+
+
+def test_duplicate_rows_get_equal_but_separate_results():
+    analyzer = PasswordAnalyzer()
+    passwords = ['Summer2024!', 'hunter2', 'Summer2024!', 'Summer2024!', 'hunter2']
+    detector = ReuseDetector()
+    results = analyze_deduplicated(analyzer, passwords, detector)
+    assert results == [analyzer.analyze(password) for password in passwords]
+    assert len({id(result) for result in results}) == len(passwords)
+    results[0].score = -1
+    assert results[2].score == results[3].score == analyzer.analyze('Summer2024!').score
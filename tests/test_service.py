@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+import service
+from password_analyzer import PasswordAnalyzer
+from service import MicroBatcher, ServiceStopped
+
+
+class BlockingAnalyzer(PasswordAnalyzer):
+    """Holds every analysis until released, so batches stay in flight"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def analyze(self, password):
+        self.release.wait()
+        return super().analyze(password)
+
+
+def test_stop_fails_every_waiting_request():
+    async def scenario():
+        analyzer = BlockingAnalyzer()
+        batcher = MicroBatcher(analyzer, workers=1, max_batch=1, max_delay=0)
+        await batcher.start()
+        futures = batcher.submit([f'password{index}' for index in range(8)])
+        await asyncio.sleep(0.05)
+        assert batcher._dispatches
+        # The worker thread must finish its current password before the executor can shut down
+        threading.Timer(0.1, analyzer.release.set).start()
+        await batcher.stop()
+        return futures
+
+    futures = asyncio.run(scenario())
+    assert all(future.done() for future in futures)
+    assert all(isinstance(future.exception(), ServiceStopped) for future in futures)
+
+
+def test_batches_complete_and_release_their_tasks():
+    async def scenario():
+        batcher = MicroBatcher(PasswordAnalyzer(), workers=1)
+        await batcher.start()
+        results = await asyncio.gather(*batcher.submit(['Summer2024!', 'correct horse']))
+        await asyncio.sleep(0)
+        assert not batcher._dispatches
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert [result.length for result in results] == [11, 13]
+
+
+def test_short_analysis_length_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as error:
+        service.main(['--analysis-length', '8'])
+    assert error.value.code == 2
+    assert 'analysis_length' in capsys.readouterr().err
+
+
+def test_short_delays_never_drop_requests():
+    async def scenario():
+        batcher = MicroBatcher(PasswordAnalyzer(), workers=1, max_batch=8, max_delay=0.0001)
+        await batcher.start()
+        futures = []
+        for burst in range(300):
+            futures += batcher.submit([f'burst{burst}'])
+            # Arrivals spaced around max_delay race the batch deadline
+            await asyncio.sleep(0.0001 * (burst % 3))
+        results = await asyncio.wait_for(asyncio.gather(*futures), 10)
+        await batcher.stop()
+        return results
+
+    assert len(asyncio.run(scenario())) == 300
+
+
+def test_health_degrades_when_the_batch_loop_dies():
+    async def scenario():
+        batcher = MicroBatcher(PasswordAnalyzer(), workers=1)
+        analysis_service = service.AnalysisService(batcher)
+        await batcher.start()
+        healthy = await analysis_service._route('GET', '/health', b'')
+        batcher._task.cancel()
+        await asyncio.sleep(0)
+        degraded = await analysis_service._route('GET', '/health', b'')
+        await batcher.stop()
+        return healthy, degraded
+
+    (ok_status, ok_body), (bad_status, bad_body) = asyncio.run(scenario())
+    assert (ok_status, ok_body['status']) == (200, 'ok')
+    assert (bad_status, bad_body['status']) == (503, 'degraded')
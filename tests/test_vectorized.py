@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from benchmarks import synthetic_corpus
+from password_analyzer import PasswordAnalyzer, strength_label
+from vectorized import STRENGTH_LABELS, analyze_columnar
+
+EDGE_CASES = ['', 'a', 'password', 'Password2024!', 'qwerty12345', '19991231', 'aaaaaaa', 'Tr0ub4dor&3', ' \t ']
+
+
+@pytest.mark.parametrize('analysis_length', [None, 16])
+def test_columns_match_the_scalar_path(analysis_length):
+    analyzer = PasswordAnalyzer(analysis_length=analysis_length)
+    passwords = EDGE_CASES + synthetic_corpus(500) + ['Summer2024!' * 4]
+    columns = analyze_columnar(passwords, analyzer)
+    for index, password in enumerate(passwords):
+        result = analyzer.analyze(password)
+        assert columns['length'][index] == result.length
+        assert columns['score'][index] == result.score
+        assert STRENGTH_LABELS[columns['strength'][index]] == strength_label(result.score)
+        assert columns['entropy'][index] == pytest.approx(result.entropy)
+        assert columns['character_variety'][index] == result.character_variety
+        assert columns['is_common'][index] == result.is_common
+        assert columns['pattern_count'][index] == result.pattern_count
+        assert columns['issues_count'][index] == result.issues_count
+        for name, flag in result.character_types.items():
+            assert columns[name][index] == flag
+
+
+def test_empty_batch():
+    columns = analyze_columnar([])
+    assert all(len(column) == 0 for column in columns.values())
+    assert isinstance(columns['score'], np.ndarray)
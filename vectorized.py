@@ -0,0 +1,120 @@
+"""
+NumPy feature extraction for bulk password analysis
+Computes lengths, character classes, charset sizes, entropy and scores as array operations,
+using the scalar path only for per-password pattern detail
+
+The pattern scan and common-password lookup still run once per row in Python and account for nearly all
+of the time, so this path is only modestly faster than a serial analyze_batch and runs in one process;
+analyze_batch with workers is the faster choice for large inputs (see throughput.* in benchmarks.py)
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+from password_analyzer import MATCHED_CHAR_BITS, UNSPANNED_PATTERN_PENALTY, PasswordAnalyzer, PatternScan
+
+# Strength codes for the 'strength' column
+WEAK, MEDIUM, STRONG = 0, 1, 2
+STRENGTH_LABELS = ('Weak', 'Medium', 'Strong')
+
+
+def encode_passwords(passwords: Sequence[str]):
+    """Return a zero-padded (n, max_length) uint32 code point matrix and a lengths vector"""
+    lengths = np.fromiter((len(password) for password in passwords), dtype=np.int64, count=len(passwords))
+    max_length = int(lengths.max()) if len(passwords) else 0
+    flat = np.frombuffer(''.join(passwords).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+    codes = np.zeros((len(passwords), max_length), dtype=np.uint32)
+    valid = np.arange(max_length) < lengths[:, None]
+    codes[valid] = flat
+    return codes, lengths, valid
+
+
+def analyze_columnar(passwords: Sequence[str], analyzer: PasswordAnalyzer = None) -> Dict[str, np.ndarray]:
+    """Analyze a batch into one array per field, matching analyze_password numerically"""
+    if analyzer is None:
+        analyzer = PasswordAnalyzer()
+    count = len(passwords)
+    # Bounded-cost mode, as in PasswordAnalyzer.analyze: reject, or score the prefix and flag the row
+    truncated = np.zeros(count, dtype=bool)
+    input_lengths = None
+    if analyzer._length_limit is not None:
+        input_lengths = np.fromiter((len(password) for password in passwords), dtype=np.int64, count=count)
+        if analyzer.max_input_length is not None and (input_lengths > analyzer.max_input_length).any():
+            raise ValueError(f"Password is longer than {analyzer.max_input_length} characters")
+        if analyzer.analysis_length is not None:
+            truncated = input_lengths > analyzer.analysis_length
+            if truncated.any():
+                passwords = [password[:analyzer.analysis_length] for password in passwords]
+    codes, lengths, valid = encode_passwords(passwords)
+
+    # Character class presence
+    is_lower = (codes >= ord('a')) & (codes <= ord('z'))
+    is_upper = (codes >= ord('A')) & (codes <= ord('Z'))
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    lowercase = is_lower.any(axis=1)
+    uppercase = is_upper.any(axis=1)
+    numbers = is_digit.any(axis=1)
+    special_chars = (valid & ~(is_lower | is_upper | is_digit)).any(axis=1)
+    del codes, is_lower, is_upper, is_digit, valid
+
+    variety = (lowercase.astype(np.uint8) + uppercase + numbers + special_chars).astype(np.uint8)
+    charset_size = 26 * lowercase + 26 * uppercase + 10 * numbers + 32 * special_chars
+
+    # Per-item pattern detail from the scalar path; this loop is the dominant cost
+    covered_chars = np.zeros(count, dtype=np.int64)
+    unspanned_patterns = np.zeros(count, dtype=np.int64)
+    pattern_count = np.zeros(count, dtype=np.int64)
+    has_dictionary_word = np.zeros(count, dtype=bool)
+    is_common = np.zeros(count, dtype=bool)
+    for index, password in enumerate(passwords):
+        if not password:
+            continue
+        scan = PatternScan(password)
+        covered_chars[index] = scan.covered_chars
+        unspanned_patterns[index] = scan.unspanned_patterns
+        pattern_count[index] = scan.pattern_count
+        has_dictionary_word[index] = scan.has_dictionary_word
+        is_common[index] = not truncated[index] and analyzer._is_common_lowered(scan.lowered)
+
+    # Entropy, with the same span and spanless penalties as the scalar path
+    with np.errstate(divide='ignore'):
+        bits_per_char = np.where(charset_size > 0, np.log2(np.maximum(charset_size, 1)), 0.0)
+    entropy = lengths * bits_per_char
+    span_penalty = covered_chars * np.maximum(0, bits_per_char - MATCHED_CHAR_BITS)
+    entropy = np.maximum(0, entropy - (span_penalty + unspanned_patterns * UNSPANNED_PATTERN_PENALTY))
+    entropy[charset_size == 0] = 0
+
+    # Score buckets, mirroring PasswordAnalyzer._calculate_score
+    score = np.select([lengths >= 12, lengths >= 8, lengths >= 6, lengths >= 4], [25, 15, 10, 5], 0)
+    score = score + variety * 5
+    score += np.select([entropy >= 60, entropy >= 40, entropy >= 20, entropy >= 10], [30, 20, 10, 5], 0)
+    score -= np.minimum(pattern_count * 3, 15)
+    score -= 20 * is_common
+    score += 10 * ((lengths >= 16) & (variety >= 3))
+    score += 15 * (entropy >= 80)
+    score = np.clip(score, 0, 100).astype(np.uint8)
+
+    # Issue count, mirroring PasswordAnalyzer._identify_issues
+    issues_count = ((lengths < 8).astype(np.uint8) + (variety < 3) + ~uppercase + ~numbers + ~special_chars
+                    + (entropy < 30) + (pattern_count > 2) + is_common + has_dictionary_word
+                    + truncated).astype(np.uint8)
+    issues_count[lengths == 0] = 1  # 'Password is empty'
+
+    strength = np.select([score >= 80, score >= 60], [STRONG, MEDIUM], WEAK).astype(np.uint8)
+
+    return {
+        'length': lengths if input_lengths is None else input_lengths,
+        'score': score,
+        'strength': strength,
+        'entropy': entropy,
+        'lowercase': lowercase,
+        'uppercase': uppercase,
+        'numbers': numbers,
+        'special_chars': special_chars,
+        'character_variety': variety,
+        'is_common': is_common,
+        'pattern_count': pattern_count.astype(np.uint8),
+        'issues_count': issues_count
+    }
@@ -0,0 +1,211 @@
+"""
+Prebuilt, versioned wordlist artifact for the common-password index
+Compiles a ranked wordlist into an open-addressed hash table plus a string blob, checksummed,
+so processes map the file instead of rebuilding the list on every start
+Usage: python wordlist_artifact.py build [WORDLIST ...] -o OUTPUT [--list-version N]
+       python wordlist_artifact.py verify ARTIFACT
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from breach_index import iter_wordlist, normalize_password
+
+MAGIC = b'PWWORDS1'
+FORMAT_VERSION = 1
+# magic, format version, reserved, list version, entry count, slot count, distinct lengths, blob size, SHA-256 of body
+HEADER = struct.Struct('<8sHHIQQQQ32s')
+# Hash of the encoded word, blob offset + 1 (0 marks an empty slot), rank
+SLOT = struct.Struct('<III')
+LENGTH = struct.Struct('<I')
+WORD_SIZE = struct.Struct('<H')
+# Slots are at least twice the entry count, keeping probe sequences short
+LOAD_FACTOR = 0.5
+
+
+def _encode(word: str) -> bytes:
+    try:
+        return word.encode('utf-8', 'surrogateescape')
+    except UnicodeEncodeError:
+        return word.encode('utf-8', 'surrogatepass')
+
+
+def _decode(data: bytes) -> str:
+    return data.decode('utf-8', 'surrogateescape')
+
+
+class WordlistArtifact:
+    """Read-only ranked wordlist mapped from disk; get() returns a word's rank in O(len)"""
+
+    def __init__(self, path: str, verify: bool = False):
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a wordlist artifact (file too short)")
+        (magic, version, _, list_version, count, slot_count, length_count, blob_size,
+         checksum) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a wordlist artifact (bad magic)")
+        if version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} has unsupported artifact version {version}")
+        self._slots_offset = HEADER.size + length_count * LENGTH.size
+        self._blob_offset = self._slots_offset + slot_count * SLOT.size
+        if len(self._mmap) != self._blob_offset + blob_size or slot_count & (slot_count - 1):
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self.list_version = list_version
+        self.count = count
+        self.checksum = checksum
+        self._slot_mask = slot_count - 1
+        self.word_lengths = frozenset(length for (length,) in
+                                      LENGTH.iter_unpack(self._mmap[HEADER.size:self._slots_offset]))
+        if verify:
+            self.verify()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield words in rank order"""
+        position = self._blob_offset
+        end = len(self._mmap)
+        while position < end:
+            (size,) = WORD_SIZE.unpack_from(self._mmap, position)
+            position += WORD_SIZE.size
+            yield _decode(self._mmap[position:position + size])
+            position += size
+
+    def get(self, word: str, default: Optional[int] = None) -> Optional[int]:
+        """Rank of a normalized word (1 is most common), probing the hash table in place"""
+        encoded = _encode(word)
+        word_hash = zlib.crc32(encoded)
+        mask = self._slot_mask
+        slot = word_hash & mask
+        mmap_view = self._mmap
+        while True:
+            stored_hash, offset, rank = SLOT.unpack_from(mmap_view, self._slots_offset + slot * SLOT.size)
+            if not offset:
+                return default
+            if stored_hash == word_hash:
+                position = self._blob_offset + offset - 1
+                (size,) = WORD_SIZE.unpack_from(mmap_view, position)
+                position += WORD_SIZE.size
+                if size == len(encoded) and mmap_view[position:position + size] == encoded:
+                    return rank
+            slot = (slot + 1) & mask
+
+    def verify(self):
+        """Check the body against the header checksum; raises ValueError on mismatch"""
+        if hashlib.sha256(self._mmap[HEADER.size:]).digest() != self.checksum:
+            raise ValueError(f"{self.path} failed its checksum")
+
+    def describe(self) -> str:
+        return f"{self.count} words, list version {self.list_version}"
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def build_artifact(words: Iterable[str], path: str, list_version: int = 1) -> int:
+    """Compile words (most common first) into an artifact file; returns the entry count"""
+    ranks = {}
+    for word in words:
+        normalized = normalize_password(word)
+        if normalized and len(_encode(normalized)) <= 0xFFFF:
+            ranks.setdefault(normalized, len(ranks) + 1)
+
+    slot_count = 1
+    while slot_count * LOAD_FACTOR < max(len(ranks), 1):
+        slot_count <<= 1
+
+    # Words are laid out in rank order so iteration needs no sort
+    slots = [None] * slot_count
+    blob = bytearray()
+    for word, rank in ranks.items():
+        encoded = _encode(word)
+        word_hash = zlib.crc32(encoded)
+        slot = word_hash & (slot_count - 1)
+        while slots[slot] is not None:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = (word_hash, len(blob) + 1, rank)
+        blob += WORD_SIZE.pack(len(encoded)) + encoded
+    if len(blob) >= 1 << 32:
+        raise ValueError("wordlist is too large for a single artifact")
+
+    lengths = sorted({len(word) for word in ranks})
+    body = bytearray()
+    for length in lengths:
+        body += LENGTH.pack(length)
+    empty = SLOT.pack(0, 0, 0)
+    for entry in slots:
+        body += SLOT.pack(*entry) if entry is not None else empty
+    body += blob
+
+    partial_path = path + '.partial'
+    with open(partial_path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, list_version, len(ranks), slot_count, len(lengths),
+                                 len(blob), hashlib.sha256(body).digest()))
+        output.write(body)
+    os.replace(partial_path, path)
+    return len(ranks)
+
+
+def _builtin_words() -> Iterator[str]:
+    from common_passwords import RANKED_PASSWORDS
+    return iter(RANKED_PASSWORDS)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or check a prebuilt common-password wordlist artifact")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="compile wordlists into an artifact")
+    build.add_argument('wordlists', nargs='*',
+                       help="newline-delimited lists, most common first (default: the built-in list)")
+    build.add_argument('-o', '--output', required=True, help="output artifact path")
+    build.add_argument('--list-version', type=int, default=1,
+                       help="version number recorded in the header (default: %(default)s)")
+    verify = commands.add_parser('verify', help="check an artifact's header and checksum")
+    verify.add_argument('artifact')
+    args = parser.parse_args(argv)
+
+    if args.command == 'verify':
+        try:
+            with WordlistArtifact(args.artifact, verify=True) as artifact:
+                print(f"{args.artifact}: OK ({artifact.describe()})", file=sys.stderr)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 1
+        return 0
+
+    if args.wordlists:
+        words = (word for path in args.wordlists for word in iter_wordlist(path))
+    else:
+        words = _builtin_words()
+    count = build_artifact(words, args.output, args.list_version)
+    print(f"Wrote {count} words to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())